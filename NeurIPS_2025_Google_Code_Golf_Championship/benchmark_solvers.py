@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Benchmark the generated ARC solvers and track regressions between runs.
+
+For every `generated_solver/taskNNN.py` the harness calls `solve(task)` on the
+task's train, test and arc-gen examples and records:
+  - wall time (best of `--repeat` calls),
+  - peak Python memory during one extra call (tracemalloc),
+  - pass/fail against the expected outputs, per split,
+  - the solver's source size in bytes (the competition score).
+
+Each run is appended as one line to `<history>/history.jsonl` and as rows to
+`<history>/history.csv`. Compare mode reports tasks that got slower or stopped
+passing between two runs.
+
+With `--cold-start` the run also records the harness start-up cost, measured
+in fresh interpreters (best of `--repeat`): importing `run_and_visualize`,
+and a complete `run_and_visualize.py --only-score` on the first solver, plus
+whether the import pulled in matplotlib. Compare mode flags start-up
+regressions as well.
+
+Usage examples (from repo root):
+  # Benchmark all solvers and append a run to the history
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/benchmark_solvers.py --dir NeurIPS_2025_Google_Code_Golf_Championship/generated_solver
+
+  # Also record the harness cold-start time
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/benchmark_solvers.py --cold-start
+
+  # Compare the last two recorded runs
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/benchmark_solvers.py --compare
+
+  # Compare two specific runs, flagging tasks more than 50% slower
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/benchmark_solvers.py --compare 20251017T101500 20251017T120000 --slowdown 1.5
+"""
+from __future__ import annotations
+import argparse
+import csv
+import json
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from run_and_visualize import load_solver_module
+from scorer import score_solution
+from task_loader import load_task
+
+CSV_FIELDS = ['run_id', 'task', 'bytes', 'wall_ms', 'peak_kib', 'passed', 'train', 'test', 'arc-gen', 'error']
+
+
+def benchmark_solver(solver_path: Path, repeat: int = 3) -> dict:
+    """Benchmark one solver and return a flat result record."""
+    record = {
+        'task': solver_path.stem,
+        'bytes': solver_path.stat().st_size,
+        'wall_ms': None,
+        'peak_kib': None,
+        'passed': False,
+        'train': None,
+        'test': None,
+        'arc-gen': None,
+        'error': None,
+    }
+    task = load_task(solver_path.stem)
+    if task is None:
+        record['error'] = 'task JSON not found'
+        return record
+    module = load_solver_module(solver_path)
+    solve = getattr(module, 'solve', None)
+    if not callable(solve):
+        record['error'] = 'no solve() function'
+        return record
+
+    try:
+        best = float('inf')
+        solution = None
+        for _ in range(max(1, repeat)):
+            start = time.perf_counter()
+            solution = solve(task)
+            best = min(best, time.perf_counter() - start)
+        tracemalloc.start()
+        try:
+            solve(task)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    except Exception as e:
+        record['error'] = f'{type(e).__name__}: {e}'
+        return record
+
+    record['wall_ms'] = round(best * 1000, 3)
+    record['peak_kib'] = round(peak / 1024, 1)
+    score = score_solution(solution, solver_path.stem)
+    for split, s in score['splits'].items():
+        record[split] = s['correct'] == s['total']
+    record['passed'] = score['passed']
+    return record
+
+
+def _benchmark_worker(args: tuple) -> dict:
+    return benchmark_solver(*args)
+
+
+def run_benchmark(solvers: List[Path], repeat: int = 3, jobs: int = 1) -> List[dict]:
+    """Benchmark all solvers (optionally across processes), sorted by task name."""
+    work = [(s, repeat) for s in solvers]
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            records = list(pool.map(_benchmark_worker, work))
+    else:
+        records = [_benchmark_worker(w) for w in work]
+    return sorted(records, key=lambda r: r['task'])
+
+
+def _best_of(cmd: List[str], repeat: int) -> float:
+    """Best wall time in ms of running `cmd` in a fresh interpreter."""
+    best = float('inf')
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        best = min(best, time.perf_counter() - start)
+    return round(best * 1000, 1)
+
+
+def measure_cold_start(solver: Optional[Path], repeat: int = 3) -> dict:
+    """Start-up cost of the harness in new processes (interpreter start included)."""
+    here = Path(__file__).resolve().parent
+    probe = f"import sys; sys.path.insert(0, {str(here)!r}); import run_and_visualize; print('matplotlib' in sys.modules)"
+    loaded = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True, check=True).stdout.strip()
+    result = {
+        'python_ms': _best_of([sys.executable, '-c', 'pass'], repeat),
+        'import_ms': _best_of([sys.executable, '-c', probe], repeat),
+        'only_score_ms': None,
+        'imports_matplotlib': loaded == 'True',
+    }
+    if solver is not None:
+        result['only_score_ms'] = _best_of([sys.executable, str(here / 'run_and_visualize.py'), str(solver), '--only-score'], repeat)
+    return result
+
+
+def print_cold_start(cold: dict) -> None:
+    score = f"{cold['only_score_ms']:.1f} ms" if cold['only_score_ms'] is not None else '-'
+    print(f"Cold start: python {cold['python_ms']:.1f} ms, import run_and_visualize {cold['import_ms']:.1f} ms, "
+          f"--only-score one solver {score}; matplotlib imported: {'yes' if cold['imports_matplotlib'] else 'no'}")
+
+
+def append_history(history_dir: Path, run_id: str, records: List[dict], cold_start: Optional[dict] = None) -> None:
+    """Append a run to `history.jsonl` and its rows to `history.csv`."""
+    history_dir.mkdir(parents=True, exist_ok=True)
+    entry = {'run_id': run_id, 'timestamp': datetime.utcnow().isoformat() + 'Z', 'results': records}
+    if cold_start is not None:
+        entry['cold_start'] = cold_start
+    with (history_dir / 'history.jsonl').open('a', encoding='utf-8') as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+    csv_path = history_dir / 'history.csv'
+    new_file = not csv_path.exists()
+    with csv_path.open('a', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        if new_file:
+            writer.writeheader()
+        for rec in records:
+            writer.writerow({'run_id': run_id, **rec})
+
+
+def load_history(history_dir: Path) -> List[dict]:
+    """Return all recorded runs, oldest first."""
+    path = history_dir / 'history.jsonl'
+    if not path.exists():
+        return []
+    runs = []
+    for line in path.read_text(encoding='utf-8').splitlines():
+        if line.strip():
+            runs.append(json.loads(line))
+    return runs
+
+
+def compare_runs(old: dict, new: dict, slowdown: float = 1.25, min_ms: float = 1.0) -> List[str]:
+    """Return human-readable regressions between two runs.
+
+    A task is flagged when it passed in `old` but not in `new`, or when its wall
+    time grew by more than `slowdown`x (ignoring tasks faster than `min_ms`).
+    """
+    before = {r['task']: r for r in old['results']}
+    issues = []
+    for rec in new['results']:
+        prev = before.get(rec['task'])
+        if prev is None:
+            continue
+        if prev['passed'] and not rec['passed']:
+            issues.append(f"{rec['task']}: stopped passing ({rec['error'] or 'wrong output'})")
+        t0, t1 = prev['wall_ms'], rec['wall_ms']
+        if t0 is not None and t1 is not None and max(t0, t1) >= min_ms and t1 > t0 * slowdown:
+            issues.append(f"{rec['task']}: slower {t0:.2f} ms -> {t1:.2f} ms ({t1 / max(t0, 1e-9):.2f}x)")
+        if rec['bytes'] > prev['bytes'] and prev['passed']:
+            issues.append(f"{rec['task']}: grew {prev['bytes']} -> {rec['bytes']} bytes")
+    cold0, cold1 = old.get('cold_start') or {}, new.get('cold_start') or {}
+    for key in ('import_ms', 'only_score_ms'):
+        t0, t1 = cold0.get(key), cold1.get(key)
+        if t0 is not None and t1 is not None and t1 > t0 * slowdown:
+            issues.append(f"cold start {key[:-3]}: slower {t0:.1f} ms -> {t1:.1f} ms ({t1 / max(t0, 1e-9):.2f}x)")
+    return issues
+
+
+def print_report(records: List[dict]) -> None:
+    for rec in records:
+        wall = f"{rec['wall_ms']:.2f}" if rec['wall_ms'] is not None else '-'
+        peak = f"{rec['peak_kib']:.1f}" if rec['peak_kib'] is not None else '-'
+        status = 'PASS' if rec['passed'] else 'FAIL'
+        line = f"{rec['task']:<10} {status}  {rec['bytes']:6d} B  {wall:>9} ms  {peak:>9} KiB"
+        if rec['error']:
+            line += f"  ({rec['error']})"
+        print(line)
+    passed = [r for r in records if r['passed']]
+    print(f"{len(passed)}/{len(records)} tasks pass; "
+          f"total bytes of passing solvers {sum(r['bytes'] for r in passed)}")
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description='Benchmark ARC solvers and track regressions')
+    p.add_argument('--dir', default=str(Path(__file__).parent / 'generated_solver'), help='Directory with solver scripts')
+    p.add_argument('--pattern', default='task*.py', help='Glob pattern for solvers in --dir')
+    p.add_argument('--max', type=int, default=None, help='Limit number of solvers to benchmark')
+    p.add_argument('--repeat', type=int, default=3, help='Timed calls per solver (best is kept)')
+    p.add_argument('--jobs', type=int, default=1, help='Worker processes')
+    p.add_argument('--history', default='output/benchmarks', help='Directory holding history.jsonl/history.csv')
+    p.add_argument('--no-record', action='store_true', help="Print results without appending them to the history")
+    p.add_argument('--compare', nargs='*', metavar='RUN_ID', help='Compare two runs (default: the last two) and exit')
+    p.add_argument('--slowdown', type=float, default=1.25, help='Slowdown ratio flagged by --compare')
+    p.add_argument('--cold-start', action='store_true', help='Also measure harness start-up time in fresh interpreters')
+    args = p.parse_args(argv)
+
+    history_dir = Path(args.history)
+    if args.compare is not None:
+        runs = load_history(history_dir)
+        if args.compare:
+            by_id = {r['run_id']: r for r in runs}
+            missing = [rid for rid in args.compare if rid not in by_id]
+            if len(args.compare) != 2 or missing:
+                print(f'Need two known run ids; missing: {missing}' if missing else 'Need exactly two run ids')
+                return 2
+            old, new = by_id[args.compare[0]], by_id[args.compare[1]]
+        else:
+            if len(runs) < 2:
+                print(f'Need at least two runs in {history_dir} to compare')
+                return 2
+            old, new = runs[-2], runs[-1]
+        issues = compare_runs(old, new, slowdown=args.slowdown)
+        print(f"Comparing {old['run_id']} -> {new['run_id']}: {len(issues)} regression(s)")
+        for issue in issues:
+            print(f'  {issue}')
+        return 1 if issues else 0
+
+    solvers = sorted(Path(args.dir).glob(args.pattern))
+    if args.max:
+        solvers = solvers[:args.max]
+    if not solvers:
+        print('No solver scripts found to benchmark')
+        return 2
+    records = run_benchmark(solvers, repeat=args.repeat, jobs=args.jobs)
+    print_report(records)
+    cold = measure_cold_start(solvers[0], repeat=args.repeat) if args.cold_start else None
+    if cold is not None:
+        print_cold_start(cold)
+    if not args.no_record:
+        run_id = datetime.utcnow().strftime('%Y%m%dT%H%M%S')
+        append_history(history_dir, run_id, records, cold_start=cold)
+        print(f'Recorded run {run_id} in {history_dir}')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Differential fuzzing of a golfed solver against its readable reference.
+
+The fixed examples of a task only cover a few dozen inputs; a golfed rewrite
+can pass all of them and still differ elsewhere. This module generates many
+more inputs from the task's own train inputs and checks that the reference
+`solve_grid` and the candidate (`solve_grid`, golfed `p(g)` or `solve()`,
+see `scorer.grid_function`) agree on every one:
+
+  1. `InputModel.from_task` fits the input distribution: height/width range
+     (and whether grids are square), background colour, foreground palette
+     with its colour frequencies, and the range of foreground densities.
+  2. `InputModel.sample` draws grids in vectorized batches: all grids of one
+     shape come from a single `rng.choice` / `rng.random` call. By default
+     half of them are fresh random grids and half are train inputs with a
+     random fraction of their cells recoloured.
+  3. Batches go to a process pool as `grid_codec` blobs; each worker runs the
+     reference and the candidate on every grid (with a per-call time limit).
+     Inputs on which the reference itself fails are out of the task's domain
+     and are skipped, not reported.
+  4. The first divergent input is shrunk greedily (halves, rows, columns,
+     colours, then single cells set to background) while the two solvers
+     still disagree, so the reported counterexample is small.
+
+Usage examples (from repo root):
+  # Fuzz every golfed submission against its generated solver
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/fuzz.py --golf-dir output/submission --jobs 8
+
+  # One pair, more inputs, keeping the counterexample as JSON
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/fuzz.py NeurIPS_2025_Google_Code_Golf_Championship/generated_solver/task042.py output/submission/task042.py --count 20000 --save output/fuzz
+"""
+from __future__ import annotations
+import argparse
+import json
+import signal
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from grid_codec import decode, encode
+from run_and_visualize import SolverTimeout, load_solver_module
+from scorer import as_grid, grid_function
+from task_loader import load_task_arrays
+
+DEFAULT_COUNT = 2000
+DEFAULT_BATCH = 250
+
+SAME, INVALID, DIVERGED = 'same', 'invalid', 'diverged'
+
+
+class InputModel:
+    """Input distribution of a task, fitted to its train inputs."""
+
+    __slots__ = ('heights', 'widths', 'square', 'background', 'palette', 'weights', 'density', 'examples')
+
+    def __init__(self, inputs: Sequence[np.ndarray]):
+        if not inputs:
+            raise ValueError('need at least one input grid')
+        self.examples = [np.asarray(g, dtype=np.uint8) for g in inputs]
+        shapes = np.array([g.shape for g in self.examples])
+        self.heights = (int(shapes[:, 0].min()), int(shapes[:, 0].max()))
+        self.widths = (int(shapes[:, 1].min()), int(shapes[:, 1].max()))
+        self.square = bool((shapes[:, 0] == shapes[:, 1]).all())
+        counts = sum(np.bincount(g.ravel(), minlength=256) for g in self.examples)
+        self.background = int(np.argmax(counts))
+        counts[self.background] = 0
+        self.palette = np.flatnonzero(counts).astype(np.uint8)
+        self.weights = counts[self.palette] / counts.sum() if self.palette.size else np.zeros(0)
+        dens = [np.count_nonzero(g != self.background) / g.size for g in self.examples if g.size]
+        self.density = (min(dens), max(dens)) if dens else (0.0, 0.0)
+
+    @classmethod
+    def from_task(cls, task: str) -> Optional['InputModel']:
+        try:
+            arrays = load_task_arrays(task)
+        except ValueError:  # malformed JSON; the task is skipped like one without inputs
+            return None
+        inputs = [inp for inp, _ in (arrays or {}).get('train', [])]
+        return cls(inputs) if inputs else None
+
+    def __repr__(self) -> str:
+        return (f'InputModel(h={self.heights}, w={self.widths}, square={self.square}, bg={self.background}, '
+                f'palette={self.palette.tolist()}, density={self.density[0]:.2f}-{self.density[1]:.2f})')
+
+    def _random(self, rng: np.random.Generator, n: int) -> List[np.ndarray]:
+        hs = rng.integers(self.heights[0], self.heights[1] + 1, n)
+        ws = hs.copy() if self.square else rng.integers(self.widths[0], self.widths[1] + 1, n)
+        dens = rng.uniform(self.density[0], self.density[1], n)
+        grids: List[Optional[np.ndarray]] = [None] * n
+        for h, w in set(zip(hs.tolist(), ws.tolist())):
+            idx = np.flatnonzero((hs == h) & (ws == w))
+            if self.palette.size:
+                fg = rng.choice(self.palette, size=(idx.size, h, w), p=self.weights)
+                on = rng.random((idx.size, h, w)) < dens[idx, None, None]
+                batch = np.where(on, fg, np.uint8(self.background)).astype(np.uint8)
+            else:
+                batch = np.full((idx.size, h, w), self.background, dtype=np.uint8)
+            for k, i in enumerate(idx):
+                grids[i] = batch[k]
+        return grids
+
+    def _mutated(self, rng: np.random.Generator, n: int) -> List[np.ndarray]:
+        colors = np.append(self.palette, np.uint8(self.background))
+        weights = np.append(self.weights * 0.5, 0.5) if self.palette.size else np.ones(1)
+        grids = []
+        for base, rate in zip(rng.integers(len(self.examples), size=n), rng.uniform(0.01, 0.2, n)):
+            g = self.examples[base].copy()
+            hit = rng.random(g.shape) < rate
+            g[hit] = rng.choice(colors, size=int(hit.sum()), p=weights)
+            grids.append(g)
+        return grids
+
+    def sample(self, rng: np.random.Generator, n: int, mutate: float = 0.5) -> List[np.ndarray]:
+        """`n` uint8 grids, a fraction `mutate` of them recoloured train inputs."""
+        k = int(round(n * mutate))
+        return self._random(rng, n - k) + self._mutated(rng, k)
+
+
+# --- comparing the two solvers ---------------------------------------------------
+
+def _raise_timeout(signum, frame):
+    raise SolverTimeout()
+
+
+def _call(fn: Callable, grid: np.ndarray, timeout: Optional[float]) -> Tuple[Optional[np.ndarray], Optional[str]]:
+    """Run one solver on a private int64 copy of `grid`; returns (output grid, error)."""
+    use_alarm = timeout is not None and hasattr(signal, 'SIGALRM')
+    if use_alarm:
+        previous = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        out = as_grid(fn(grid.astype(np.int64)))  # solvers expect what np.array(list) gives
+    except SolverTimeout:
+        return None, f'timed out after {timeout:g} s'
+    except Exception as e:
+        return None, f'{type(e).__name__}: {e}'
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+    return out, None if out is not None else 'returned no grid'
+
+
+def compare(reference: Callable, candidate: Callable, grid: np.ndarray, timeout: Optional[float] = 2.0) -> Tuple[str, Optional[str]]:
+    """(`same` | `invalid` | `diverged`, detail) for one input grid."""
+    want, ref_error = _call(reference, grid, timeout)
+    if want is None:
+        return INVALID, f'reference {ref_error}'
+    got, error = _call(candidate, grid, timeout)
+    if got is None:
+        return DIVERGED, f'candidate {error}'
+    if got.shape != want.shape:
+        return DIVERGED, f'output shape {got.shape[0]}x{got.shape[1]}, expected {want.shape[0]}x{want.shape[1]}'
+    wrong = int(np.count_nonzero(got != want))
+    return (SAME, None) if wrong == 0 else (DIVERGED, f'{wrong}/{want.size} cells differ')
+
+
+def _functions(reference: str, candidate: str) -> Tuple[Callable, Callable]:
+    fns = []
+    for path in (reference, candidate):
+        module = load_solver_module(Path(path))
+        fn = grid_function(module) if module is not None else None
+        if fn is None:
+            raise ValueError(f'{path} has no solve_grid(), p() or solve()')
+        fns.append(fn)
+    return fns[0], fns[1]
+
+
+def _fuzz_worker(args: tuple) -> dict:
+    """Compare both solvers on one batch; stops at the batch's first divergence."""
+    reference, candidate, offset, blobs, timeout = args
+    result = {'checked': 0, 'invalid': 0, 'index': None, 'detail': None}
+    ref_fn, cand_fn = _functions(reference, candidate)
+    for i, blob in enumerate(blobs):
+        status, detail = compare(ref_fn, cand_fn, decode(blob), timeout)
+        result['checked'] += 1
+        if status == INVALID:
+            result['invalid'] += 1
+        elif status == DIVERGED:
+            result.update(index=offset + i, detail=detail)
+            break
+    return result
+
+
+# --- shrinking -------------------------------------------------------------------
+
+def _reductions(g: np.ndarray, background: int) -> Iterator[np.ndarray]:
+    """Smaller or simpler variants of `g`, most aggressive first."""
+    h, w = g.shape
+    if h > 1:
+        yield g[:h // 2]
+        yield g[h // 2:]
+    if w > 1:
+        yield g[:, :w // 2]
+        yield g[:, w // 2:]
+    for r in range(h if h > 1 else 0):
+        yield np.delete(g, r, axis=0)
+    for c in range(w if w > 1 else 0):
+        yield np.delete(g, c, axis=1)
+    for color in np.unique(g):
+        if color != background:
+            yield np.where(g == color, np.uint8(background), g)
+    for r, c in zip(*np.nonzero(g != background)):
+        s = g.copy()
+        s[r, c] = background
+        yield s
+
+
+def shrink(reference: Callable, candidate: Callable, grid: np.ndarray, background: int = 0,
+           timeout: Optional[float] = 2.0, budget: int = 5000) -> Tuple[np.ndarray, int]:
+    """Greedily reduce a divergent input while the solvers still disagree.
+
+    Returns the smallest divergent grid found and the number of solver pairs
+    tried (at most `budget`).
+    """
+    best, tried, improved = grid, 0, True
+    while improved and tried < budget:
+        improved = False
+        for smaller in _reductions(best, background):
+            tried += 1
+            if compare(reference, candidate, smaller, timeout)[0] == DIVERGED:
+                best, improved = smaller, True
+                break
+            if tried >= budget:
+                break
+    return best, tried
+
+
+def fuzz_pair(reference: Path, candidate: Path, count: int = DEFAULT_COUNT, batch: int = DEFAULT_BATCH,
+              seed: int = 0, mutate: float = 0.5, timeout: Optional[float] = 2.0,
+              pool: Optional[ProcessPoolExecutor] = None) -> dict:
+    """Fuzz one candidate against its reference; returns a report dict.
+
+    `counterexample` is set on divergence and holds the shrunk input with
+    both outputs (nested lists) and the original, unshrunk input.
+    """
+    task = reference.stem
+    record = {'task': task, 'checked': 0, 'invalid': 0, 'diverged': False, 'detail': None,
+              'counterexample': None, 'error': None, 'seconds': 0.0}
+    start = time.perf_counter()
+    model = InputModel.from_task(task)
+    if model is None:
+        record['error'] = 'task has no loadable train inputs'
+        return record
+    rng = np.random.default_rng([seed, zlib.crc32(task.encode('utf-8'))])
+    grids = model.sample(rng, count, mutate=mutate)
+    work = [(str(reference), str(candidate), i, [encode(g) for g in grids[i:i + batch]], timeout)
+            for i in range(0, len(grids), batch)]
+    futures = [pool.submit(_fuzz_worker, w) for w in work] if pool is not None else None
+    try:
+        results = (f.result() for f in futures) if futures is not None else map(_fuzz_worker, work)
+        for res in results:
+            record['checked'] += res['checked']
+            record['invalid'] += res['invalid']
+            if res['index'] is not None:
+                record.update(diverged=True, detail=res['detail'])
+                found = grids[res['index']]
+                break
+    except ValueError as e:
+        record['error'] = str(e)
+        return record
+    finally:
+        for f in futures or ():
+            f.cancel()
+
+    if record['diverged']:
+        ref_fn, cand_fn = _functions(str(reference), str(candidate))
+        small, _ = shrink(ref_fn, cand_fn, found, model.background, timeout)
+        want, _ = _call(ref_fn, small, timeout)
+        got, error = _call(cand_fn, small, timeout)
+        record['detail'] = compare(ref_fn, cand_fn, small, timeout)[1]
+        record['counterexample'] = {
+            'input': small.tolist(),
+            'expected': want.tolist() if want is not None else None,
+            'got': got.tolist() if got is not None else error,
+            'original_input': found.tolist(),
+        }
+    record['seconds'] = round(time.perf_counter() - start, 3)
+    return record
+
+
+def _print_grid(grid: list) -> None:
+    for row in grid:
+        print('    ' + ''.join(str(v) for v in row))
+
+
+def print_record(rec: dict) -> None:
+    if rec['error']:
+        print(f"{rec['task']:<10} SKIP      ({rec['error']})")
+        return
+    verdict = 'DIVERGED' if rec['diverged'] else 'OK'
+    print(f"{rec['task']:<10} {verdict:<9} {rec['checked']} checked ({rec['invalid']} outside the reference's domain)  {rec['seconds']:.2f} s")
+    ce = rec['counterexample']
+    if ce is None:
+        return
+    before, after = np.shape(ce['original_input']), np.shape(ce['input'])
+    print(f"  {rec['detail']}; input shrunk {before[0]}x{before[1]} -> {after[0]}x{after[1]}:")
+    _print_grid(ce['input'])
+    for label in ('expected', 'got'):
+        if isinstance(ce[label], list):
+            print(f'  {label}:')
+            _print_grid(ce[label])
+        else:
+            print(f'  {label}: {ce[label]}')
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description='Fuzz golfed solvers against their readable reference')
+    p.add_argument('reference', nargs='?', help='Reference solver (default: every solver in --dir with a candidate in --golf-dir)')
+    p.add_argument('candidate', nargs='?', help='Candidate solver for REFERENCE (default: same name in --golf-dir)')
+    p.add_argument('--dir', default=str(Path(__file__).parent / 'generated_solver'), help='Directory with reference solvers')
+    p.add_argument('--golf-dir', default='output/submission', help='Directory with golfed candidates (see golf.py)')
+    p.add_argument('--pattern', default='task*.py', help='Glob pattern for solvers in --dir')
+    p.add_argument('--max', type=int, default=None, help='Limit number of solver pairs')
+    p.add_argument('--count', type=int, default=DEFAULT_COUNT, help='Random inputs per task')
+    p.add_argument('--batch', type=int, default=DEFAULT_BATCH, help='Inputs per worker job')
+    p.add_argument('--mutate', type=float, default=0.5, help='Fraction of inputs that are recoloured train inputs')
+    p.add_argument('--seed', type=int, default=0, help='Random seed (combined with the task name)')
+    p.add_argument('--timeout', type=float, default=2.0, help='Per-call time limit in seconds')
+    p.add_argument('--jobs', type=int, default=1, help='Worker processes')
+    p.add_argument('--save', default=None, metavar='DIR', help='Write each counterexample to DIR/<task>.json')
+    args = p.parse_args(argv)
+
+    if args.reference:
+        ref = Path(args.reference)
+        pairs = [(ref, Path(args.candidate) if args.candidate else Path(args.golf_dir) / ref.name)]
+    else:
+        pairs = [(s, Path(args.golf_dir) / s.name) for s in sorted(Path(args.dir).glob(args.pattern))]
+    pairs = [(r, c) for r, c in pairs if c.exists()]
+    if args.max:
+        pairs = pairs[:args.max]
+    if not pairs:
+        print(f'No reference/candidate pairs found (candidates are looked up in {args.golf_dir})')
+        return 2
+
+    pool = ProcessPoolExecutor(max_workers=args.jobs) if args.jobs > 1 else None
+    diverged = 0
+    try:
+        for ref, cand in pairs:
+            rec = fuzz_pair(ref, cand, count=args.count, batch=args.batch, seed=args.seed,
+                            mutate=args.mutate, timeout=args.timeout, pool=pool)
+            print_record(rec)
+            diverged += rec['diverged']
+            if rec['counterexample'] is not None and args.save:
+                out = Path(args.save) / f"{rec['task']}.json"
+                out.parent.mkdir(parents=True, exist_ok=True)
+                out.write_text(json.dumps({'detail': rec['detail'], **rec['counterexample']}), encoding='utf-8')
+                print(f'  saved to {out}')
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    print(f'{len(pairs) - diverged}/{len(pairs)} candidates agree with their reference')
+    return 1 if diverged else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -4,14 +4,33 @@ Generate one minimal solver Python file per JSON task in the repository `data/`
 
 Each generated file will be named exactly like the JSON but with a `.py` extension
 (`taskNNN.py`) and will implement a tiny heuristic solver mirroring the logic in
-`task001.py`. Files already present are skipped.
-
-Run from the repository root (the script uses relative paths).
+`task001.py`.
+
+Regeneration is incremental and safe: `generated_solver/.manifest.json` records,
+for every file this script wrote, the hash of the template and of the written
+source. On each run a file is
+  - created when missing,
+  - regenerated when it is still byte-identical to what the generator wrote
+    (or to a known older template) but the template has changed since,
+  - left alone when it was edited by hand, written by `synthesize.py`, or is
+    already up to date.
+Tasks are processed on a thread pool and the manifest is written once at the end.
+
+Usage (from any directory):
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/generate_all_solvers.py [--data-dir data] [--dry-run]
 """
 from __future__ import annotations
+import argparse
+import hashlib
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable
+from typing import Dict, Iterable, Optional, Tuple
+
+from task_loader import find_data_dir
+
+MANIFEST_NAME = '.manifest.json'
 
 
 TEMPLATE = '''#!/usr/bin/env python3
@@ -30,6 +49,7 @@ TASK_NAME = "{json_name}"
 def find_task_file() -> Optional[Path]:
     script_dir = Path(__file__).parent
     candidates = [
+        script_dir.parent.parent / "data" / TASK_NAME,
         script_dir.parent / "data" / TASK_NAME,
         Path.cwd() / "data" / TASK_NAME,
         script_dir / TASK_NAME,
@@ -49,7 +69,7 @@ def solve(obj: Any) -> Any:
             return sum(obj)
         if all(isinstance(x, str) for x in obj):
             return " ".join(obj)
-    return obj
+        return obj
     if isinstance(obj, (int, float)):
         return obj
     if isinstance(obj, str):
@@ -58,7 +78,7 @@ def solve(obj: Any) -> Any:
         for k in ("input", "inputs", "data", "text", "prompt", "question"):
             if k in obj:
                 return solve(obj[k])
-    return json.dumps(obj, ensure_ascii=False)
+        return json.dumps(obj, ensure_ascii=False)
     return str(obj)
 
 
@@ -90,41 +110,132 @@ if __name__ == "__main__":
 '''
 
 
+def sha256(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+TEMPLATE_HASH = sha256(TEMPLATE)
+
+# Normalised hashes (task name replaced by `{json_name}`) of the sources written
+# by earlier template revisions, so placeholders generated before the manifest
+# existed can still be recognised as untouched.
+LEGACY_TEMPLATE_HASHES = {
+    '372644fd5cae89b00bac9d20c5793f750b664398fc8f3ee45981e3b399214aac',
+    '7285182c1152cc9afdd4e4b71646b3af6745ac8668b608d8f85e21ae4fd1a71f',
+}
+
+
 def list_task_files(data_dir: Path) -> Iterable[Path]:
     for p in sorted(data_dir.glob('task*.json')):
         yield p
 
 
-def make_solver_for(json_path: Path, out_dir: Path) -> None:
+def render(json_name: str) -> str:
+    # Use simple replace to avoid accidental format-string braces in the template
+    return TEMPLATE.replace("{json_name}", json_name)
+
+
+def load_manifest(out_dir: Path) -> Dict[str, dict]:
+    path = out_dir / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding='utf-8'))
+    except json.JSONDecodeError as e:
+        print(f"Warning: ignoring malformed manifest {path}: {e}")
+        return {}
+
+
+def save_manifest(out_dir: Path, manifest: Dict[str, dict]) -> None:
+    path = out_dir / MANIFEST_NAME
+    tmp = path.with_suffix('.tmp')
+    tmp.write_text(json.dumps(dict(sorted(manifest.items())), indent=2) + '\n', encoding='utf-8')
+    os.replace(tmp, path)
+
+
+def is_untouched(content: str, json_name: str, entry: Optional[dict]) -> bool:
+    """True if `content` is exactly what some generator run wrote for this task."""
+    if entry is not None and sha256(content) == entry.get('source_hash'):
+        return True
+    return sha256(content.replace(json_name, "{json_name}")) in LEGACY_TEMPLATE_HASHES
+
+
+def make_solver_for(json_path: Path, out_dir: Path, entry: Optional[dict] = None, dry_run: bool = False) -> Tuple[str, Optional[dict]]:
+    """Create or refresh the solver for one task.
+
+    Returns `(action, manifest_entry)` where action is one of `created`,
+    `regenerated`, `up-to-date`, `hand-edited` or `synthesized` (written by
+    `synthesize.py`, which the template must never downgrade).
+    """
     json_name = json_path.name
     py_name = json_name.rsplit('.', 1)[0] + '.py'
     out_path = out_dir / py_name
+    content = render(json_name)
+    new_entry = {'template_hash': TEMPLATE_HASH, 'source_hash': sha256(content)}
     if out_path.exists():
-        print(f"Skipping existing {out_path}")
-        return
-    # Use simple replace to avoid accidental format-string braces in the template
-    content = TEMPLATE.replace("{json_name}", json_name)
+        if entry is not None and entry.get('origin') == 'synthesized':
+            return 'synthesized', entry
+        current = out_path.read_text(encoding='utf-8')
+        if not is_untouched(current, json_name, entry):
+            return 'hand-edited', entry
+        if current == content:
+            return 'up-to-date', new_entry
+        action = 'regenerated'
+    else:
+        action = 'created'
+    if dry_run:
+        return action, entry
     out_path.write_text(content, encoding='utf-8')
     # make the generated solver writable and readable
     try:
         os.chmod(out_path, 0o644)
     except Exception as e:
         print(f"Warning: chmod failed for {out_path}: {e}")
-
-
-def main() -> None:
-    # repository root is two levels up from this file: scripts/generated_solver -> scripts -> repo root
-    repo_root = Path(__file__).parents[2]
-    data_dir = repo_root / 'data'
-    out_dir = Path(__file__).parent
-    if not data_dir.exists():
-        print(f"data directory not found at {data_dir}")
+    return action, new_entry
+
+
+def generate(data_dir: Path, out_dir: Path, jobs: int = 8, dry_run: bool = False, verbose: bool = False) -> Dict[str, int]:
+    """Run one incremental generation pass and return counts per action."""
+    manifest = load_manifest(out_dir)
+    tasks = list(list_task_files(data_dir))
+
+    def work(j: Path) -> Tuple[str, str, Optional[dict]]:
+        key = j.stem + '.py'
+        action, entry = make_solver_for(j, out_dir, manifest.get(key), dry_run=dry_run)
+        return key, action, entry
+
+    counts: Dict[str, int] = {}
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        for key, action, entry in pool.map(work, tasks):
+            counts[action] = counts.get(action, 0) + 1
+            if entry is not None:
+                manifest[key] = entry
+            if verbose or action == 'hand-edited':
+                print(f"{action:<12} {key}")
+    if not dry_run:
+        save_manifest(out_dir, manifest)
+    return counts
+
+
+def main(argv=None) -> None:
+    p = argparse.ArgumentParser(description='Generate or refresh placeholder solvers for every task JSON')
+    p.add_argument('--data-dir', default=None, help='Directory with taskNNN.json files (default: auto-detect)')
+    p.add_argument('--out-dir', default=str(Path(__file__).parent / 'generated_solver'), help='Directory for the solver files')
+    p.add_argument('--jobs', type=int, default=8, help='Worker threads')
+    p.add_argument('--dry-run', action='store_true', help='Report what would change without writing anything')
+    p.add_argument('--verbose', action='store_true', help='Print the action taken for every task')
+    args = p.parse_args(argv)
+
+    data_dir = Path(args.data_dir) if args.data_dir else find_data_dir()
+    out_dir = Path(args.out_dir)
+    if data_dir is None or not data_dir.exists():
+        print(f"data directory not found at {data_dir or 'any of the usual locations'}")
         return
-    created = 0
-    for j in list_task_files(data_dir):
-        make_solver_for(j, out_dir)
-        created += 1
-    print(f"Processed {created} task files; solvers created under {out_dir}")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    counts = generate(data_dir, out_dir, jobs=args.jobs, dry_run=args.dry_run, verbose=args.verbose)
+    summary = ', '.join(f"{k}={counts[k]}" for k in sorted(counts)) or 'nothing to do'
+    prefix = 'Would process' if args.dry_run else 'Processed'
+    print(f"{prefix} {sum(counts.values())} task files ({summary}); solvers under {out_dir}")
 
 
 if __name__ == '__main__':
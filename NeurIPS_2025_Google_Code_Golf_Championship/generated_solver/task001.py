@@ -14,7 +14,7 @@ from __future__ import annotations
 import json
 import sys
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence
 
 import numpy as np
 
@@ -36,6 +36,21 @@ def find_task_file() -> Optional[Path]:
     return None
 
 
+def solve_grid(input_grid: np.ndarray) -> np.ndarray:
+    """Applies the task's logic to a single grid.
+
+    Block (r, c) of the output is a copy of the input where the input is
+    non-zero at (r, c), and zeros elsewhere: one broadcast over (r, i, c, j).
+    """
+    h, w = input_grid.shape
+    return ((input_grid[:, None, :, None] != 0) * input_grid[None, :, None, :]).reshape(h * h, w * w)
+
+
+def solve_batch(inputs: Sequence[Any]) -> List[np.ndarray]:
+    """Solves many input grids; the outputs stay NumPy arrays."""
+    return [solve_grid(np.asarray(grid)) for grid in inputs]
+
+
 def solve(task_obj: Any) -> Any:
     """
     Solves the task by applying the fractal tiling logic.
@@ -47,20 +62,11 @@ def solve(task_obj: Any) -> Any:
     solution_obj = {}
     for key in ['train', 'test', 'arc-gen']:
         if key in task_obj:
-            solved_examples = []
-            for example in task_obj[key]:
-                input_grid = np.array(example['input'])
-                h, w = input_grid.shape
-                output_grid = np.zeros((h * 3, w * 3), dtype=int)
-
-                for r in range(h):
-                    for c in range(w):
-                        if input_grid[r, c] != 0:
-                            output_grid[r*h:(r+1)*h, c*w:(c+1)*w] = input_grid
-                
-                solved_examples.append({'input': example['input'], 'output': output_grid.tolist()})
-            solution_obj[key] = solved_examples
-            
+            examples = task_obj[key]
+            outputs = solve_batch([np.array(example['input']) for example in examples])
+            # Lists only here, for the JSON printed by main().
+            solution_obj[key] = [{'input': example['input'], 'output': output.tolist()}
+                                 for example, output in zip(examples, outputs)]
     return solution_obj
 
 
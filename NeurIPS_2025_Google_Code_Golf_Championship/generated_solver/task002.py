@@ -11,7 +11,7 @@ from __future__ import annotations
 import json
 import sys
 from pathlib import Path
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -69,6 +69,11 @@ def solve_grid(input_grid: np.ndarray) -> np.ndarray:
     return output_grid
 
 
+def solve_batch(inputs: Sequence[Any]) -> List[np.ndarray]:
+    """Solves many input grids; the outputs stay NumPy arrays."""
+    return [solve_grid(np.asarray(grid)) for grid in inputs]
+
+
 def solve(task_obj: Any) -> Any:
     """Solves all examples in a task file."""
     if not isinstance(task_obj, dict) or ('train' not in task_obj and 'test' not in task_obj):
@@ -77,12 +82,11 @@ def solve(task_obj: Any) -> Any:
     solution_obj = {}
     for key in ['train', 'test', 'arc-gen']:
         if key in task_obj:
-            solved_examples = []
-            for example in task_obj[key]:
-                input_grid = np.array(example['input'])
-                output_grid = solve_grid(input_grid)
-                solved_examples.append({'input': example['input'], 'output': output_grid.tolist()})
-            solution_obj[key] = solved_examples
+            examples = task_obj[key]
+            outputs = solve_batch([np.array(example['input']) for example in examples])
+            # Lists only here, for the JSON printed by main().
+            solution_obj[key] = [{'input': example['input'], 'output': output.tolist()}
+                                 for example, output in zip(examples, outputs)]
     return solution_obj
 
 
@@ -14,6 +14,7 @@ TASK_NAME = "task004.json"
 def find_task_file() -> Optional[Path]:
     script_dir = Path(__file__).parent
     candidates = [
+        script_dir.parent.parent / "data" / TASK_NAME,
         script_dir.parent / "data" / TASK_NAME,
         Path.cwd() / "data" / TASK_NAME,
         script_dir / TASK_NAME,
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Code-golf stage: turn a readable solver into the shortest valid `p(g)` submission.
+
+For each `generated_solver/taskNNN.py` that defines `solve_grid`, the stage
+  1. extracts `solve_grid` and the module-level helpers it calls (AST),
+  2. builds several rewrites: stripped of docstrings and annotations, with
+     short local names, and with `solve_grid` folded into `p` itself,
+  3. re-tokenizes each rewrite with minimal whitespace and one-space indents,
+  4. runs every rewrite on all train/test/arc-gen examples and keeps the
+     shortest one that still reproduces every expected output.
+
+Results are cached by solver source hash in `<out-dir>/.golf_cache`, so only
+edited solvers are re-minified. Tasks are processed across worker processes.
+
+Usage examples (from repo root):
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/golf.py --jobs 8 --out-dir output/submission
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/golf.py NeurIPS_2025_Google_Code_Golf_Championship/generated_solver/task001.py
+"""
+from __future__ import annotations
+import argparse
+import ast
+import builtins
+import hashlib
+import io
+import itertools
+import json
+import keyword
+import string
+import tokenize
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set
+
+import numpy as np
+
+from task_loader import SPLITS, load_task
+
+CACHE_DIR_NAME = '.golf_cache'
+# Bump when the minifier changes so cached results are recomputed.
+GOLF_VERSION = 1
+
+
+# --- extraction ---------------------------------------------------------------
+
+def extract_program(source: str) -> Optional[ast.Module]:
+    """Return a module with the imports, `solve_grid` and the helpers it uses."""
+    tree = ast.parse(source)
+    funcs = {n.name: n for n in tree.body if isinstance(n, ast.FunctionDef)}
+    if 'solve_grid' not in funcs:
+        return None
+    needed: List[str] = []
+    todo = ['solve_grid']
+    while todo:
+        name = todo.pop()
+        if name in needed:
+            continue
+        needed.append(name)
+        for node in ast.walk(funcs[name]):
+            if isinstance(node, ast.Name) and node.id in funcs and node.id not in needed:
+                todo.append(node.id)
+    imports = [n for n in tree.body if isinstance(n, (ast.Import, ast.ImportFrom))
+               and not (isinstance(n, ast.ImportFrom) and n.module in ('__future__', 'typing', 'pathlib'))
+               and not (isinstance(n, ast.Import) and all(a.name in ('json', 'sys') for a in n.names))]
+    body = imports + [n for n in tree.body if isinstance(n, ast.FunctionDef) and n.name in needed]
+    return ast.Module(body=body, type_ignores=[])
+
+
+class _Strip(ast.NodeTransformer):
+    """Drop docstrings, annotations and `pass`-only noise."""
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        self.generic_visit(node)
+        node.returns = None
+        for a in node.args.args + node.args.kwonlyargs:
+            a.annotation = None
+        if node.body and isinstance(node.body[0], ast.Expr) and isinstance(getattr(node.body[0], 'value', None), ast.Constant) \
+                and isinstance(node.body[0].value.value, str):
+            node.body = node.body[1:] or [ast.Pass()]
+        return node
+
+    def visit_AnnAssign(self, node: ast.AnnAssign):
+        if node.value is None:
+            return None
+        return ast.copy_location(ast.Assign(targets=[node.target], value=node.value), node)
+
+
+def _short_names(taken: Set[str]) -> Iterator[str]:
+    letters = string.ascii_letters
+    for n in itertools.count(1):
+        for combo in itertools.product(letters, repeat=n):
+            name = ''.join(combo)
+            if name not in taken and not keyword.iskeyword(name):
+                yield name
+
+
+class _Rename(ast.NodeTransformer):
+    def __init__(self, mapping: Dict[str, str]):
+        self.mapping = mapping
+
+    def visit_Name(self, node: ast.Name):
+        node.id = self.mapping.get(node.id, node.id)
+        return node
+
+    def visit_arg(self, node: ast.arg):
+        node.arg = self.mapping.get(node.arg, node.arg)
+        return node
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        node.name = self.mapping.get(node.name, node.name)
+        self.generic_visit(node)
+        return node
+
+
+def rename_locals(tree: ast.Module, keep: Set[str]) -> ast.Module:
+    """Rename functions, arguments and assigned names to the shortest free names.
+
+    Names are ranked by how often they occur so the most frequent ones get
+    single letters. Imported names, builtins and `keep` are left untouched.
+    """
+    imported = set()
+    for n in tree.body:
+        if isinstance(n, (ast.Import, ast.ImportFrom)):
+            imported |= {(a.asname or a.name).split('.')[0] for a in n.names}
+    defined: Dict[str, int] = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef):
+            defined.setdefault(node.name, 0)
+            for a in node.args.args:
+                defined.setdefault(a.arg, 0)
+        elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+            defined.setdefault(node.id, 0)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and node.id in defined:
+            defined[node.id] += 1
+    fixed = keep | imported | set(dir(builtins))
+    candidates = sorted((n for n in defined if n not in fixed), key=lambda n: -defined[n])
+    # every existing name stays reserved so a new name never collides with one
+    # that is kept as-is
+    gen = _short_names(fixed | set(defined))
+    mapping = {}
+    new = next(gen)
+    for name in candidates:
+        if len(new) < len(name):
+            mapping[name] = new
+            new = next(gen)
+    return _Rename(mapping).visit(tree)
+
+
+def fold_into_p(tree: ast.Module) -> Optional[ast.Module]:
+    """Turn `solve_grid(grid)` into `p(g)` that converts lists in and out itself."""
+    funcs = {n.name: n for n in tree.body if isinstance(n, ast.FunctionDef)}
+    sg = funcs['solve_grid']
+    if len(sg.args.args) != 1:
+        return None
+    param = sg.args.args[0].arg
+    for node in ast.walk(sg):
+        if isinstance(node, ast.Name) and node.id == 'solve_grid':
+            return None  # recursive; keep the wrapper form
+    sg.name = 'p'
+    convert = ast.parse(f'{param} = np.array({param})').body[0]
+    for node in ast.walk(sg):
+        if isinstance(node, ast.Return) and node.value is not None:
+            node.value = ast.Call(func=ast.Attribute(value=node.value, attr='tolist', ctx=ast.Load()), args=[], keywords=[])
+    sg.body.insert(0, convert)
+    return tree
+
+
+def add_wrapper(tree: ast.Module) -> ast.Module:
+    tree.body += ast.parse('def p(g):\n    return solve_grid(np.array(g)).tolist()').body
+    return tree
+
+
+# --- whitespace ---------------------------------------------------------------
+
+def compact_source(source: str) -> str:
+    """Re-emit tokens with one-space indents and only the spaces Python needs."""
+    out: List[str] = []
+    depth = 0
+    line: List[str] = []
+    prev = None
+    tokens = tokenize.generate_tokens(io.StringIO(source).readline)
+    for tok in tokens:
+        if tok.type == tokenize.INDENT:
+            depth += 1
+            continue
+        if tok.type == tokenize.DEDENT:
+            depth -= 1
+            continue
+        if tok.type in (tokenize.NEWLINE, tokenize.NL):
+            if line:
+                out.append(' ' * depth + ''.join(line))
+            line, prev = [], None
+            continue
+        if tok.type in (tokenize.COMMENT, tokenize.ENDMARKER):
+            continue
+        text = tok.string
+        if prev is not None:
+            a, b = prev.string[-1], text[0]
+            word = lambda c: c.isalnum() or c == '_'
+            if (word(a) and word(b)) or (prev.type == tokenize.NUMBER and b.isalpha()) or (a == '.' and b.isdigit() and prev.type == tokenize.NUMBER):
+                line.append(' ')
+        line.append(text)
+        prev = tok
+    if line:
+        out.append(' ' * depth + ''.join(line))
+    return '\n'.join(out)
+
+
+# --- verification -------------------------------------------------------------
+
+def verify(source: str, task: dict) -> bool:
+    """True if `p` from `source` reproduces every expected output of the task."""
+    namespace: dict = {}
+    try:
+        exec(compile(source, '<golf>', 'exec'), namespace)
+        p = namespace['p']
+        for split in SPLITS:
+            for ex in task.get(split, []):
+                got = p([row[:] for row in ex['input']])
+                if isinstance(got, np.ndarray):
+                    got = got.tolist()
+                if got != ex['output']:
+                    return False
+    except Exception:
+        return False
+    return True
+
+
+def candidates(source: str) -> Dict[str, str]:
+    """All rewrites of a solver, keyed by a short description."""
+    variants: Dict[str, str] = {}
+    if extract_program(source) is None:
+        return variants
+
+    def fresh() -> ast.Module:
+        return _Strip().visit(extract_program(source))
+
+    variants['wrapped'] = compact_source(ast.unparse(ast.fix_missing_locations(add_wrapper(fresh()))))
+    variants['wrapped+renamed'] = compact_source(ast.unparse(ast.fix_missing_locations(
+        rename_locals(add_wrapper(fresh()), keep={'p'}))))
+    folded = fold_into_p(fresh())
+    if folded is not None:
+        variants['folded'] = compact_source(ast.unparse(ast.fix_missing_locations(folded)))
+        variants['folded+renamed'] = compact_source(ast.unparse(ast.fix_missing_locations(
+            rename_locals(fold_into_p(fresh()), keep={'p'}))))
+    return variants
+
+
+def golf_solver(solver_path: Path, cache_dir: Optional[Path] = None) -> dict:
+    """Minify one solver; returns `{task, bytes, source, variant, error}`."""
+    source = solver_path.read_text(encoding='utf-8')
+    digest = hashlib.sha256(f'{GOLF_VERSION}\0{source}'.encode('utf-8')).hexdigest()
+    cache_file = cache_dir / f'{solver_path.stem}-{digest[:16]}.json' if cache_dir else None
+    if cache_file is not None and cache_file.exists():
+        return json.loads(cache_file.read_text(encoding='utf-8'))
+
+    record = {'task': solver_path.stem, 'original_bytes': len(source.encode('utf-8')), 'bytes': None,
+              'source': None, 'variant': None, 'error': None}
+    try:
+        variants = candidates(source)
+    except SyntaxError as e:
+        variants, record['error'] = {}, f'syntax error: {e}'
+    if not variants:
+        record['error'] = record['error'] or 'no solve_grid()'
+        return record
+    task = load_task(solver_path.stem)
+    if task is None:
+        record['error'] = 'task JSON not found'
+        return record  # not cached: the data may appear later
+    valid = sorted((len(src.encode('utf-8')), name, src) for name, src in variants.items() if verify(src, task))
+    if not valid:
+        record['error'] = 'no rewrite reproduces the expected outputs'
+    if valid:
+        record['bytes'], record['variant'], record['source'] = valid[0]
+    if cache_file is not None:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(record), encoding='utf-8')
+    return record
+
+
+def _golf_worker(args: tuple) -> dict:
+    return golf_solver(*args)
+
+
+def golf_all(solvers: List[Path], out_dir: Path, jobs: int = 1) -> List[dict]:
+    """Minify many solvers (in parallel when `jobs > 1`) and write `taskNNN.py` submissions."""
+    cache_dir = out_dir / CACHE_DIR_NAME
+    work = [(s, cache_dir) for s in solvers]
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            records = list(pool.map(_golf_worker, work, chunksize=4))
+    else:
+        records = [_golf_worker(w) for w in work]
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for rec in records:
+        if rec['source']:
+            (out_dir / f"{rec['task']}.py").write_text(rec['source'], encoding='utf-8')
+    return sorted(records, key=lambda r: r['task'])
+
+
+def main(argv=None) -> None:
+    p = argparse.ArgumentParser(description='Minify solvers into verified p(g) code-golf submissions')
+    p.add_argument('solver', nargs='?', help='A single solver file (default: every solver in --dir)')
+    p.add_argument('--dir', default=str(Path(__file__).parent / 'generated_solver'), help='Directory with solver scripts')
+    p.add_argument('--pattern', default='task*.py', help='Glob pattern for solvers in --dir')
+    p.add_argument('--out-dir', default='output/submission', help='Directory for the minified submissions')
+    p.add_argument('--jobs', type=int, default=1, help='Worker processes')
+    p.add_argument('--show', action='store_true', help='Print each minified submission')
+    args = p.parse_args(argv)
+
+    solvers = [Path(args.solver)] if args.solver else sorted(Path(args.dir).glob(args.pattern))
+    if not solvers:
+        print('No solver scripts found')
+        return
+    records = golf_all(solvers, Path(args.out_dir), jobs=args.jobs)
+    for rec in records:
+        if rec['source'] is None:
+            if args.solver or rec['error'] != 'no solve_grid()':
+                print(f"{rec['task']}: skipped ({rec['error']})")
+            continue
+        print(f"{rec['task']}: {rec['original_bytes']} -> {rec['bytes']} bytes ({rec['variant']})")
+        if args.show:
+            print(rec['source'])
+    done = [r for r in records if r['source']]
+    print(f"Golfed {len(done)}/{len(records)} solvers; total {sum(r['bytes'] for r in done)} bytes")
+
+
+if __name__ == '__main__':
+    main()
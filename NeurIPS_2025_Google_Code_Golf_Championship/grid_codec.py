@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Compact binary and text encoding of ARC grids.
+
+A nested JSON list spends two or three characters per cell on a value that
+fits in four bits. `encode` instead writes a 6-byte header followed by the
+cells in the smallest of three bodies:
+
+  header   mode (uint8), dtype code (uint8), height (uint16 LE), width (uint16 LE)
+  PACKED   colours 0-15, two cells per byte (high nibble first),
+  RLE      colours 0-15, one byte per run: colour << 4 | (length - 1),
+           runs longer than 16 cells are split,
+  RAW      any colour 0-255, one byte per cell.
+
+RLE is chosen whenever it is shorter than PACKED, which is typical for ARC
+outputs (large single-colour backgrounds). Both directions are whole-array
+NumPy operations (run boundaries via `np.diff`, decoding via `np.repeat`),
+and the original integer dtype is restored on decode.
+
+`encode_text` / `decode_text` wrap the bytes in base64 for JSON. A 30x30
+grid is ~2.7 KB as nested lists, at most 608 characters packed, and usually
+far less with RLE.
+
+Usage examples (from a script):
+  blob = encode(grid)                      # bytes for files and pipes
+  grid = decode(blob)
+  s = encode_text(grid)                    # JSON-safe str, e.g. in results.jsonl
+  grid = decode_text(s)
+
+  # Size comparison over a task's outputs (from repo root)
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/grid_codec.py task042
+"""
+from __future__ import annotations
+import argparse
+import base64
+import json
+import struct
+
+import numpy as np
+
+PACKED, RLE, RAW = 1, 2, 3
+_HEADER = struct.Struct('<BBHH')
+_DTYPES = [np.dtype(t) for t in ('u1', 'i1', 'u2', 'i2', 'u4', 'i4', 'u8', 'i8', '?')]
+_DTYPE_CODES = {dt: i for i, dt in enumerate(_DTYPES)}
+
+
+def _runs(flat: np.ndarray):
+    """(colour, length) of every maximal run of equal cells."""
+    starts = np.flatnonzero(np.concatenate([[True], flat[1:] != flat[:-1]]))
+    return flat[starts], np.diff(np.append(starts, flat.size))
+
+
+def _rle_body(flat: np.ndarray) -> bytes:
+    colors, lengths = _runs(flat)
+    chunks = (lengths + 15) // 16
+    out_len = np.full(int(chunks.sum()), 16, dtype=np.int64)
+    out_len[np.cumsum(chunks) - 1] = lengths - 16 * (chunks - 1)
+    return ((np.repeat(colors, chunks) << 4) | (out_len - 1)).astype(np.uint8).tobytes()
+
+
+def _packed_body(flat: np.ndarray) -> bytes:
+    if flat.size % 2:
+        flat = np.append(flat, np.uint8(0))
+    return ((flat[0::2] << 4) | flat[1::2]).astype(np.uint8).tobytes()
+
+
+def encode(grid) -> bytes:
+    """Encode a 2D integer grid with values 0-255; raises ValueError otherwise."""
+    a = np.asarray(grid)
+    if a.ndim != 2 or a.dtype.kind not in 'iub' or max(a.shape) > 0xFFFF:
+        raise ValueError(f'not an encodable grid: {a.dtype} array of shape {a.shape}')
+    if a.size and (a.min() < 0 or a.max() > 255):
+        raise ValueError('grid values must be in 0-255')
+    code = _DTYPE_CODES.get(a.dtype.newbyteorder('='), 0)
+    flat = a.ravel().astype(np.uint8)
+    if flat.size and flat.max() > 15:
+        mode, body = RAW, flat.tobytes()
+    else:
+        mode, body = PACKED, _packed_body(flat)
+        if flat.size:
+            rle = _rle_body(flat)
+            if len(rle) < len(body):
+                mode, body = RLE, rle
+    return _HEADER.pack(mode, code, a.shape[0], a.shape[1]) + body
+
+
+def decode(blob: bytes) -> np.ndarray:
+    """Inverse of `encode`; raises ValueError for truncated or corrupt input."""
+    if len(blob) < _HEADER.size:
+        raise ValueError('grid encoding is shorter than its header')
+    mode, code, h, w = _HEADER.unpack_from(blob)
+    body = np.frombuffer(blob, dtype=np.uint8, offset=_HEADER.size)
+    n = h * w
+    if mode == PACKED:
+        flat = np.empty(body.size * 2, dtype=np.uint8)
+        flat[0::2] = body >> 4
+        flat[1::2] = body & 15
+        flat = flat[:n] if flat.size in (n, n + 1) else None
+    elif mode == RLE:
+        flat = np.repeat(body >> 4, (body & 15).astype(np.int64) + 1)
+    elif mode == RAW:
+        flat = body
+    else:
+        raise ValueError(f'unknown grid encoding mode {mode}')
+    if flat is None or flat.size != n or code >= len(_DTYPES):
+        raise ValueError('corrupt grid encoding')
+    return flat.reshape(h, w).astype(_DTYPES[code])
+
+
+def encode_text(grid) -> str:
+    """`encode` as a base64 string, safe to embed in JSON."""
+    return base64.b64encode(encode(grid)).decode('ascii')
+
+
+def decode_text(text: str) -> np.ndarray:
+    try:
+        blob = base64.b64decode(text, validate=True)
+    except ValueError as e:
+        raise ValueError(f'invalid base64 grid: {e}') from None
+    return decode(blob)
+
+
+def main(argv=None) -> None:
+    from task_loader import load_task_arrays
+
+    p = argparse.ArgumentParser(description='Compare grid encodings on the outputs of a task')
+    p.add_argument('task', help='Task name or JSON path')
+    args = p.parse_args(argv)
+
+    arrays = load_task_arrays(args.task)
+    if arrays is None:
+        raise SystemExit(f'Task {args.task} not found')
+    grids = [out for pairs in arrays.values() for _, out in pairs]
+    as_json = sum(len(json.dumps(g.tolist(), separators=(',', ':'))) for g in grids)
+    as_bytes = sum(len(encode(g)) for g in grids)
+    as_text = sum(len(encode_text(g)) for g in grids)
+    assert all(np.array_equal(decode_text(encode_text(g)), g) for g in grids)
+    print(f'{len(grids)} output grids: JSON lists {as_json} B, encoded {as_bytes} B '
+          f'({as_bytes / as_json:.1%}), base64 {as_text} B ({as_text / as_json:.1%})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Vectorized ARC grid primitives built on NumPy.
+
+These replace the per-cell Python loops found in the hand-written solvers
+(e.g. the nested `for r/for c` tiling in `task001`, the list-queue BFS in
+`task002` and the repeated `np.array_equal` motif search in `task003`).
+Every function takes a 2D integer array (lists are accepted too) and never
+mutates its input.
+
+Run `python grid_ops_bench.py` for microbenchmarks against the loop versions.
+"""
+from __future__ import annotations
+import hashlib
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+import numpy as np
+
+# (dr, dc) neighbour offsets for 4- and 8-connectivity.
+NEIGHBOURS = {
+    4: ((-1, 0), (1, 0), (0, -1), (0, 1)),
+    8: ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)),
+}
+
+
+def _shift(a: np.ndarray, dr: int, dc: int, fill) -> np.ndarray:
+    """Return `b` with `b[r, c] = a[r - dr, c - dc]`, using `fill` outside the grid."""
+    h, w = a.shape
+    out = np.full_like(a, fill)
+    out[max(dr, 0):h + min(dr, 0), max(dc, 0):w + min(dc, 0)] = \
+        a[max(-dr, 0):h + min(-dr, 0), max(-dc, 0):w + min(-dc, 0)]
+    return out
+
+
+# --- tiling -----------------------------------------------------------------
+
+def kron_tile(grid, mask: Optional[np.ndarray] = None) -> np.ndarray:
+    """Place a copy of `grid` in every block whose `mask` cell is set.
+
+    With the default mask (`grid != 0`) this is the fractal tiling of task001:
+    a 3x3 input becomes a 9x9 output with the input copied into the blocks
+    matching its non-zero cells.
+    """
+    g = np.asarray(grid)
+    m = g != 0 if mask is None else np.asarray(mask, dtype=bool)
+    (mh, mw), (h, w) = m.shape, g.shape
+    # broadcast to (mh, h, mw, w) blocks; cheaper than np.kron on tiny grids
+    return (m[:, None, :, None] * g[None, :, None, :]).reshape(mh * h, mw * w).astype(g.dtype)
+
+
+def tile(grid, reps: Tuple[int, int]) -> np.ndarray:
+    """Repeat `grid` `reps[0]` times vertically and `reps[1]` times horizontally."""
+    return np.tile(np.asarray(grid), reps)
+
+
+# --- connectivity -------------------------------------------------------------
+
+def label_components(grid, connectivity: int = 4, background: Optional[int] = None) -> Tuple[np.ndarray, int]:
+    """Label connected same-colour regions.
+
+    Returns `(labels, count)` where `labels` has the grid's shape, background
+    cells (if `background` is given) are 0 and regions are numbered 1..count
+    in row-major order of their first cell. Labels are propagated with
+    whole-array minimum passes plus pointer jumping instead of a BFS.
+    """
+    g = np.asarray(grid)
+    h, w = g.shape
+    size = h * w
+    fg = np.ones(g.shape, dtype=bool) if background is None else g != background
+    labels = np.where(fg, np.arange(size).reshape(h, w), size)
+    # the fill value is irrelevant: the shifted `fg` mask already excludes
+    # cells outside the grid, and 0 is valid for every dtype (uint8 included)
+    same = [(dr, dc, fg & (_shift(g, dr, dc, 0) == g) & _shift(fg, dr, dc, False))
+            for dr, dc in NEIGHBOURS[connectivity]]
+    flat_ext = np.empty(size + 1, dtype=labels.dtype)
+    while True:
+        new = labels.copy()
+        for dr, dc, ok in same:
+            np.minimum(new, np.where(ok, _shift(labels, dr, dc, size), size), out=new)
+        # pointer jumping: every label is the flat index of a cell in the same
+        # component, so adopting that cell's label shortcuts long chains
+        flat_ext[:size] = new.ravel()
+        flat_ext[size] = size
+        new = flat_ext[new]
+        if np.array_equal(new, labels):
+            break
+        labels = new
+    out = np.zeros(g.shape, dtype=np.int32)
+    uniq, inverse = np.unique(labels[fg], return_inverse=True)
+    out[fg] = inverse.ravel() + 1
+    return out, len(uniq)
+
+
+def dilate(mask: np.ndarray, connectivity: int = 4) -> np.ndarray:
+    """Binary dilation of a boolean mask by one step."""
+    out = mask.copy()
+    out[1:] |= mask[:-1]
+    out[:-1] |= mask[1:]
+    out[:, 1:] |= mask[:, :-1]
+    out[:, :-1] |= mask[:, 1:]
+    if connectivity == 8:
+        out[1:, 1:] |= mask[:-1, :-1]
+        out[1:, :-1] |= mask[:-1, 1:]
+        out[:-1, 1:] |= mask[1:, :-1]
+        out[:-1, :-1] |= mask[1:, 1:]
+    return out
+
+
+def border_reachable(grid, color: int = 0, connectivity: int = 4) -> np.ndarray:
+    """Mask of `color` cells connected to the grid border through `color` cells."""
+    g = np.asarray(grid)
+    passable = g == color
+    reach = np.zeros(g.shape, dtype=bool)
+    reach[[0, -1], :] = passable[[0, -1], :]
+    reach[:, [0, -1]] = passable[:, [0, -1]]
+    while True:
+        grown = dilate(reach, connectivity) & passable
+        if np.array_equal(grown, reach):
+            return reach
+        reach = grown
+
+
+def fill_enclosed(grid, color: int = 0, fill: int = 4, connectivity: int = 4) -> np.ndarray:
+    """Recolour `color` cells that cannot reach the border (task002's flood fill)."""
+    g = np.asarray(grid)
+    out = g.copy()
+    out[(g == color) & ~border_reachable(g, color, connectivity)] = fill
+    return out
+
+
+# --- periodicity --------------------------------------------------------------
+
+def find_period(grid, axis: int = 0, divisor: bool = True) -> int:
+    """Smallest period `p <= n // 2` of the grid along `axis`, or `n` if none.
+
+    With `divisor=True` only periods that divide the length are considered
+    and every block must repeat exactly (task003's first pass). Otherwise
+    `grid[i] == grid[i + p]` must hold wherever both rows exist.
+    """
+    g = np.moveaxis(np.asarray(grid), axis, 0)
+    n = g.shape[0]
+    for p in range(1, n // 2 + 1):
+        if divisor and n % p:
+            continue
+        if np.array_equal(g[p:], g[:-p]):
+            return p
+    return n
+
+
+def leading_repeat(grid, axis: int = 0) -> int:
+    """Smallest `p` whose first block is immediately repeated, or `n` if none."""
+    g = np.moveaxis(np.asarray(grid), axis, 0)
+    n = g.shape[0]
+    for p in range(1, n // 2 + 1):
+        if np.array_equal(g[:p], g[p:2 * p]):
+            return p
+    return n
+
+
+# --- colours ------------------------------------------------------------------
+
+def color_table(mapping: Mapping[int, int], size: int = 10) -> np.ndarray:
+    """Build a lookup table that maps colours per `mapping` and keeps the rest."""
+    table = np.arange(max(size, max(mapping, default=0) + 1))
+    for src, dst in mapping.items():
+        table[src] = dst
+    return table
+
+
+def remap(grid, mapping) -> np.ndarray:
+    """Recolour a grid with a dict or a lookup table in a single gather."""
+    g = np.asarray(grid)
+    table = mapping if isinstance(mapping, np.ndarray) else color_table(mapping, int(g.max()) + 1 if g.size else 10)
+    return table[g].astype(g.dtype)
+
+
+def histogram(grid, size: int = 10) -> np.ndarray:
+    """Count of each colour 0..size-1."""
+    return np.bincount(np.asarray(grid).ravel(), minlength=size)
+
+
+# --- cropping -----------------------------------------------------------------
+
+def bbox(mask: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+    """Return `(r0, c0, r1, c1)` (exclusive ends) of the set cells, or None."""
+    rows = np.flatnonzero(mask.any(axis=1))
+    if rows.size == 0:
+        return None
+    cols = np.flatnonzero(mask.any(axis=0))
+    return int(rows[0]), int(cols[0]), int(rows[-1]) + 1, int(cols[-1]) + 1
+
+
+def crop(grid, background: int = 0) -> np.ndarray:
+    """Crop to the bounding box of the non-background cells."""
+    g = np.asarray(grid)
+    box = bbox(g != background)
+    if box is None:
+        return g[:0, :0]
+    r0, c0, r1, c1 = box
+    return g[r0:r1, c0:c1]
+
+
+# --- symmetry -----------------------------------------------------------------
+
+D4: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    'identity': lambda g: g,
+    'rot90': lambda g: np.rot90(g, 1),
+    'rot180': lambda g: np.rot90(g, 2),
+    'rot270': lambda g: np.rot90(g, 3),
+    'flip_lr': np.fliplr,
+    'flip_ud': np.flipud,
+    'transpose': lambda g: g.T,
+    'anti_transpose': lambda g: np.rot90(g, 2).T,
+}
+
+
+def is_symmetric(grid, name: str) -> bool:
+    """True when the D4 transform `name` leaves the grid unchanged."""
+    g = np.asarray(grid)
+    return bool(np.array_equal(D4[name](g), g))
+
+
+def symmetries(grid) -> Dict[str, bool]:
+    """Which non-identity D4 transforms leave the grid unchanged."""
+    return {name: is_symmetric(grid, name) for name in D4 if name != 'identity'}
+
+
+# --- canonical forms ------------------------------------------------------------
+
+def _first_seen_table(values: np.ndarray, background: Optional[int]) -> np.ndarray:
+    """256-entry table renumbering colours by first appearance in `values`."""
+    vals, first = np.unique(values, return_index=True)
+    order = vals[np.argsort(first)]
+    table = np.zeros(256, dtype=np.uint8)
+    if background is not None:
+        order = order[order != background]
+        table[order] = np.arange(1, len(order) + 1)
+    else:
+        table[order] = np.arange(len(order))
+    return table
+
+
+def normalize_colors(grid, background: Optional[int] = 0) -> np.ndarray:
+    """Renumber colours in order of first appearance (row-major).
+
+    `background` (if given) always becomes 0 and the other colours 1, 2, ...;
+    with `background=None` every colour is renumbered from 0. Two grids that
+    differ only by a colour permutation normalise to the same array.
+    """
+    g = np.asarray(grid, dtype=np.uint8)
+    return _first_seen_table(g.ravel(), background)[g]
+
+
+def _form_key(*grids: np.ndarray) -> tuple:
+    return tuple(g.shape for g in grids) + (b''.join(g.tobytes() for g in grids),)
+
+
+def canonical_form(grid, colors: bool = True, background: Optional[int] = 0) -> Tuple[np.ndarray, str]:
+    """Smallest of the 8 D4 images of `grid` (after `normalize_colors` when
+    `colors` is set), ordered by shape then cells; returns `(form, d4_name)`.
+
+    Grids related by a rotation/flip (and a colour permutation) share a form.
+    """
+    g = np.asarray(grid, dtype=np.uint8)
+    best = None
+    for name, fn in D4.items():
+        t = np.ascontiguousarray(fn(g))
+        if colors:
+            t = normalize_colors(t, background)
+        key = _form_key(t)
+        if best is None or key < best[0]:
+            best = (key, t, name)
+    return best[1], best[2]
+
+
+def canonical_hash(grid, colors: bool = True, background: Optional[int] = 0) -> bytes:
+    """16-byte digest of `canonical_form`, for O(1) dedup of equivalent grids."""
+    form, _ = canonical_form(grid, colors, background)
+    return hashlib.blake2b(repr(form.shape).encode() + form.tobytes(), digest_size=16).digest()
+
+
+def canonical_pair_hash(inp, out, colors: bool = True, background: Optional[int] = 0) -> bytes:
+    """Digest of an input/output pair up to one shared D4 transform and one
+    shared colour permutation, so equivalent examples (or tasks) collide."""
+    a0, b0 = np.asarray(inp, dtype=np.uint8), np.asarray(out, dtype=np.uint8)
+    best = None
+    for fn in D4.values():
+        a, b = np.ascontiguousarray(fn(a0)), np.ascontiguousarray(fn(b0))
+        if colors:
+            table = _first_seen_table(np.concatenate([a.ravel(), b.ravel()]), background)
+            a, b = table[a], table[b]
+        key = _form_key(a, b)
+        if best is None or key < best:
+            best = key
+    return hashlib.blake2b(repr(best[:-1]).encode() + best[-1], digest_size=16).digest()
+
+
+def color_invariant(grid) -> tuple:
+    """Shape (up to transposition) and sorted colour counts: equal for all grids
+    with the same canonical form, and far cheaper to compute as a prefilter."""
+    g = np.asarray(grid)
+    counts = np.bincount(g.ravel(), minlength=1)
+    return tuple(sorted(g.shape)), tuple(np.sort(counts[counts > 0]).tolist())
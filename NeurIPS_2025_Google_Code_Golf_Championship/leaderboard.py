@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Persistent per-task leaderboard of solver size, speed and correctness (SQLite).
+
+Every evaluation the runner performs with `--leaderboard` becomes one row in
+`evaluations`: task, timestamp, run id, solver sha256 and byte count, pass
+flag, correct/total examples, solver time, whether the file is still the
+untouched `generate_all_solvers.py` placeholder, and status/error. Each
+distinct solver source is stored once in `versions` (keyed by its sha256),
+so the best version of a task can be recovered even after the file has been
+edited again.
+
+Indexes on `(task, ts)`, `ts` and `sha256` keep the usual questions cheap however many
+runs have accumulated:
+  - `latest()`        the most recent evaluation of every task,
+  - `placeholders()`  tasks whose latest evaluation is still the placeholder,
+  - `best(task)`      the smallest passing version of a task (then fastest),
+  - `history(task)`   every evaluation of one task, newest first.
+The database runs in WAL mode, so it can be queried while a sweep writes.
+
+Usage examples (from repo root):
+  # Record a sweep, then show the per-task standings
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/run_and_visualize.py --dir NeurIPS_2025_Google_Code_Golf_Championship/generated_solver --jobs 8 --leaderboard
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/leaderboard.py
+
+  # Tasks still on the placeholder, and the best recorded version of task042
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/leaderboard.py --placeholders
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/leaderboard.py --best task042 --source > task042_best.py
+"""
+from __future__ import annotations
+import argparse
+import hashlib
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from generate_all_solvers import LEGACY_TEMPLATE_HASHES, render
+
+DEFAULT_DB = 'output/leaderboard.sqlite'
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS versions (
+    sha256      TEXT PRIMARY KEY,
+    task        TEXT NOT NULL,
+    bytes       INTEGER NOT NULL,
+    placeholder INTEGER NOT NULL,
+    first_seen  TEXT NOT NULL,
+    source      TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS evaluations (
+    id          INTEGER PRIMARY KEY,
+    task        TEXT NOT NULL,
+    ts          TEXT NOT NULL,
+    run         TEXT,
+    sha256      TEXT NOT NULL REFERENCES versions(sha256),
+    bytes       INTEGER NOT NULL,
+    placeholder INTEGER NOT NULL,
+    passed      INTEGER NOT NULL,
+    correct     INTEGER,
+    total       INTEGER,
+    ms          REAL,
+    status      TEXT NOT NULL,
+    error       TEXT
+);
+CREATE INDEX IF NOT EXISTS evaluations_task_ts ON evaluations (task, ts);
+CREATE INDEX IF NOT EXISTS evaluations_ts ON evaluations (ts);
+CREATE INDEX IF NOT EXISTS evaluations_sha256 ON evaluations (sha256);
+CREATE INDEX IF NOT EXISTS versions_task ON versions (task);
+'''
+
+_LATEST = '''
+SELECT e.* FROM evaluations e
+JOIN (SELECT task, MAX(ts) AS ts FROM evaluations GROUP BY task) last
+  ON e.task = last.task AND e.ts = last.ts
+GROUP BY e.task
+ORDER BY e.task
+'''
+
+
+def is_placeholder(source: str, task: str) -> bool:
+    """True if `source` is exactly what `generate_all_solvers.py` writes for `task`."""
+    json_name = f'{task}.json'
+    if source == render(json_name):
+        return True
+    normalised = source.replace(json_name, '{json_name}')
+    return hashlib.sha256(normalised.encode('utf-8')).hexdigest() in LEGACY_TEMPLATE_HASHES
+
+
+class Leaderboard:
+    """Append-only store of solver evaluations; use as a context manager or `close()`."""
+
+    def __init__(self, path: Path = Path(DEFAULT_DB)):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self) -> 'Leaderboard':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def record(self, solver_path: Path, passed: bool, correct: Optional[int] = None, total: Optional[int] = None,
+               ms: Optional[float] = None, status: str = 'ok', error: Optional[str] = None,
+               run: Optional[str] = None, task: Optional[str] = None) -> int:
+        """Store one evaluation of the solver file as it is on disk now; returns its row id."""
+        return self.record_many([dict(solver_path=solver_path, passed=passed, correct=correct, total=total,
+                                      ms=ms, status=status, error=error, run=run, task=task)])[0]
+
+    def record_many(self, evaluations: Iterable[dict]) -> List[int]:
+        """Store many evaluations (keyword dicts for `record`) in one transaction."""
+        ids = []
+        ts = datetime.utcnow().isoformat() + 'Z'
+        with self.conn:
+            for ev in evaluations:
+                path = Path(ev['solver_path'])
+                task = ev.get('task') or path.stem
+                source = path.read_text(encoding='utf-8')
+                digest = hashlib.sha256(source.encode('utf-8')).hexdigest()
+                size = len(source.encode('utf-8'))
+                placeholder = is_placeholder(source, task)
+                self.conn.execute(
+                    'INSERT OR IGNORE INTO versions (sha256, task, bytes, placeholder, first_seen, source) VALUES (?, ?, ?, ?, ?, ?)',
+                    (digest, task, size, placeholder, ts, source))
+                cur = self.conn.execute(
+                    'INSERT INTO evaluations (task, ts, run, sha256, bytes, placeholder, passed, correct, total, ms, status, error) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    (task, ts, ev.get('run'), digest, size, placeholder, bool(ev.get('passed')), ev.get('correct'),
+                     ev.get('total'), ev.get('ms'), ev.get('status') or 'ok', ev.get('error')))
+                ids.append(cur.lastrowid)
+        return ids
+
+    def latest(self) -> List[sqlite3.Row]:
+        return self.conn.execute(_LATEST).fetchall()
+
+    def placeholders(self) -> List[str]:
+        return [row['task'] for row in self.latest() if row['placeholder']]
+
+    def best(self, task: str) -> Optional[sqlite3.Row]:
+        """Fastest passing evaluation of the smallest passing version of `task`.
+
+        The row carries the version's `source` and `first_passed`, the time
+        that version first passed (`ts` is the time of this evaluation).
+        """
+        return self.conn.execute(
+            'SELECT e.*, v.source, (SELECT MIN(f.ts) FROM evaluations f WHERE f.sha256 = e.sha256 AND f.passed) AS first_passed '
+            'FROM evaluations e JOIN versions v ON v.sha256 = e.sha256 '
+            'WHERE e.task = ? AND e.passed ORDER BY e.bytes, e.ms IS NULL, e.ms, e.ts LIMIT 1', (task,)).fetchone()
+
+    def best_bytes(self) -> dict:
+        """`{task: smallest passing byte count}` over all recorded history."""
+        rows = self.conn.execute('SELECT task, MIN(bytes) AS bytes FROM evaluations WHERE passed GROUP BY task')
+        return {row['task']: row['bytes'] for row in rows}
+
+    def history(self, task: str, limit: Optional[int] = None) -> List[sqlite3.Row]:
+        return self.conn.execute('SELECT * FROM evaluations WHERE task = ? ORDER BY ts DESC, id DESC LIMIT ?',
+                                 (task, -1 if limit is None else limit)).fetchall()
+
+
+def _rate(row: sqlite3.Row) -> str:
+    return f"{row['correct']}/{row['total']}" if row['total'] is not None else '-'
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description='Query the solver leaderboard database')
+    p.add_argument('db', nargs='?', default=DEFAULT_DB, help='SQLite database written with --leaderboard')
+    p.add_argument('--placeholders', action='store_true', help='List tasks whose latest evaluation is still the placeholder')
+    p.add_argument('--best', metavar='TASK', help='Show the best recorded version of TASK')
+    p.add_argument('--source', action='store_true', help='With --best, print only the source of that version')
+    p.add_argument('--history', metavar='TASK', help='List every evaluation of TASK, newest first')
+    args = p.parse_args(argv)
+
+    if not Path(args.db).exists():
+        print(f'No leaderboard at {args.db}; run the runner with --leaderboard first')
+        return 2
+    with Leaderboard(Path(args.db)) as board:
+        if args.placeholders:
+            tasks = board.placeholders()
+            print('\n'.join(tasks))
+            print(f'{len(tasks)} task(s) still on the placeholder')
+        elif args.best:
+            row = board.best(args.best)
+            if row is None:
+                print(f'No passing version of {args.best} recorded')
+                return 1
+            if args.source:
+                print(row['source'], end='')
+            else:
+                print(f"{row['task']}: {row['bytes']} B, {row['ms'] or 0:.1f} ms, sha256 {row['sha256'][:12]}, "
+                      f"first passed {row['first_passed']}, fastest in run {row['run']}")
+        elif args.history:
+            for row in board.history(args.history):
+                verdict = 'PASS' if row['passed'] else 'FAIL'
+                print(f"{row['ts']}  {verdict}  {_rate(row):>7}  {row['bytes']:6d} B  {row['ms'] or 0:9.1f} ms  "
+                      f"{row['sha256'][:12]}{'  placeholder' if row['placeholder'] else ''}"
+                      f"{'  (' + row['error'] + ')' if row['error'] else ''}")
+        else:
+            best = board.best_bytes()
+            rows = board.latest()
+            for row in rows:
+                verdict = 'PASS' if row['passed'] else ('placeholder' if row['placeholder'] else 'FAIL')
+                record = f"best {best[row['task']]} B" if row['task'] in best else 'never passed'
+                print(f"{row['task']:<10} {verdict:<11} {_rate(row):>7}  {row['bytes']:6d} B  {row['ms'] or 0:9.1f} ms  {record}")
+            passing = [r for r in rows if r['passed']]
+            print(f"{len(passing)}/{len(rows)} tasks pass now ({len(best)} ever); "
+                  f"{sum(1 for r in rows if r['placeholder'])} on the placeholder; "
+                  f"{sum(r['bytes'] for r in passing)} bytes in passing solvers")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
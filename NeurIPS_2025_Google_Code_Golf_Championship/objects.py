@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Object extraction for ARC grids: connected same-colour regions as records.
+
+`extract_objects` labels 4- or 8-connected same-colour regions in one
+vectorized pass: the grid is flattened, every pair of equal neighbouring
+cells becomes an edge, and a union-find over the flat indices merges them
+with whole-array hooking (`np.minimum.at`) and pointer jumping, so there is
+no per-cell Python loop. Each root is the smallest flat index of its
+component, which numbers objects in row-major order of their first cell
+(the same order as `grid_ops.label_components`).
+
+The result is an `Objects` table in struct-of-arrays form: one NumPy array
+per attribute (colour, size, bbox, centroid) indexed by object number, plus
+the label image from which per-object masks are cut on demand.
+
+Usage examples (from a solver or the synthesizer):
+  objs = extract_objects(grid, connectivity=8, background=0)
+  biggest = objs.largest()
+  patch = objs.crop(grid, biggest)           # bbox of the largest object
+  reds = objs.select(objs.color == 2)        # only the red objects
+"""
+from __future__ import annotations
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Forward neighbour offsets; each undirected edge is generated once.
+_FORWARD = {
+    4: ((0, 1), (1, 0)),
+    8: ((0, 1), (1, 0), (1, 1), (1, -1)),
+}
+
+
+def _edges(g: np.ndarray, fg: np.ndarray, connectivity: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Flat index pairs of neighbouring foreground cells with equal colours."""
+    h, w = g.shape
+    idx = np.arange(h * w).reshape(h, w)
+    us, vs = [], []
+    for dr, dc in _FORWARD[connectivity]:
+        c0, c1 = max(-dc, 0), w - max(dc, 0)
+        a = (slice(0, h - dr), slice(c0, c1))
+        b = (slice(dr, h), slice(c0 + dc, c1 + dc))
+        same = (g[a] == g[b]) & fg[a] & fg[b]
+        us.append(idx[a][same])
+        vs.append(idx[b][same])
+    return np.concatenate(us), np.concatenate(vs)
+
+
+def union_find(n: int, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """Root of every node 0..n-1 after merging the edges (u[i], v[i]).
+
+    Roots are the smallest node of each set: the larger of two roots is
+    always hooked under the smaller one, then paths are fully compressed.
+    """
+    parent = np.arange(n)
+    while u.size:
+        pu, pv = parent[u], parent[v]
+        differ = pu != pv
+        if not differ.any():
+            break
+        pu, pv = pu[differ], pv[differ]
+        np.minimum.at(parent, np.maximum(pu, pv), np.minimum(pu, pv))
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+        u, v = u[differ], v[differ]
+    return parent
+
+
+class Objects:
+    """Connected regions of one grid, one array entry per object.
+
+    Attributes (all of length `len(objs)`, index `k` is object `k`):
+      color     uint8 colour of the object,
+      size      number of cells,
+      bbox      (n, 4) int32 rows of `(r0, c0, r1, c1)`, ends exclusive,
+      centroid  (n, 2) float64 rows of `(row, col)` means.
+    `labels` is the grid-shaped int32 image with 0 for background cells and
+    `k + 1` for the cells of object `k`.
+    """
+
+    __slots__ = ('labels', 'color', 'size', 'bbox', 'centroid')
+
+    def __init__(self, labels: np.ndarray, color: np.ndarray, size: np.ndarray, bbox: np.ndarray, centroid: np.ndarray):
+        self.labels = labels
+        self.color = color
+        self.size = size
+        self.bbox = bbox
+        self.centroid = centroid
+
+    def __len__(self) -> int:
+        return len(self.color)
+
+    def __repr__(self) -> str:
+        return f'Objects(n={len(self)}, shape={self.labels.shape})'
+
+    def mask(self, k: int) -> np.ndarray:
+        """Boolean mask of object `k` within its bounding box."""
+        r0, c0, r1, c1 = self.bbox[k]
+        return self.labels[r0:r1, c0:c1] == k + 1
+
+    def full_mask(self, k: int) -> np.ndarray:
+        """Boolean mask of object `k` over the whole grid."""
+        return self.labels == k + 1
+
+    def crop(self, grid: np.ndarray, k: int) -> np.ndarray:
+        """The grid cut to the bounding box of object `k` (other objects included)."""
+        r0, c0, r1, c1 = self.bbox[k]
+        return np.asarray(grid)[r0:r1, c0:c1]
+
+    def largest(self) -> int:
+        return int(np.argmax(self.size))
+
+    def smallest(self) -> int:
+        return int(np.argmin(self.size))
+
+    def select(self, keep: np.ndarray) -> 'Objects':
+        """A new table with only the objects where `keep` is true, renumbered in order."""
+        keep = np.asarray(keep, dtype=bool)
+        remap = np.zeros(len(self) + 1, dtype=np.int32)
+        remap[1:][keep] = np.arange(1, int(keep.sum()) + 1, dtype=np.int32)
+        return Objects(remap[self.labels], self.color[keep], self.size[keep], self.bbox[keep], self.centroid[keep])
+
+
+def extract_objects(grid, connectivity: int = 4, background: Optional[int] = 0) -> Objects:
+    """Label connected same-colour regions of `grid` and summarise each one.
+
+    Cells equal to `background` belong to no object; pass `background=None`
+    to treat every colour (including 0) as objects.
+    """
+    g = np.asarray(grid)
+    h, w = g.shape
+    fg = np.ones(g.shape, dtype=bool) if background is None else g != background
+    roots = union_find(h * w, *_edges(g, fg, connectivity))
+
+    flat_fg = np.flatnonzero(fg.ravel())
+    uniq, lab = np.unique(roots[flat_fg], return_inverse=True)
+    lab = lab.ravel().astype(np.int32)
+    labels = np.zeros(h * w, dtype=np.int32)
+    labels[flat_fg] = lab + 1
+    labels = labels.reshape(h, w)
+
+    n = len(uniq)
+    size = np.bincount(lab, minlength=n)
+    rows, cols = np.divmod(flat_fg, w)
+    order = np.argsort(lab, kind='stable')
+    starts = np.concatenate([[0], np.cumsum(size)[:-1]]) if n else np.zeros(0, dtype=np.int64)
+    r_sorted, c_sorted = rows[order], cols[order]
+    bbox = np.empty((n, 4), dtype=np.int32)
+    if n:
+        bbox[:, 0] = np.minimum.reduceat(r_sorted, starts)
+        bbox[:, 1] = np.minimum.reduceat(c_sorted, starts)
+        bbox[:, 2] = np.maximum.reduceat(r_sorted, starts) + 1
+        bbox[:, 3] = np.maximum.reduceat(c_sorted, starts) + 1
+    centroid = np.stack([np.bincount(lab, rows, n), np.bincount(lab, cols, n)], axis=1) / np.maximum(size, 1)[:, None]
+    color = g.ravel()[uniq].astype(np.uint8)
+    return Objects(labels, color, size, bbox, centroid)
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Sampling profiler for `solve_grid` calls, aggregated across tasks.
+
+`StackProfiler.attached(module, label)` swaps a solver module's `solve_grid`
+and `solve_batch` for wrappers while a `SIGPROF` interval timer (process CPU
+time, default every 1 ms) is running. Each tick walks the interrupted Python
+stack up to the wrapper frame and counts it as
+
+    task002;task002.solve_grid
+
+so only time spent inside the solver is attributed, never the harness, JSON
+handling or scoring around it. Time spent in C code (NumPy kernels) is
+charged to the Python function that called it.
+
+The counts of many tasks (and of many sweep workers, via `merge`) go into
+one `Counter`, written with `write_collapsed` in the folded format read by
+`flamegraph.pl`, speedscope and inferno. `top_functions` ranks functions by
+self and inclusive samples over the whole suite, which points at the
+primitives worth optimizing rather than the slowest single task.
+
+Usage examples (from repo root):
+  # Profile a sweep and write output/profile.collapsed
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/run_and_visualize.py --dir NeurIPS_2025_Google_Code_Golf_Championship/generated_solver --jobs 8 --profile
+
+  # Top functions of an existing collapsed-stack file
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/profiling.py output/profile.collapsed --top 25
+
+  # Flamegraph (with Brendan Gregg's FlameGraph scripts on PATH)
+  flamegraph.pl output/profile.collapsed > profile.svg
+"""
+from __future__ import annotations
+import argparse
+import signal
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, Iterator, List, Mapping, Optional
+
+DEFAULT_PROFILE = 'output/profile.collapsed'
+DEFAULT_INTERVAL = 0.001
+# Solver functions whose calls are profiled.
+ENTRY_POINTS = ('solve_grid', 'solve_batch')
+
+
+def _call_profiled(fn, grid, args, kwargs):
+    # Stack walks stop at this frame; everything above it belongs to the solver.
+    return fn(grid, *args, **kwargs)
+
+
+_BOUNDARY = _call_profiled.__code__
+
+
+def frame_name(code) -> str:
+    """`<file stem>.<qualified name>`, e.g. `grid_ops.label_components`."""
+    stem = Path(code.co_filename).stem
+    return f"{stem}.{getattr(code, 'co_qualname', code.co_name)}".replace(';', ':').replace(' ', '_')
+
+
+class StackProfiler:
+    """Collects collapsed `solve_grid` stacks, one count per timer tick."""
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._label = ''
+        self._names: Dict[object, str] = {}
+
+    @property
+    def supported(self) -> bool:
+        return hasattr(signal, 'SIGPROF') and hasattr(signal, 'setitimer')
+
+    def _sample(self, signum, frame) -> None:
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            if code is _BOUNDARY:
+                names.append(self._label)
+                self.stacks[';'.join(reversed(names))] += 1
+                return
+            name = self._names.get(code)
+            if name is None:
+                name = self._names[code] = frame_name(code)
+            names.append(name)
+            frame = frame.f_back
+
+    @contextmanager
+    def attached(self, module: ModuleType, label: str) -> Iterator[None]:
+        """Profile every `module.solve_grid` / `solve_batch` call made inside the block.
+
+        The module's original functions are restored on exit. Modules with
+        neither, and platforms without `SIGPROF`, run unprofiled.
+        """
+        originals = {name: getattr(module, name) for name in ENTRY_POINTS if callable(getattr(module, name, None))}
+        if not originals or not self.supported:
+            yield
+            return
+
+        def profiled(fn):
+            def wrapper(grid, *args, **kwargs):
+                return _call_profiled(fn, grid, args, kwargs)
+            return wrapper
+
+        self._label = label.replace(';', ':').replace(' ', '_')
+        for name, fn in originals.items():
+            setattr(module, name, profiled(fn))
+        previous = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        try:
+            yield
+        finally:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, previous)
+            for name, fn in originals.items():
+                setattr(module, name, fn)
+
+    def merge(self, stacks: Optional[Mapping[str, int]]) -> None:
+        """Add the stacks of another profiler (e.g. returned by a sweep worker)."""
+        self.stacks.update(stacks or {})
+
+    def seconds(self) -> float:
+        return sum(self.stacks.values()) * self.interval
+
+
+def write_collapsed(path: Path, stacks: Mapping[str, int]) -> None:
+    """Write `stack count` lines, the folded input format of flamegraph tools."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open('w', encoding='utf-8') as f:
+        for stack in sorted(stacks):
+            f.write(f'{stack} {stacks[stack]}\n')
+
+
+def read_collapsed(path: Path) -> Counter:
+    stacks: Counter = Counter()
+    with Path(path).open(encoding='utf-8') as f:
+        for line in f:
+            stack, _, count = line.rstrip('\n').rpartition(' ')
+            if stack and count.isdigit():
+                stacks[stack] += int(count)
+    return stacks
+
+
+def top_functions(stacks: Mapping[str, int], n: int = 20) -> List[dict]:
+    """Rank functions by self samples across all tasks (the root label is skipped).
+
+    `inclusive` counts each sample once per function even under recursion;
+    `tasks` is the number of distinct tasks whose profile contains the function.
+    """
+    own: Counter = Counter()
+    inclusive: Counter = Counter()
+    tasks: Dict[str, set] = {}
+    for stack, count in stacks.items():
+        frames = stack.split(';')
+        if len(frames) < 2:
+            continue
+        own[frames[-1]] += count
+        for name in set(frames[1:]):
+            inclusive[name] += count
+            tasks.setdefault(name, set()).add(frames[0])
+    ranked = sorted(inclusive, key=lambda name: (-own[name], -inclusive[name], name))[:n]
+    return [{'function': name, 'self': own[name], 'inclusive': inclusive[name], 'tasks': len(tasks[name])} for name in ranked]
+
+
+def print_top(stacks: Mapping[str, int], n: int = 20, interval: float = DEFAULT_INTERVAL) -> None:
+    total = sum(stacks.values())
+    if not total:
+        print('No profile samples collected (solvers too fast or without solve_grid)')
+        return
+    print(f'{total} samples ({total * interval:.2f} s CPU) in solve_grid; top functions by self time:')
+    print(f"{'self':>7} {'self%':>6} {'incl':>7} {'incl%':>6} {'tasks':>5}  function")
+    for row in top_functions(stacks, n):
+        print(f"{row['self']:7d} {100 * row['self'] / total:5.1f}% {row['inclusive']:7d} "
+              f"{100 * row['inclusive'] / total:5.1f}% {row['tasks']:5d}  {row['function']}")
+
+
+def main(argv=None) -> None:
+    p = argparse.ArgumentParser(description='Summarize a collapsed-stack solve_grid profile')
+    p.add_argument('profile', nargs='?', default=DEFAULT_PROFILE, help='Collapsed-stack file written by --profile')
+    p.add_argument('--top', type=int, default=20, help='Number of functions to list')
+    p.add_argument('--interval', type=float, default=DEFAULT_INTERVAL, help='Sampling interval the profile was taken with (seconds)')
+    args = p.parse_args(argv)
+    print_top(read_collapsed(Path(args.profile)), args.top, args.interval)
+
+
+if __name__ == '__main__':
+    main()
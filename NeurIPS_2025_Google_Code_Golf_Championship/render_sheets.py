@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Headless PNG contact sheets for ARC tasks, without matplotlib.
+
+Grids are painted straight into uint8 RGB buffers through the `COLORS`
+palette of `visualize_arc_tasks` (one fancy-indexing lookup per grid), laid
+out as input|output pairs on a sheet and written with a small built-in PNG
+encoder. Tasks are rendered in parallel across worker processes.
+
+Usage examples (from repo root):
+  # Render every task in data/ to output/sheets using 8 processes
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/render_sheets.py data --out-dir output/sheets --jobs 8
+
+  # Render one task, only its train and test examples
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/render_sheets.py data/task001.json --splits train test
+"""
+from __future__ import annotations
+import argparse
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from task_loader import SPLITS, load_task_arrays
+from visualize_arc_tasks import COLORS
+
+WHITE = np.array([255, 255, 255], dtype=np.uint8)
+# Colour used for cells outside the 0-9 palette.
+UNKNOWN = np.array([128, 128, 128], dtype=np.uint8)
+PALETTE = np.vstack([COLORS, np.repeat(UNKNOWN[None], 256 - len(COLORS), axis=0)])
+
+PAIRS_PER_SHEET = 50
+
+
+def grid_to_rgb(grid, scale: int = 8, line: int = 1) -> np.ndarray:
+    """Paint a grid as an RGB image with `scale`-pixel cells and grid lines."""
+    g = np.asarray(grid)
+    g = np.clip(g, 0, 255).astype(np.uint8) if g.dtype != np.uint8 else g
+    img = PALETTE[g]
+    img = np.repeat(np.repeat(img, scale, axis=0), scale, axis=1)
+    if line and scale > 2:
+        img[::scale, :] = 64
+        img[:, ::scale] = 64
+    return img
+
+
+def pair_image(inp, out, scale: int = 8, gap: int = 6) -> np.ndarray:
+    """Input and output side by side on a white background, top-aligned."""
+    a = grid_to_rgb(inp, scale)
+    b = grid_to_rgb(out, scale) if out is not None else np.zeros((0, 0, 3), dtype=np.uint8)
+    h = max(a.shape[0], b.shape[0])
+    img = np.empty((h, a.shape[1] + gap + b.shape[1], 3), dtype=np.uint8)
+    img[:] = WHITE
+    img[:a.shape[0], :a.shape[1]] = a
+    img[:b.shape[0], a.shape[1] + gap:] = b
+    return img
+
+
+def contact_sheet(pairs: Sequence[Tuple[np.ndarray, Optional[np.ndarray]]], cols: int = 5, scale: int = 8, pad: int = 12) -> np.ndarray:
+    """Lay out input/output pairs row by row into a single RGB image."""
+    images = [pair_image(i, o, scale) for i, o in pairs]
+    if not images:
+        return np.full((1, 1, 3), 255, dtype=np.uint8)
+    cols = min(cols, len(images))
+    rows = [images[i:i + cols] for i in range(0, len(images), cols)]
+    row_heights = [max(im.shape[0] for im in row) for row in rows]
+    col_widths = [max(row[c].shape[1] for row in rows if c < len(row)) for c in range(cols)]
+    sheet = np.empty((sum(row_heights) + pad * (len(rows) + 1), sum(col_widths) + pad * (cols + 1), 3), dtype=np.uint8)
+    sheet[:] = WHITE
+    y = pad
+    for row, rh in zip(rows, row_heights):
+        x = pad
+        for c, im in enumerate(row):
+            sheet[y:y + im.shape[0], x:x + im.shape[1]] = im
+            x += col_widths[c] + pad
+        y += rh + pad
+    return sheet
+
+
+def write_png(path: Path, rgb: np.ndarray) -> None:
+    """Write an (H, W, 3) uint8 array as an 8-bit RGB PNG."""
+    h, w, _ = rgb.shape
+    raw = np.empty((h, 1 + w * 3), dtype=np.uint8)
+    raw[:, 0] = 0  # filter type "None" for every scanline
+    raw[:, 1:] = rgb.reshape(h, w * 3)
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    png = b'\x89PNG\r\n\x1a\n'
+    png += chunk(b'IHDR', struct.pack('>IIBBBBB', w, h, 8, 2, 0, 0, 0))
+    png += chunk(b'IDAT', zlib.compress(raw.tobytes(), 6))
+    png += chunk(b'IEND', b'')
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(png)
+
+
+def render_pairs(name: str, pairs: Sequence[Tuple[np.ndarray, Optional[np.ndarray]]], out_dir: Path, per_sheet: int = PAIRS_PER_SHEET, cols: int = 5, scale: int = 8) -> List[Path]:
+    """Write one or more contact sheets for `pairs`; returns the PNG paths."""
+    paths = []
+    chunks = [pairs[i:i + per_sheet] for i in range(0, len(pairs), per_sheet)] or [[]]
+    for part, chunk in enumerate(chunks, start=1):
+        suffix = f'_part{part}' if len(chunks) > 1 else ''
+        path = out_dir / f'{name}{suffix}.png'
+        write_png(path, contact_sheet(chunk, cols=cols, scale=scale))
+        paths.append(path)
+    return paths
+
+
+def render_task(json_path: Path, out_dir: Path, splits: Iterable[str] = SPLITS, per_sheet: int = PAIRS_PER_SHEET, scale: int = 8) -> List[Path]:
+    """Render the chosen splits of one task file to PNG contact sheets."""
+    arrays = load_task_arrays(json_path)
+    if arrays is None:
+        print(f'Could not load grids from {json_path}')
+        return []
+    pairs = [pair for split in splits for pair in arrays.get(split, [])]
+    return render_pairs(Path(json_path).stem, pairs, out_dir, per_sheet=per_sheet, scale=scale)
+
+
+def _render_worker(args: tuple) -> List[Path]:
+    return render_task(*args)
+
+
+def render_all(json_paths: Sequence[Path], out_dir: Path, splits: Iterable[str] = SPLITS, jobs: int = 1, per_sheet: int = PAIRS_PER_SHEET, scale: int = 8) -> List[Path]:
+    """Render many task files, in parallel when `jobs > 1`."""
+    work = [(p, out_dir, tuple(splits), per_sheet, scale) for p in json_paths]
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_render_worker, work, chunksize=4))
+    else:
+        results = [_render_worker(w) for w in work]
+    return [p for paths in results for p in paths]
+
+
+def main(argv=None) -> None:
+    p = argparse.ArgumentParser(description='Render ARC task JSON files to PNG contact sheets (no matplotlib)')
+    p.add_argument('path', help='A task .json file or a directory of them')
+    p.add_argument('--out-dir', default='output/sheets', help='Directory for the PNG files')
+    p.add_argument('--splits', nargs='+', default=list(SPLITS), help='Splits to include')
+    p.add_argument('--jobs', type=int, default=1, help='Worker processes')
+    p.add_argument('--per-sheet', type=int, default=PAIRS_PER_SHEET, help='Input/output pairs per PNG')
+    p.add_argument('--scale', type=int, default=8, help='Pixels per grid cell')
+    args = p.parse_args(argv)
+
+    target = Path(args.path)
+    json_paths = sorted(target.glob('*.json')) if target.is_dir() else [target]
+    if not json_paths or not json_paths[0].exists():
+        print(f"No .json files found at '{args.path}'")
+        return
+    written = render_all(json_paths, Path(args.out_dir), args.splits, jobs=args.jobs, per_sheet=args.per_sheet, scale=args.scale)
+    print(f'Wrote {len(written)} PNG file(s) for {len(json_paths)} task(s) to {args.out_dir}')
+
+
+if __name__ == '__main__':
+    main()
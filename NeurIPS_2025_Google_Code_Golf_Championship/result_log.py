@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Append-only JSON-lines log of solver runs, with a cheap streaming reader.
+
+Each solver run becomes one line in `results.jsonl`:
+
+  {"run": "20251017T101500", "ts": "...", "task": "task001", "solver": "task001.py",
+   "ms": 1.8, "status": "ok", "error": null, "passed": false, "correct": 62, "total": 64,
+   "outputs": {"train": ["*", "*", "AQADAAMABwd3BwA="], "test": ["*"], "arc-gen": [...]}}
+
+Inputs are never stored (they live in the task JSON) and produced grids are
+deduplicated before encoding:
+  - `"*"`  the output equals the expected output,
+  - `"="`  the output equals its own input,
+  - `"^k"` the output equals output `k` of the same split,
+  - `null` the solver produced nothing usable for that example,
+  - otherwise the base64 `grid_codec` encoding (4-bit packed or run-length).
+A passing solver therefore costs a few bytes per example instead of a full
+copy of every grid.
+
+Usage examples (from repo root):
+  # Per-run summary of a results log
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/result_log.py output/visualizations/results.jsonl
+
+  # History of one task across runs
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/result_log.py output/visualizations/results.jsonl --task task042
+"""
+from __future__ import annotations
+import argparse
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from grid_codec import decode_text, encode_text
+from scorer import as_grid, score_solution, split_outputs
+from task_loader import SPLITS, load_task_arrays
+
+SAME_AS_EXPECTED = '*'
+SAME_AS_INPUT = '='
+
+
+def encode_grid(grid: np.ndarray) -> Any:
+    """Base64 `grid_codec` string for 0-255 grids, otherwise nested lists."""
+    try:
+        return encode_text(grid)
+    except ValueError:
+        return grid.tolist()
+
+
+def decode_grid(value: Any) -> Optional[np.ndarray]:
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return np.asarray(value, dtype=np.uint8)
+    return decode_text(value).astype(np.uint8)
+
+
+def encode_outputs(solution: Any, arrays: Optional[Dict[str, list]]) -> Dict[str, List[Any]]:
+    """Encode the produced grids of every split, deduplicated against the task."""
+    encoded: Dict[str, List[Any]] = {}
+    for split in SPLITS:
+        produced = split_outputs(solution, split)
+        if produced is None:
+            continue
+        pairs = (arrays or {}).get(split, [])
+        seen: Dict[bytes, int] = {}
+        out: List[Any] = []
+        for i, obj in enumerate(produced):
+            grid = as_grid(obj)
+            if grid is None:
+                out.append(None)
+                continue
+            inp, want = pairs[i] if i < len(pairs) else (None, None)
+            key = repr(grid.shape).encode() + grid.tobytes()
+            if want is not None and grid.shape == want.shape and np.array_equal(grid, want):
+                out.append(SAME_AS_EXPECTED)
+            elif inp is not None and grid.shape == inp.shape and np.array_equal(grid, inp):
+                out.append(SAME_AS_INPUT)
+            elif key in seen:
+                out.append(f'^{seen[key]}')
+            else:
+                seen[key] = i
+                out.append(encode_grid(grid))
+        encoded[split] = out
+    return encoded
+
+
+def decode_outputs(record: dict, arrays: Optional[Dict[str, list]] = None) -> Dict[str, List[Optional[np.ndarray]]]:
+    """Rebuild the produced grids of a record; `arrays` defaults to the record's task."""
+    if arrays is None:
+        arrays = load_task_arrays(record['task']) or {}
+    decoded: Dict[str, List[Optional[np.ndarray]]] = {}
+    for split, values in (record.get('outputs') or {}).items():
+        pairs = arrays.get(split, [])
+        grids: List[Optional[np.ndarray]] = []
+        for i, value in enumerate(values):
+            if value == SAME_AS_EXPECTED:
+                grids.append(pairs[i][1])
+            elif value == SAME_AS_INPUT:
+                grids.append(pairs[i][0])
+            elif isinstance(value, str) and value.startswith('^'):
+                grids.append(grids[int(value[1:])])
+            else:
+                grids.append(decode_grid(value))
+        decoded[split] = grids
+    return decoded
+
+
+def make_record(task: str, solver: str, solution: Any, elapsed: float, run_id: str) -> dict:
+    """Build one log record for a finished solver call (`elapsed` in seconds)."""
+    record = {
+        'run': run_id,
+        'ts': datetime.utcnow().isoformat() + 'Z',
+        'task': task,
+        'solver': solver,
+        'ms': round(elapsed * 1000, 3),
+        'status': 'ok',
+        'error': None,
+        'passed': False,
+        'correct': 0,
+        'total': 0,
+        'outputs': {},
+    }
+    if isinstance(solution, dict) and set(solution) == {'error'}:
+        record.update(status='error', error=str(solution['error']))
+        return record
+    arrays = load_task_arrays(task)
+    if arrays is not None:
+        score = score_solution(solution, task)
+        record.update(passed=score['passed'], correct=score['correct'], total=score['total'])
+    record['outputs'] = encode_outputs(solution, arrays)
+    return record
+
+
+class ResultLog:
+    """Appends records to a JSONL file, one flushed line per record.
+
+    The file is opened on the first append (or on entering the context
+    manager); every line is complete on disk as soon as `append` returns, so
+    an interrupted sweep keeps everything logged so far.
+    """
+
+    def __init__(self, path: Path, run_id: Optional[str] = None):
+        self.path = Path(path)
+        self.run_id = run_id or datetime.utcnow().strftime('%Y%m%dT%H%M%S')
+        self._fh = None
+
+    def __enter__(self) -> 'ResultLog':
+        self._open()
+        return self
+
+    def _open(self) -> None:
+        if self._fh is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = self.path.open('a', encoding='utf-8')
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def append(self, record: dict) -> None:
+        self._open()
+        self._fh.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self._fh.flush()
+
+    def log(self, task: str, solver: str, solution: Any, elapsed: float) -> dict:
+        record = make_record(task, solver, solution, elapsed, self.run_id)
+        self.append(record)
+        return record
+
+
+def iter_records(path: Path, tasks: Optional[Iterable[str]] = None, run: Optional[str] = None) -> Iterator[dict]:
+    """Stream records from a log, optionally restricted to some tasks or one run.
+
+    Lines are filtered on their raw text before being parsed, so scanning a
+    large log for a few tasks only decodes the matching lines.
+    """
+    path = Path(path)
+    if not path.exists():
+        return
+    wanted = set(tasks) if tasks else None
+    needles = [f'"task":"{t}"' for t in wanted] if wanted else None
+    run_needle = f'"run":"{run}"' if run else None
+    with path.open(encoding='utf-8') as f:
+        for line in f:
+            if needles is not None and not any(n in line for n in needles):
+                continue
+            if run_needle is not None and run_needle not in line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # a truncated last line from an interrupted run
+            if wanted is not None and record.get('task') not in wanted:
+                continue
+            if run is not None and record.get('run') != run:
+                continue
+            yield record
+
+
+def latest_by_task(path: Path) -> Dict[str, dict]:
+    """The most recent record for every task in the log."""
+    latest: Dict[str, dict] = {}
+    for record in iter_records(path):
+        latest[record['task']] = record
+    return latest
+
+
+def run_summaries(path: Path) -> List[dict]:
+    """Aggregate every run in the log without keeping its records in memory."""
+    runs: Dict[str, dict] = {}
+    for record in iter_records(path):
+        s = runs.setdefault(record['run'], {'run': record['run'], 'tasks': 0, 'passed': 0, 'errors': 0, 'ms': 0.0})
+        s['tasks'] += 1
+        s['passed'] += bool(record.get('passed'))
+        s['errors'] += record.get('status') != 'ok'
+        s['ms'] += record.get('ms') or 0.0
+    return list(runs.values())
+
+
+def main(argv=None) -> None:
+    p = argparse.ArgumentParser(description='Summarize a JSONL solver results log')
+    p.add_argument('log', help='Path to results.jsonl')
+    p.add_argument('--task', default=None, help='Show the history of one task instead of run summaries')
+    args = p.parse_args(argv)
+
+    if args.task:
+        for rec in iter_records(Path(args.log), tasks=[args.task]):
+            verdict = 'PASS' if rec['passed'] else 'FAIL'
+            line = f"{rec['run']}  {verdict}  {rec['correct']}/{rec['total']}  {rec['ms']:9.1f} ms"
+            if rec['error']:
+                line += f"  ({rec['error']})"
+            print(line)
+        return
+    for s in run_summaries(Path(args.log)):
+        print(f"{s['run']}  {s['passed']}/{s['tasks']} pass  errors={s['errors']}  solver time {s['ms'] / 1000:.2f} s")
+
+
+if __name__ == '__main__':
+    main()
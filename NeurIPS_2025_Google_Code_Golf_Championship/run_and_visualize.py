@@ -5,8 +5,11 @@ the project's `src/visualize_arc_tasks.py` helper.
 
 Behavior:
 - For each solver script (e.g. `task042.py`) the runner will:
-  1. Determine the corresponding JSON file (`data/task042.json`).
-  2. Run the solver script and parse its single-line JSON stdout.
+  1. Determine the corresponding JSON file (`data/task042.json`) and parse it
+     once through the shared `task_loader` cache.
+  2. Import the solver module once and call its `solve(task_obj)` directly on
+     the already-parsed task (or, with `--subprocess`, run the solver script
+     and parse its single-line JSON stdout).
   3. Try to extract one or more 2D-grid outputs from the solver's `solution`.
   4. Pair those outputs with the original `train` inputs (best-effort).
   5. Write a temporary JSON file in ARC format and call the visualizer to show
@@ -19,27 +22,67 @@ Usage examples (from repo root):
   # Visualize the first 10 solvers in the generated folder
   python3 scripts/generated_solver/run_and_visualize.py --dir scripts/generated_solver --max 10
 
+  # Run every solver in a fresh interpreter (slow, but isolates crashing solvers)
+  python3 scripts/generated_solver/run_and_visualize.py --dir scripts/generated_solver --subprocess
+
+  # Regression sweep over all solvers on 8 worker processes (no visualization)
+  python3 scripts/generated_solver/run_and_visualize.py --dir scripts/generated_solver --jobs 8
+
+  # Untrusted solvers: run grid by grid on 4 warm workers with CPU/memory limits
+  python3 scripts/generated_solver/run_and_visualize.py --dir scripts/generated_solver --sandbox 4 --no-show
+
+  # Score solvers in-process without ever importing matplotlib (fast start)
+  python3 scripts/generated_solver/run_and_visualize.py --dir scripts/generated_solver --only-score --save
+
+  # Sample solve_grid stacks over a sweep; writes output/profile.collapsed for flamegraphs
+  python3 scripts/generated_solver/run_and_visualize.py --dir scripts/generated_solver --jobs 8 --profile
+
+  # Record bytes, pass rate and runtime per task in output/leaderboard.sqlite
+  python3 scripts/generated_solver/run_and_visualize.py --dir scripts/generated_solver --jobs 8 --leaderboard
+
 Notes:
 - The runner uses heuristics to interpret solver outputs. If a solver doesn't
   return a grid-like output the runner will skip visualization for that task.
 - The runner calls the visualizer script as a subprocess; each call opens a
   matplotlib window which you should close to continue to the next task.
+  matplotlib itself is only imported (and its backend chosen) on the first
+  in-process figure, so `--jobs`, `--only-score` and headless `--save`
+  runs never pay for it.
+  With `--no-show` no visualizer is launched; `--save` then writes PNG
+  contact sheets directly via `render_sheets`.
+- `--save` appends one compact line per solver run to
+  `<out-dir>/results.jsonl` (see `result_log.py` for the format and reader).
+- `--leaderboard` stores every evaluation in a SQLite database (see
+  `leaderboard.py` for the schema and the standings / best-version queries).
 """
 from __future__ import annotations
 import argparse
+import importlib.util
 import json
+import signal
 import subprocess
 import sys
 import tempfile
+import time
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Any, List, Optional
-import matplotlib
-import importlib
-# Delay importing pyplot until we know whether we should show figures interactively.
-# `plt` will be imported inside main() after selecting an appropriate backend.
-plt = None
+from types import ModuleType
+from typing import Any, Dict, List, Optional
 import numpy as np
-from datetime import datetime
+
+from grid_cache import DEFAULT_CACHE_DIR, GridCache, get_cache, install
+from leaderboard import DEFAULT_DB as LEADERBOARD_DB, Leaderboard
+from profiling import DEFAULT_INTERVAL, DEFAULT_PROFILE, StackProfiler, print_top, write_collapsed
+from render_sheets import render_pairs
+from result_log import ResultLog
+from sandbox import SandboxPool
+from scorer import as_grid, score_packed_solution, score_solution, summarize
+from task_loader import PackedSplit, find_data_dir, load_task, load_task_packed, task_path
+
+RESULTS_LOG = 'results.jsonl'
 
 
 def is_numeric_list(obj: Any) -> bool:
@@ -156,6 +199,222 @@ def run_solver(solver_path: Path) -> Optional[dict]:
         return None
 
 
+# Solver modules imported by `load_solver_module`, keyed by resolved path.
+_SOLVER_MODULES: Dict[Path, ModuleType] = {}
+
+
+def load_solver_module(solver_path: Path) -> Optional[ModuleType]:
+    """Import a solver script as a module, caching it so it is loaded only once."""
+    key = solver_path.resolve()
+    if key in _SOLVER_MODULES:
+        return _SOLVER_MODULES[key]
+    spec = importlib.util.spec_from_file_location(f"arc_solver_{solver_path.stem}", key)
+    if spec is None or spec.loader is None:
+        print(f"Could not create an import spec for {solver_path}")
+        return None
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except Exception as e:
+        print(f"Failed to import {solver_path}: {e}")
+        return None
+    _SOLVER_MODULES[key] = module
+    return module
+
+
+def forget_solver_module(solver_path: Path) -> None:
+    """Drop a cached solver module so the next call re-imports the edited file."""
+    _SOLVER_MODULES.pop(solver_path.resolve(), None)
+
+
+def _profiled(profiler: Optional[StackProfiler], module: ModuleType, solver_path: Path):
+    return profiler.attached(module, solver_path.stem) if profiler is not None else nullcontext()
+
+
+def run_solver_inprocess(solver_path: Path, task_obj: Any, cache: Optional[GridCache] = None, profiler: Optional[StackProfiler] = None) -> Optional[dict]:
+    """Call the solver's `solve(task_obj)` directly on an already-parsed task.
+
+    Returns a dict shaped like the solver's stdout line (`task` and `solution`)
+    or None when the solver cannot be imported or has no `solve` function.
+    With a `cache`, the solver's `solve_grid` is memoized per input grid;
+    with a `profiler`, its `solve_grid` calls are sampled.
+    """
+    module = load_solver_module(solver_path)
+    if module is None:
+        return None
+    if cache is not None:
+        install(module, solver_path.read_bytes(), cache)
+    solve = getattr(module, 'solve', None)
+    if not callable(solve):
+        print(f"Solver {solver_path.name} has no solve() function")
+        return None
+    task_name = getattr(module, 'TASK_NAME', solver_path.stem + '.json')
+    try:
+        with _profiled(profiler, module, solver_path):
+            solution = solve(task_obj)
+    except Exception as e:
+        solution = {"error": str(e)}
+    return {"task": task_name, "solution": solution}
+
+
+def run_solver_packed(solver_path: Path, task: Any, cache: Optional[GridCache] = None, profiler: Optional[StackProfiler] = None) -> Optional[Dict[str, PackedSplit]]:
+    """Run the solver over packed splits, skipping `solve()` and JSON lists.
+
+    Each split's inputs are handed to the solver's `solve_batch` (one call per
+    split) or, failing that, to `solve_grid` one grid at a time, as private
+    int64 copies: the same arrays `np.array(list)` gives inside `solve()`, so
+    a solver sees one input contract on every path (uint8 arithmetic would
+    silently wrap). The outputs come back packed as `{split: PackedSplit}`. Returns None when the solver has
+    neither (or the task cannot be loaded) so callers can fall back to
+    `solve()`. Exceptions raised by the solver propagate.
+    """
+    module = load_solver_module(solver_path)
+    if module is None or not any(callable(getattr(module, fn, None)) for fn in ('solve_batch', 'solve_grid')):
+        return None
+    packed = load_task_packed(task)
+    if packed is None:
+        return None
+    if cache is not None:
+        install(module, solver_path.read_bytes(), cache)
+    outputs: Dict[str, PackedSplit] = {}
+    with _profiled(profiler, module, solver_path):
+        batch = getattr(module, 'solve_batch', None)
+        for split, (inputs, _) in packed.items():
+            views = [grid.astype(np.int64) for grid in inputs]
+            produced = batch(views) if callable(batch) else [module.solve_grid(grid) for grid in views]
+            grids = []
+            for out in produced:
+                out = as_grid(out)
+                grids.append(out if out is not None else np.zeros((0, 0), dtype=np.uint8))
+            outputs[split] = PackedSplit.from_grids(grids)
+    return outputs
+
+
+class SolverTimeout(BaseException):
+    """Raised inside a worker when a solver exceeds its time budget.
+
+    Derives from BaseException so the `except Exception` around `solve()` in
+    `run_solver_inprocess` does not swallow it.
+    """
+
+
+def _raise_solver_timeout(signum, frame):
+    raise SolverTimeout()
+
+
+def _sweep_worker(solver_path: str, task_file: str, timeout: Optional[float], cache_dir: Optional[str] = None, profile_interval: Optional[float] = None, exact: bool = False) -> dict:
+    """Run one solver in a pool worker and return a small, picklable summary.
+
+    Only the status, timing and the number of extracted grids are sent back to
+    the parent so large solutions never cross the process boundary. Solvers
+    with a `solve_grid` run on packed uint8 splits (`run_solver_packed`); the
+    task is only parsed into nested lists for `solve()`-only solvers. With a
+    `profile_interval` the sampled `solve_grid` stacks are returned as well.
+    """
+    solver = Path(solver_path)
+    record = {'solver': solver.name, 'status': 'ok', 'elapsed': 0.0, 'num_outputs': 0, 'passed': False, 'correct': None, 'total': None, 'error': None}
+    task = Path(task_file)
+    if not task.exists():
+        record.update(status='missing', error=f'{task} not found')
+        return record
+
+    use_alarm = timeout is not None and hasattr(signal, 'SIGALRM')
+    if use_alarm:
+        previous = signal.signal(signal.SIGALRM, _raise_solver_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    start = time.perf_counter()
+    profiler = StackProfiler(profile_interval) if profile_interval else None
+    packed = task_obj = result = None
+    try:
+        packed = run_solver_packed(solver, task, cache=get_cache(cache_dir), profiler=profiler)
+        if packed is None:
+            task_obj = load_task(task)
+            result = run_solver_inprocess(solver, task_obj, cache=get_cache(cache_dir), profiler=profiler)
+    except SolverTimeout:
+        record.update(status='timeout', error=f'exceeded {timeout:g} s')
+        result = None
+    except Exception as e:
+        record.update(status='error', error=f'{type(e).__name__}: {e}')
+        result = None
+    finally:
+        record['elapsed'] = time.perf_counter() - start
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+    if profiler is not None:
+        record['stacks'] = dict(profiler.stacks)
+    if record['status'] != 'ok':
+        return record
+    if packed is not None:
+        record['num_outputs'] = sum(len(p) for p in packed.values())
+        score = score_packed_solution(packed, task)
+        record.update(passed=score['passed'], correct=score['correct'], total=score['total'])
+        return record
+    if result is None:
+        record.update(status='error', error='solver could not be loaded')
+        return record
+    sol = result.get('solution')
+    if isinstance(sol, dict) and set(sol) == {'error'}:
+        record.update(status='error', error=str(sol['error']))
+        return record
+    record['num_outputs'] = len(extract_outputs(sol, num_inputs=10))
+    score = score_solution(sol, task_obj, fast=not exact)
+    record.update(passed=score['passed'], correct=score['correct'], total=score['total'])
+    return record
+
+
+def run_parallel_sweep(solvers: List[Path], data_dir: Path, jobs: int, timeout: Optional[float] = 30.0, cache_dir: Optional[str] = None, profile_interval: Optional[float] = None, exact: bool = False) -> List[dict]:
+    """Run all solvers across a process pool and return records sorted by solver name.
+
+    Each solver gets `timeout` seconds inside its worker. If a worker dies (for
+    example a segfault or an out-of-memory kill) the pool breaks; the affected
+    solvers are then retried one at a time in fresh single-worker pools so the
+    culprit is reported as `crashed` without taking innocent solvers with it.
+    With `exact` the `correct`/`total` counts of `solve()`-only solvers cover
+    every example instead of stopping at the first mismatch.
+    """
+    def task_path_for(solver_path: Path) -> str:
+        return str(data_dir / (solver_path.stem + '.json'))
+
+    records: Dict[str, dict] = {}
+    broken: List[Path] = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [(s, pool.submit(_sweep_worker, str(s), task_path_for(s), timeout, cache_dir, profile_interval, exact)) for s in solvers]
+        for solver_path, fut in futures:
+            try:
+                records[solver_path.name] = fut.result()
+            except BrokenProcessPool:
+                broken.append(solver_path)
+            except Exception as e:
+                records[solver_path.name] = {'solver': solver_path.name, 'status': 'error', 'elapsed': 0.0, 'num_outputs': 0, 'passed': False, 'error': str(e)}
+
+    for solver_path in broken:
+        try:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                records[solver_path.name] = pool.submit(_sweep_worker, str(solver_path), task_path_for(solver_path), timeout, cache_dir, profile_interval, exact).result()
+        except BrokenProcessPool:
+            records[solver_path.name] = {'solver': solver_path.name, 'status': 'crashed', 'elapsed': 0.0, 'num_outputs': 0, 'passed': False, 'error': 'worker process died'}
+
+    return [records[name] for name in sorted(records)]
+
+
+def print_sweep_summary(records: List[dict]) -> None:
+    """Print one line per solver followed by status counts and total solver time."""
+    for rec in records:
+        verdict = 'PASS' if rec['passed'] else 'FAIL'
+        line = f"{rec['solver']:<16} {rec['status']:<8} {verdict}  {rec['elapsed'] * 1000:9.1f} ms  outputs={rec['num_outputs']}"
+        if rec['error']:
+            line += f"  ({rec['error']})"
+        print(line)
+    counts: Dict[str, int] = {}
+    for rec in records:
+        counts[rec['status']] = counts.get(rec['status'], 0) + 1
+    total = sum(rec['elapsed'] for rec in records)
+    passed = sum(1 for rec in records if rec['passed'])
+    status_text = ', '.join(f'{k}={counts[k]}' for k in sorted(counts))
+    print(f'Swept {len(records)} solvers ({status_text}); {passed} pass all examples; total solver time {total:.2f} s')
+
+
 def is_grid(obj: Any) -> bool:
     if not isinstance(obj, list) or not obj:
         return False
@@ -196,7 +455,7 @@ def extract_outputs(solution: Any, num_inputs: int) -> List[Any]:
 def prepare_visualization(original_task_path: Path, outputs: List[Any]) -> Optional[Path]:
     # load original task file
     try:
-        content = json.loads(original_task_path.read_text(encoding='utf-8'))
+        content = load_task(original_task_path)
     except Exception as e:
         print(f"Failed to read {original_task_path}: {e}")
         return None
@@ -235,14 +494,50 @@ def prepare_visualization(original_task_path: Path, outputs: List[Any]) -> Optio
     return Path(path)
 
 
+# matplotlib.pyplot, imported and configured by `get_pyplot` on the first figure.
+plt = None
+
+
+def get_pyplot(show: bool = True):
+    """Import matplotlib.pyplot on first use with a backend suited to `show`.
+
+    Headless runs get Agg; interactive runs try the common GUI backends when
+    the default one cannot open windows.
+    """
+    global plt
+    if plt is not None:
+        return plt
+    import matplotlib
+    try:
+        if not show:
+            matplotlib.use('Agg', force=True)
+        elif 'agg' in matplotlib.get_backend().lower():
+            for bk in ['Qt5Agg', 'Qt4Agg', 'TkAgg', 'GTK3Agg', 'MacOSX']:
+                try:
+                    import matplotlib.pyplot as _plt
+                    _plt.switch_backend(bk)
+                    break
+                except Exception as e:
+                    # try next
+                    print(f"Backend {bk} failed: {e}")
+            else:
+                print("Warning: no interactive backend found; plt.show may fail.\nIf you have an X server, install/configure Tk or Qt backends.")
+    except Exception as e:
+        print(f"Warning configuring matplotlib backend: {e}")
+    import matplotlib.pyplot as _plt
+    plt = _plt
+    return plt
+
+
 def visualize_textual_output(original_task_path: Path, solver_name: str, solution: Any, *, save_path: Optional[Path] = None, show: bool = True) -> None:
     """Show input grid on left and solver textual output on right."""
+    plt = get_pyplot(show)
     # Try to read the original task. If unavailable or malformed, fall back to a
     # textual-only visualization that shows the solver output.
     content = None
     trains = []
     try:
-        content = json.loads(original_task_path.read_text(encoding='utf-8'))
+        content = load_task(original_task_path)
         trains = content.get('train', []) if isinstance(content, dict) else []
     except Exception as e:
         print(f"Warning: failed to read {original_task_path}: {e} — showing textual-only visualization")
@@ -347,10 +642,11 @@ def visualize_numeric_output(original_task_path: Path, solver_name: str, numeric
     If the original task JSON contains a train input we show its short summary
     in the figure title for context.
     """
+    plt = get_pyplot(show)
     # try to read a small context from the task
     context_name = original_task_path.name
     try:
-        content = json.loads(original_task_path.read_text(encoding='utf-8'))
+        content = load_task(original_task_path)
         trains = content.get('train', []) if isinstance(content, dict) else []
         ctx = f" ({len(trains)} train examples)" if trains else ""
     except Exception:
@@ -393,30 +689,158 @@ def visualize_numeric_output(original_task_path: Path, solver_name: str, numeric
             pass
 
 
-def save_result_json(*, solver_path: Path, original_task_path: Path, raw_result: Any, numeric_lists: List[List[float]], grid_outputs: List[Any], out_dir: Path) -> Optional[Path]:
-    """Write a structured JSON file summarizing the solver run and extracted outputs.
+def collect_solvers(args) -> List[Path]:
+    """Resolve the list of solver scripts selected on the command line."""
+    if args.solver:
+        solvers = [Path(args.solver)]
+    else:
+        solvers = sorted(Path(args.dir).glob(args.pattern))
+    if args.max:
+        solvers = solvers[:args.max]
+    return solvers
 
-    Returns the Path to the JSON file or None on failure.
+
+def sweep_main(args) -> None:
+    """Entry point for `--jobs N`: parallel regression sweep without plotting."""
+    solvers = collect_solvers(args)
+    if not solvers:
+        print('No solver scripts found to run')
+        return
+    start = time.perf_counter()
+    interval = args.profile_interval if args.profile else None
+    records = run_parallel_sweep(solvers, find_data_dir() or Path('data'), args.jobs, timeout=args.timeout, cache_dir=args.grid_cache, profile_interval=interval, exact=bool(args.leaderboard))
+    print_sweep_summary(records)
+    print(f'Wall time {time.perf_counter() - start:.2f} s on {args.jobs} worker(s)')
+    if args.profile:
+        profiler = StackProfiler(interval)
+        for rec in records:
+            profiler.merge(rec.pop('stacks', None))
+        report_profile(profiler, Path(args.profile))
+    if args.leaderboard:
+        paths, run_id = {path.name: path for path in solvers}, new_run_id()
+        record_leaderboard(Path(args.leaderboard), [
+            dict(solver_path=paths[rec['solver']], passed=rec['passed'], correct=rec.get('correct'), total=rec.get('total'),
+                 ms=rec['elapsed'] * 1000, status=rec['status'], error=rec['error'], run=run_id)
+            for rec in records if rec['solver'] in paths])
+    if args.save:
+        out_dir = Path(args.out_dir)
+        try:
+            out_dir.mkdir(parents=True, exist_ok=True)
+            path = out_dir / 'sweep_summary.json'
+            path.write_text(json.dumps(records, ensure_ascii=False, indent=2))
+            print(f'Saved sweep summary to {path}')
+        except Exception as e:
+            print(f'Failed to write sweep summary: {e}')
+
+
+def score_main(args) -> None:
+    """Entry point for `--only-score`: run and score each solver, no figures.
+
+    Solvers with a `solve_grid` run on packed splits; others (and `--sandbox`
+    runs) go through `solve()`. With `--save` every run is still appended to
+    the results log.
     """
+    solvers = collect_solvers(args)
+    if not solvers:
+        print('No solver scripts found to run')
+        return
+    run_id = new_run_id()
+    results = ResultLog(Path(args.out_dir) / RESULTS_LOG, run_id=run_id) if args.save else None
+    pool = SandboxPool(args.sandbox, wall_seconds=args.timeout) if args.sandbox else None
+    profiler = StackProfiler(args.profile_interval) if args.profile and pool is None else None
+    cache = get_cache(args.grid_cache)
+    board = open_leaderboard(Path(args.leaderboard)) if args.leaderboard else None
+    records, recorded, total = [], 0, 0.0
+    try:
+        for solver_path in solvers:
+            task = solver_path.stem
+            start = time.perf_counter()
+            packed = None
+            if pool is not None:
+                solution = pool.run_task(solver_path, task)
+            else:
+                try:
+                    packed = run_solver_packed(solver_path, task, cache=cache, profiler=profiler)
+                    solution = {split: list(outputs) for split, outputs in packed.items()} if packed is not None else None
+                except Exception as e:
+                    solution = {'error': f'{type(e).__name__}: {e}'}
+                if solution is None:
+                    task_obj = load_task(task)
+                    result = run_solver_inprocess(solver_path, task_obj, cache=cache, profiler=profiler) if task_obj is not None else None
+                    solution = result.get('solution') if result else {'error': 'solver or task could not be loaded'}
+            elapsed = time.perf_counter() - start
+            total += elapsed
+            score = score_packed_solution(packed, task) if packed is not None else score_solution(solution, task)
+            score['task'] = task
+            score['error'] = solution.get('error') if isinstance(solution, dict) and set(solution) == {'error'} else None
+            records.append(score)
+            splits = ' '.join(f"{name}={s['correct']}/{s['total']}" for name, s in score['splits'].items())
+            line = f"{task:<10} {'PASS' if score['passed'] else 'FAIL'}  {splits}  {elapsed * 1000:9.1f} ms"
+            print(line + (f"  ({score['error']})" if score['error'] else ''))
+            if results is not None:
+                results.log(task, solver_path.name, solution, elapsed)
+            if board is not None:
+                recorded += record_evaluation(board, solver_path, score, elapsed, run_id)
+    finally:
+        if pool is not None:
+            pool.close()
+        if board is not None:
+            board.close()
+    if results is not None:
+        results.close()
+        print(f'Appended results to {results.path}')
+    if board is not None:
+        print(f'Recorded {recorded} evaluation(s) in {board.path}')
+    for split, agg in summarize(records).items():
+        print(f"{split:<8} {agg['correct']}/{agg['total']} examples exact ({agg['rate']:.1%})")
+    passed = sum(1 for r in records if r['passed'])
+    print(f'{passed}/{len(records)} tasks fully solved; total solver time {total:.2f} s')
+    if profiler is not None:
+        report_profile(profiler, Path(args.profile))
+
+
+def new_run_id() -> str:
+    return datetime.utcnow().strftime('%Y%m%dT%H%M%S')
+
+
+def record_leaderboard(path: Path, evaluations: List[dict]) -> None:
+    """Append `evaluations` (keyword dicts for `Leaderboard.record`) to the database at `path`."""
+    try:
+        with Leaderboard(path) as board:
+            board.record_many(evaluations)
+    except Exception as e:
+        print(f'Failed to update leaderboard {path}: {e}')
+        return
+    print(f'Recorded {len(evaluations)} evaluation(s) in {path}')
+
+
+def open_leaderboard(path: Path) -> Optional[Leaderboard]:
     try:
-        out_dir.mkdir(parents=True, exist_ok=True)
-        summary = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
-            'solver': str(solver_path),
-            'task': str(original_task_path),
-            'raw_result': raw_result,
-            'numeric_outputs': numeric_lists,
-            'grid_outputs': grid_outputs,
-        }
-        fname = f"{solver_path.stem}__{original_task_path.stem}.json"
-        path = out_dir / fname
-        path.write_text(json.dumps(summary, ensure_ascii=False, indent=2))
-        return path
+        return Leaderboard(path)
     except Exception as e:
-        print(f"Failed to write result JSON for {solver_path.name}: {e}")
+        print(f'Failed to open leaderboard {path}: {e}')
         return None
 
 
+def record_evaluation(board: Leaderboard, solver_path: Path, score: dict, elapsed: float, run_id: str) -> bool:
+    """Commit one scored run right away, so an interrupted run keeps what it finished."""
+    error = score.get('error')
+    try:
+        board.record(solver_path, score['passed'], score['correct'], score['total'], ms=elapsed * 1000,
+                     status='error' if error else 'ok', error=error, run=run_id)
+    except Exception as e:
+        print(f'Failed to record {solver_path.name} in {board.path}: {e}')
+        return False
+    return True
+
+
+def report_profile(profiler: StackProfiler, path: Path) -> None:
+    """Print the suite-wide top functions and write the collapsed stacks to `path`."""
+    print_top(profiler.stacks, interval=profiler.interval)
+    write_collapsed(path, profiler.stacks)
+    print(f'Wrote {len(profiler.stacks)} collapsed stacks to {path}')
+
+
 def main(argv=None):
     p = argparse.ArgumentParser()
     p.add_argument('solver', nargs='?', help='Path to a solver .py file. If omitted use --dir and pattern')
@@ -424,142 +848,145 @@ def main(argv=None):
     p.add_argument('--pattern', default='task*.py', help='Glob pattern for solvers in --dir')
     p.add_argument('--max', type=int, default=None, help='Limit number of solvers to run')
     p.add_argument('--visualizer', default='src/visualize_arc_tasks.py', help='Path to the visualizer script')
-    p.add_argument('--out-dir', default='output/visualizations', help='Directory to write JSON summaries and saved figures')
-    p.add_argument('--save', action='store_true', help='Save visualization PNGs and result JSONs to --out-dir')
+    p.add_argument('--out-dir', default='output/visualizations', help='Directory for results.jsonl and saved figures')
+    p.add_argument('--save', action='store_true', help='Save visualization PNGs and append run results to --out-dir/results.jsonl')
     p.add_argument('--no-show', action='store_true', help="Don't show matplotlib windows (useful for headless runs)")
+    p.add_argument('--subprocess', action='store_true', help='Run each solver in its own interpreter instead of importing it (isolates crashes, much slower)')
+    p.add_argument('--sandbox', type=int, default=None, metavar='N', help='Run solvers grid by grid on N warm, resource-limited sandbox workers (see sandbox.py)')
+    p.add_argument('--jobs', type=int, default=None, help='Sweep solvers across N worker processes and print a summary instead of visualizing')
+    p.add_argument('--only-score', action='store_true', help='Run and score solvers in-process without any plotting (never imports matplotlib)')
+    p.add_argument('--timeout', type=float, default=30.0, help='Per-solver time limit in seconds for --jobs sweeps')
+    p.add_argument('--grid-cache', nargs='?', const=DEFAULT_CACHE_DIR, default=None, metavar='DIR', help=f'Memoize solve_grid results per (solver source, grid) in DIR (default {DEFAULT_CACHE_DIR})')
+    p.add_argument('--profile', nargs='?', const=DEFAULT_PROFILE, default=None, metavar='FILE', help=f'Sample solve_grid stacks, print the top functions and write collapsed stacks to FILE (default {DEFAULT_PROFILE}); in-process runs only')
+    p.add_argument('--leaderboard', nargs='?', const=LEADERBOARD_DB, default=None, metavar='DB', help=f'Record size, pass rate and runtime of every evaluated solver in the SQLite DB (default {LEADERBOARD_DB}); see leaderboard.py')
+    p.add_argument('--profile-interval', type=float, default=DEFAULT_INTERVAL, metavar='SEC', help='CPU-time sampling interval for --profile')
     args = p.parse_args(argv)
 
-    # Configure matplotlib backend depending on whether we will show figures.
-    global plt
-    try:
-        if args.no_show:
-            # headless / no interactive display
-            matplotlib.use('Agg', force=True)
-            import matplotlib.pyplot as _plt
-            importlib.reload(_plt)
-            plt = _plt
-        else:
-            # try common interactive backends until one works
-            current = matplotlib.get_backend()
-            interactive_try = ['Qt5Agg', 'Qt4Agg', 'TkAgg', 'GTK3Agg', 'MacOSX']
-            set_backend = None
-            if 'agg' in current.lower():
-                for bk in interactive_try:
-                    try:
-                        matplotlib.use(bk, force=True)
-                        import matplotlib.pyplot as _plt
-                        importlib.reload(_plt)
-                        plt = _plt
-                        set_backend = bk
-                        break
-                    except Exception as e:
-                        # try next
-                        print(f"Backend {bk} failed: {e}")
-                if set_backend is None:
-                    # fallback: use whatever backend is set but warn
-                    import matplotlib.pyplot as _plt
-                    plt = _plt
-                    print("Warning: no interactive backend found; plt.show may fail.\nIf you have an X server, install/configure Tk or Qt backends.")
-            else:
-                import matplotlib.pyplot as _plt
-                plt = _plt
-    except Exception as e:
-        print(f"Warning configuring matplotlib backend: {e}")
-        try:
-            import matplotlib.pyplot as _plt
-            plt = _plt
-        except Exception:
-            plt = None
+    if args.jobs:
+        return sweep_main(args)
+    if args.only_score:
+        return score_main(args)
 
-    solvers: List[Path] = []
-    if args.solver:
-        solvers = [Path(args.solver)]
-    else:
-        d = Path(args.dir)
-        solvers = sorted(list(d.glob(args.pattern)))
-    if args.max:
-        solvers = solvers[:args.max]
+    solvers = collect_solvers(args)
     if not solvers:
         print('No solver scripts found to run')
         return
 
-    for solver_path in solvers:
-        print(f'Running solver: {solver_path.name}')
-        result = run_solver(solver_path)
-        if not result:
-            continue
-        # sol can be either a dict with a 'solution' key (common generated solvers)
-        # or the solver may print a JSON value directly (list/array for grids).
-        sol = result.get('solution') if isinstance(result, dict) else result
-        # resolve original task json path
-        json_name = solver_path.name.rsplit('.', 1)[0] + '.json'
-        orig = Path('data') / json_name
-        if not orig.exists():
-            print(f'Original JSON {orig} not found; skipping visualization')
-            continue
-        outputs = extract_outputs(sol, num_inputs=10)
-        numeric = []
-        if not outputs:
-            # try numeric outputs
-            numeric = extract_numeric_outputs(sol)
-
-        # prepare output directory and save JSON summary if requested
-        out_dir = Path(args.out_dir)
-        json_summary_path = None
-        try:
-            if args.save:
-                json_summary_path = save_result_json(
-                    solver_path=solver_path,
-                    original_task_path=orig,
-                    raw_result=result,
-                    numeric_lists=numeric,
-                    grid_outputs=outputs,
-                    out_dir=out_dir,
-                )
-        except Exception as e:
-            print(f"Failed to write summary JSON: {e}")
+    timings: List[tuple] = []
+    run_id = new_run_id()
+    board = open_leaderboard(Path(args.leaderboard)) if args.leaderboard else None
+    recorded = 0
+    results = ResultLog(Path(args.out_dir) / RESULTS_LOG, run_id=run_id) if args.save else None
+    pool = SandboxPool(args.sandbox, wall_seconds=args.timeout) if args.sandbox else None
+    profiler = StackProfiler(args.profile_interval) if args.profile else None
+    if profiler is not None and (args.subprocess or pool is not None):
+        print('Warning: --profile only samples in-process runs; ignored with --subprocess/--sandbox')
+        profiler = None
+    try:
+        for solver_path in solvers:
+            print(f'Running solver: {solver_path.name}')
+            # resolve original task json path
+            json_name = solver_path.name.rsplit('.', 1)[0] + '.json'
+            orig = task_path(json_name) or Path('data') / json_name
+            start = time.perf_counter()
+            if args.subprocess:
+                result = run_solver(solver_path)
+            else:
+                if not orig.exists():
+                    print(f'Original JSON {orig} not found; skipping solver')
+                    continue
+                try:
+                    task_obj = load_task(orig)
+                except Exception as e:
+                    print(f"Failed to read {orig}: {e}")
+                    continue
+                if pool is not None:
+                    result = {'task': json_name, 'solution': pool.run_task(solver_path, orig)}
+                else:
+                    result = run_solver_inprocess(solver_path, task_obj, cache=get_cache(args.grid_cache), profiler=profiler)
+            elapsed = time.perf_counter() - start
+            timings.append((solver_path.name, elapsed))
+            print(f'  {solver_path.name} finished in {elapsed * 1000:.1f} ms')
+            if not result:
+                continue
+            # sol can be either a dict with a 'solution' key (common generated solvers)
+            # or the solver may print a JSON value directly (list/array for grids).
+            sol = result.get('solution') if isinstance(result, dict) else result
+            if not orig.exists():
+                print(f'Original JSON {orig} not found; skipping visualization')
+                continue
+            outputs = extract_outputs(sol, num_inputs=10)
+            numeric = []
+            if not outputs:
+                # try numeric outputs
+                numeric = extract_numeric_outputs(sol)
+
+            out_dir = Path(args.out_dir)
+            if results is not None:
+                try:
+                    results.log(solver_path.stem, solver_path.name, sol, elapsed)
+                except Exception as e:
+                    print(f"Failed to log result for {solver_path.name}: {e}")
+            if board is not None:
+                score = score_solution(sol, orig)
+                score['error'] = sol.get('error') if isinstance(sol, dict) and set(sol) == {'error'} else None
+                recorded += record_evaluation(board, solver_path, score, elapsed, run_id)
+
+            if outputs:
+                vis_path = prepare_visualization(orig, outputs)
+                if not vis_path:
+                    print(f'Failed to prepare visualization data for {solver_path.name}; using textual fallback')
+                    # save textual figure if requested
+                    save_path = None
+                    if args.save:
+                        save_path = out_dir / f"{solver_path.stem}__textual.png"
+                    visualize_textual_output(orig, solver_path.name, sol, save_path=save_path, show=not args.no_show)
+                    continue
+                if args.no_show:
+                    # headless: paint the paired grids straight to PNG, no subprocess
+                    if args.save:
+                        paired = json.loads(vis_path.read_text(encoding='utf-8'))
+                        pairs = [(ex['input'], ex['output']) for ex in paired.get('train', [])]
+                        for png in render_pairs(f"{solver_path.stem}__grids", pairs, out_dir):
+                            print(f"Saved grid visualization to {png}")
+                    continue
+                # interactive mode: call visualizer script (legacy ARC visualizer) which will show windows
+                try:
+                    subprocess.run([sys.executable, args.visualizer, str(vis_path)], check=True)
+                except subprocess.CalledProcessError as e:
+                    print(f'Visualizer failed: {e}')
+                continue
 
-        if outputs:
-            vis_path = prepare_visualization(orig, outputs)
-            if not vis_path:
-                print(f'Failed to prepare visualization data for {solver_path.name}; using textual fallback')
-                # save textual figure if requested
+            # if we reach here, no grid outputs; check numeric
+            if numeric:
                 save_path = None
                 if args.save:
-                    save_path = out_dir / f"{solver_path.stem}__textual.png"
-                visualize_textual_output(orig, solver_path.name, sol, save_path=save_path, show=not args.no_show)
+                    save_path = out_dir / f"{solver_path.stem}__numeric.png"
+                visualize_numeric_output(orig, solver_path.name, numeric, save_path=save_path, show=not args.no_show)
                 continue
-            # call visualizer script (legacy ARC visualizer) if available
-            try:
-                if args.save:
-                    # run visualizer but also save a PNG using matplotlib by loading vis_path JSON
-                    # to keep behavior simple, call the visualizer which opens a window; if no-show requested skip calling it
-                    if not args.no_show:
-                        subprocess.run([sys.executable, args.visualizer, str(vis_path)], check=True)
-                    else:
-                        # still call visualizer without showing (best-effort); some visualizers may not support headless
-                        subprocess.run([sys.executable, args.visualizer, str(vis_path)], check=True)
-                else:
-                    # interactive mode: call visualizer which will show windows
-                    subprocess.run([sys.executable, args.visualizer, str(vis_path)], check=True)
-            except subprocess.CalledProcessError as e:
-                print(f'Visualizer failed: {e}')
-            continue
 
-        # if we reach here, no grid outputs; check numeric
-        if numeric:
+            # fallback: textual visualization
             save_path = None
             if args.save:
-                save_path = out_dir / f"{solver_path.stem}__numeric.png"
-            visualize_numeric_output(orig, solver_path.name, numeric, save_path=save_path, show=not args.no_show)
-            continue
-
-        # fallback: textual visualization
-        save_path = None
-        if args.save:
-            save_path = out_dir / f"{solver_path.stem}__textual.png"
-        print(f'No grid-like or numeric outputs extracted from solver {solver_path.name}; using textual fallback')
-        visualize_textual_output(orig, solver_path.name, sol, save_path=save_path, show=not args.no_show)
+                save_path = out_dir / f"{solver_path.stem}__textual.png"
+            print(f'No grid-like or numeric outputs extracted from solver {solver_path.name}; using textual fallback')
+            visualize_textual_output(orig, solver_path.name, sol, save_path=save_path, show=not args.no_show)
+    finally:
+        if pool is not None:
+            pool.close()
+        if board is not None:
+            board.close()
+    if results is not None:
+        results.close()
+        print(f'Appended results to {results.path}')
+    if board is not None:
+        print(f'Recorded {recorded} evaluation(s) in {board.path}')
+    if timings:
+        total = sum(t for _, t in timings)
+        slowest_name, slowest = max(timings, key=lambda x: x[1])
+        print(f'Ran {len(timings)} solvers in {total:.2f} s (slowest: {slowest_name}, {slowest * 1000:.1f} ms)')
+    if profiler is not None:
+        report_profile(profiler, Path(args.profile))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Sandboxed solver execution on a pool of warm, long-lived worker processes.
+
+`run_solver` isolates a solver by booting a fresh interpreter per task; this
+module keeps `workers` processes alive instead (forked after numpy is
+imported, so each one starts warm) and feeds them `(solver path, grid)` jobs.
+Every job runs under per-job limits:
+  - CPU time: the soft `RLIMIT_CPU` is set to the worker's usage so far plus
+    `cpu_seconds`; the resulting SIGXCPU aborts just that job,
+  - memory: the soft `RLIMIT_AS` is lowered to `memory_mb` for the job, so a
+    runaway allocation raises MemoryError inside the solver,
+  - wall clock: the parent kills a worker that does not answer within
+    `wall_seconds` (e.g. a solver blocked in a sleep or a syscall).
+A worker that dies (segfault, kill, limit overrun) or hits a memory error is
+replaced by a fresh one and only its current job is reported as failed.
+Workers are also recycled after `max_jobs` jobs to bound leaks.
+
+Each job calls the solver's `solve_grid(np.ndarray)`; template solvers
+without it are run through `solve({'test': [{'input': grid}]})` instead.
+Grids cross the pipes as `grid_codec` blobs rather than pickled arrays.
+
+Usage examples (from repo root):
+  # Run every solver's tasks on 8 sandboxed workers and score them
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/sandbox.py --dir NeurIPS_2025_Google_Code_Golf_Championship/generated_solver --workers 8
+
+  # Tight limits for untrusted synthesized solvers
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/sandbox.py path/to/task042.py --cpu 1 --memory 512
+"""
+from __future__ import annotations
+import argparse
+import importlib.util
+import multiprocessing
+import os
+import signal
+import time
+from collections import deque
+from multiprocessing.connection import wait
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # not available on Windows; only the wall-clock limit applies
+    resource = None
+
+from grid_codec import decode, encode
+from scorer import split_outputs
+from task_loader import SPLITS, load_task_arrays
+
+Job = Tuple[str, Any]
+# Failures after which the remaining grids of a task are not worth running.
+FATAL = ('timeout', 'memory', 'crashed')
+
+
+class CpuLimitExceeded(BaseException):
+    """Raised in a worker by SIGXCPU; BaseException so solvers cannot catch it."""
+
+
+def _raise_cpu_limit(signum, frame):
+    raise CpuLimitExceeded()
+
+
+# --- worker side ---------------------------------------------------------------
+
+_MODULES: Dict[str, Tuple[int, ModuleType]] = {}
+
+
+def _load(path: str) -> ModuleType:
+    """Import a solver by path, re-importing it when the file changes."""
+    mtime = os.stat(path).st_mtime_ns
+    cached = _MODULES.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    spec = importlib.util.spec_from_file_location(f'arc_sandboxed_{Path(path).stem}', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    _MODULES[path] = (mtime, module)
+    return module
+
+
+def _call(path: str, grid: np.ndarray) -> np.ndarray:
+    module = _load(path)
+    solve_grid = getattr(module, 'solve_grid', None)
+    if callable(solve_grid):
+        out = solve_grid(grid.astype(np.int64))  # solvers expect what np.array(list) gives
+    else:
+        outputs = split_outputs(module.solve({'test': [{'input': grid.tolist()}]}), 'test')
+        if not outputs or outputs[0] is None:
+            raise ValueError('solve() returned no output grid')
+        out = outputs[0]
+    out = np.asarray(out)
+    if out.ndim != 2 or out.dtype.kind not in 'iub':
+        raise ValueError(f'solver returned {out.dtype} array of shape {out.shape}, not a grid')
+    return out.astype(np.uint8)
+
+
+def _set_limits(cpu_seconds: Optional[float], memory_bytes: Optional[int]) -> None:
+    if resource is None:
+        return
+    if cpu_seconds:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        hard = resource.getrlimit(resource.RLIMIT_CPU)[1]
+        soft = int(usage.ru_utime + usage.ru_stime + cpu_seconds + 0.999)
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+    if memory_bytes:
+        hard = resource.getrlimit(resource.RLIMIT_AS)[1]
+        resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, hard))
+
+
+def _clear_limits() -> None:
+    if resource is None:
+        return
+    for limit in (resource.RLIMIT_CPU, resource.RLIMIT_AS):
+        hard = resource.getrlimit(limit)[1]
+        resource.setrlimit(limit, (hard, hard))
+
+
+def _worker_main(conn, cpu_seconds: Optional[float], memory_bytes: Optional[int]) -> None:
+    if hasattr(signal, 'SIGXCPU'):
+        signal.signal(signal.SIGXCPU, _raise_cpu_limit)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # the parent handles Ctrl-C
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            return
+        if job is None:
+            return
+        path, grid = job
+        out, error, status = None, None, 'ok'
+        start = time.perf_counter()
+        try:
+            _set_limits(cpu_seconds, memory_bytes)
+            out = encode(_call(path, decode(grid) if isinstance(grid, bytes) else grid))
+        except CpuLimitExceeded:
+            status, error = 'timeout', f'exceeded {cpu_seconds:g} s of CPU time'
+        except MemoryError:
+            status, error = 'memory', 'exceeded the memory limit'
+        except Exception as e:
+            status, error = 'error', f'{type(e).__name__}: {e}'
+        finally:
+            _clear_limits()
+        conn.send((status, out, error, time.perf_counter() - start))
+
+
+# --- parent side ---------------------------------------------------------------
+
+def _exit_reason(code: Optional[int]) -> str:
+    if code is None:
+        return 'still running'
+    if code < 0:
+        try:
+            return f'killed by {signal.Signals(-code).name}'
+        except ValueError:
+            return f'killed by signal {-code}'
+    return f'exit code {code}'
+
+
+class _Worker:
+    def __init__(self, ctx, cpu_seconds, memory_bytes):
+        self._args = (ctx, cpu_seconds, memory_bytes)
+        self.jobs_done = 0
+        self.start()
+
+    def start(self) -> None:
+        ctx, cpu_seconds, memory_bytes = self._args
+        self.conn, child = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child, cpu_seconds, memory_bytes), daemon=True)
+        self.process.start()
+        child.close()
+        self.jobs_done = 0
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def restart(self) -> None:
+        self.kill()
+        self.start()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=1)
+        self.kill()
+
+
+class SandboxPool:
+    """A fixed-size pool of warm worker processes for `(solver path, grid)` jobs.
+
+    Results are dicts `{'status', 'output', 'error', 'elapsed'}` with status
+    one of ok, error, timeout, memory, crashed or skipped.
+    """
+
+    def __init__(self, workers: int = 0, cpu_seconds: Optional[float] = 10.0, memory_mb: Optional[int] = 2048,
+                 wall_seconds: Optional[float] = 30.0, max_jobs: int = 1000):
+        methods = multiprocessing.get_all_start_methods()
+        self._ctx = multiprocessing.get_context('fork' if 'fork' in methods else 'spawn')
+        self.cpu_seconds = cpu_seconds
+        self.wall_seconds = wall_seconds
+        self.max_jobs = max_jobs
+        memory_bytes = memory_mb * 1024 * 1024 if memory_mb else None
+        self._workers = [_Worker(self._ctx, cpu_seconds, memory_bytes) for _ in range(workers or os.cpu_count() or 1)]
+        self.recycled = 0
+
+    def __enter__(self) -> 'SandboxPool':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for w in self._workers:
+            w.stop()
+        self._workers = []
+
+    def _recycle(self, worker: _Worker) -> None:
+        worker.restart()
+        self.recycled += 1
+
+    @staticmethod
+    def _skip(pending: deque, results: List[Optional[dict]], status: str) -> None:
+        while pending:
+            results[pending.popleft()] = {'status': 'skipped', 'output': None, 'error': f'skipped after a {status}', 'elapsed': 0.0}
+
+    def map(self, jobs: Sequence[Job], fail_fast: bool = False) -> List[dict]:
+        """Run all jobs across the pool and return their results in job order.
+
+        With `fail_fast`, jobs not yet started when one ends in a FATAL status
+        are reported as `skipped` instead of being run.
+        """
+        results: List[Optional[dict]] = [None] * len(jobs)
+        pending = deque(range(len(jobs)))
+        busy: Dict[int, Tuple[_Worker, int, float]] = {}  # fileno -> (worker, job index, deadline)
+        idle = list(self._workers)
+        while pending or busy:
+            while pending and idle:
+                worker = idle.pop()
+                index = pending.popleft()
+                path, grid = jobs[index]
+                try:
+                    blob = encode(grid)
+                except ValueError:
+                    blob = np.asarray(grid)
+                try:
+                    worker.conn.send((str(path), blob))
+                except (BrokenPipeError, OSError):
+                    self._recycle(worker)
+                    pending.appendleft(index)
+                    idle.append(worker)
+                    continue
+                deadline = time.monotonic() + self.wall_seconds if self.wall_seconds else float('inf')
+                busy[worker.conn.fileno()] = (worker, index, deadline)
+
+            now = time.monotonic()
+            timeout = max(0.0, min(d for _, _, d in busy.values()) - now) if busy else 0.0
+            ready = wait([w.conn for w, _, _ in busy.values()], timeout=None if timeout == float('inf') else timeout)
+            for conn in ready:
+                worker, index, _ = busy.pop(conn.fileno())
+                try:
+                    status, out, error, elapsed = conn.recv()
+                except (EOFError, OSError):
+                    # the pipe closes a moment before the process is reaped
+                    worker.process.join(timeout=1)
+                    status, out, error, elapsed = 'crashed', None, f'worker died ({_exit_reason(worker.process.exitcode)})', 0.0
+                results[index] = {'status': status, 'output': decode(out) if out is not None else None, 'error': error, 'elapsed': elapsed}
+                if fail_fast and status in FATAL:
+                    self._skip(pending, results, status)
+                worker.jobs_done += 1
+                if status in ('crashed', 'memory') or worker.jobs_done >= self.max_jobs:
+                    self._recycle(worker)
+                idle.append(worker)
+
+            now = time.monotonic()
+            for fileno, (worker, index, deadline) in list(busy.items()):
+                if now >= deadline:
+                    del busy[fileno]
+                    results[index] = {'status': 'timeout', 'output': None, 'error': f'exceeded {self.wall_seconds:g} s wall time', 'elapsed': self.wall_seconds}
+                    if fail_fast:
+                        self._skip(pending, results, 'timeout')
+                    self._recycle(worker)
+                    idle.append(worker)
+        return results
+
+    def run_task(self, solver_path: Path, task: Any = None, fail_fast: bool = True) -> dict:
+        """Run a solver on every input of its task (name or path; default: the
+        solver's own) and return a `solve()`-shaped solution.
+
+        Failed examples get an `output` of None plus `status`/`error` keys.
+        By default the rest of a task is skipped after a timeout, memory
+        error or crash, so one hopeless solver does not hold up the run.
+        """
+        arrays = load_task_arrays(task if task is not None else Path(solver_path).stem) or {}
+        index = [(split, i) for split in SPLITS for i in range(len(arrays.get(split, [])))]
+        results = self.map([(str(solver_path), arrays[split][i][0]) for split, i in index], fail_fast=fail_fast)
+        solution: Dict[str, list] = {split: [] for split in SPLITS if split in arrays}
+        for (split, i), res in zip(index, results):
+            example = {'input': arrays[split][i][0].tolist(),
+                       'output': res['output'].tolist() if res['output'] is not None else None}
+            if res['status'] != 'ok':
+                example.update(status=res['status'], error=res['error'])
+            solution[split].append(example)
+        return solution
+
+
+def main(argv=None) -> int:
+    from scorer import score_solution
+
+    p = argparse.ArgumentParser(description='Evaluate solvers on a warm, resource-limited worker pool')
+    p.add_argument('solver', nargs='?', help='A single solver file')
+    p.add_argument('--dir', default=str(Path(__file__).parent / 'generated_solver'), help='Directory with solver scripts')
+    p.add_argument('--pattern', default='task*.py', help='Glob pattern for solvers in --dir')
+    p.add_argument('--max', type=int, default=None, help='Limit number of solvers')
+    p.add_argument('--workers', type=int, default=0, help='Worker processes (default: CPU count)')
+    p.add_argument('--cpu', type=float, default=10.0, help='CPU seconds per grid')
+    p.add_argument('--memory', type=int, default=2048, help='Address-space limit per job in MiB')
+    p.add_argument('--wall', type=float, default=30.0, help='Wall-clock seconds per grid before the worker is killed')
+    args = p.parse_args(argv)
+
+    solvers = [Path(args.solver)] if args.solver else sorted(Path(args.dir).glob(args.pattern))
+    if args.max:
+        solvers = solvers[:args.max]
+    if not solvers:
+        print('No solver scripts found')
+        return 2
+    start = time.perf_counter()
+    passed = 0
+    with SandboxPool(args.workers, cpu_seconds=args.cpu, memory_mb=args.memory, wall_seconds=args.wall) as pool:
+        for solver in solvers:
+            solution = pool.run_task(solver)
+            failures = [ex for split in solution.values() for ex in split if 'status' in ex]
+            ok = score_solution(solution, solver.stem, fast=True)['passed']
+            passed += ok
+            line = f"{solver.stem:<10} {'PASS' if ok else 'FAIL'}"
+            if failures:
+                line += f"  {len(failures)} failed grid(s), first: {failures[0]['status']} ({failures[0]['error']})"
+            print(line)
+        recycled = pool.recycled
+    print(f'{passed}/{len(solvers)} tasks pass; {recycled} worker(s) recycled; {time.perf_counter() - start:.2f} s')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Score solver outputs against the expected outputs stored in each task JSON.
+
+Every produced grid is compared with the expected grid as a uint8 array: a
+shape check first, then a vectorized cell-by-cell equality. The scorer
+reports exact-match rates per split (train/test/arc-gen) and per task. In
+fast mode a task stops at its first mismatching example, which is all a
+pass/fail regression check needs. Stream mode (`--stream`) goes further:
+examples are fed one at a time to the solver's `solve_grid()` (or a golfed
+`p()`), so the full solution is never built and an unsound solver fails on
+its first wrong example.
+
+Usage examples (from repo root):
+  # Score every solver, full per-split report
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/scorer.py --dir NeurIPS_2025_Google_Code_Golf_Championship/generated_solver
+
+  # Pass/fail only, stop each task at its first wrong example, 8 processes
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/scorer.py --fast --jobs 8
+
+  # Stress-check golfed submissions: one grid at a time, stop at the first mismatch
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/scorer.py --stream --dir output/submission --jobs 8
+
+  # Re-score while golfing; unchanged solvers are served from the grid cache
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/scorer.py --grid-cache
+"""
+from __future__ import annotations
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from grid_cache import DEFAULT_CACHE_DIR, get_cache
+from task_loader import SPLITS, PackedSplit, load_task, load_task_arrays, load_task_packed
+
+
+def as_grid(obj: Any) -> Optional[np.ndarray]:
+    """Convert a produced grid (nested lists or array) to a 2D uint8 array, or None."""
+    try:
+        a = np.asarray(obj)
+    except Exception:
+        return None
+    if a.ndim != 2 or a.size == 0 or a.dtype.kind not in 'iub':
+        return None
+    if a.dtype != np.uint8:
+        if a.min() < 0 or a.max() > 255:
+            return None
+        a = a.astype(np.uint8)
+    return a
+
+
+def grids_equal(got: Any, expected: np.ndarray) -> bool:
+    """Exact match: same shape and every cell equal."""
+    g = as_grid(got)
+    return g is not None and g.shape == expected.shape and bool(np.array_equal(g, expected))
+
+
+def split_outputs(solution: Any, split: str) -> Optional[List[Any]]:
+    """Return the produced grids for `split`, accepting both solver output styles.
+
+    Solvers return `{split: [{'input': ..., 'output': grid}, ...]}`; a plain
+    list of grids per split is accepted as well.
+    """
+    if not isinstance(solution, dict) or not isinstance(solution.get(split), list):
+        return None
+    return [ex.get('output') if isinstance(ex, dict) else ex for ex in solution[split]]
+
+
+def score_split(produced: Optional[List[Any]], expected: List[np.ndarray], fast: bool = False) -> dict:
+    """Score one split. `expected` holds the expected output arrays."""
+    total = len(expected)
+    result = {'total': total, 'correct': 0, 'cells': 0, 'cells_correct': 0, 'first_mismatch': None}
+    if produced is None:
+        result['first_mismatch'] = 0 if total else None
+        return result
+    for i, want in enumerate(expected):
+        got = as_grid(produced[i]) if i < len(produced) else None
+        result['cells'] += want.size
+        if got is not None and got.shape == want.shape:
+            same = int(np.count_nonzero(got == want))
+            result['cells_correct'] += same
+            if same == want.size:
+                result['correct'] += 1
+                continue
+        if result['first_mismatch'] is None:
+            result['first_mismatch'] = i
+        if fast:
+            break
+    return result
+
+
+def score_packed(produced: Optional[PackedSplit], expected: PackedSplit) -> dict:
+    """Score one split held as PackedSplits; same result keys as `score_split`.
+
+    When every produced shape matches, the whole split is compared with a
+    single vectorized `!=` over the two flat buffers.
+    """
+    total = len(expected)
+    sizes = np.diff(expected.offsets)
+    result = {'total': total, 'correct': 0, 'cells': int(sizes.sum()), 'cells_correct': 0, 'first_mismatch': None}
+    if produced is None:
+        result['first_mismatch'] = 0 if total else None
+        return result
+    n = min(len(produced), total)
+    same_shape = np.zeros(total, dtype=bool)
+    same_shape[:n] = (produced.shapes[:n] == expected.shapes[:n]).all(axis=1)
+    wrong = sizes.copy()
+    if same_shape.all():
+        diff = np.concatenate([[0], np.cumsum(produced.data[:len(expected.data)] != expected.data)])
+        wrong = diff[expected.offsets[1:]] - diff[expected.offsets[:-1]]
+    else:
+        for i in np.flatnonzero(same_shape):
+            wrong[i] = np.count_nonzero(produced[i] != expected[i])
+    ok = same_shape & (wrong == 0)
+    result['correct'] = int(ok.sum())
+    result['cells_correct'] = int((sizes - wrong)[same_shape].sum())
+    if not ok.all():
+        result['first_mismatch'] = int(np.argmin(ok))
+    return result
+
+
+def score_solution(solution: Any, task: Any, fast: bool = False) -> dict:
+    """Score a full solution against a task (name, path or parsed dict).
+
+    Returns `{'splits': {split: {...}}, 'correct', 'total', 'rate', 'passed'}`.
+    In fast mode scoring stops at the first mismatch in any split, so `rate`
+    is only a lower bound; `passed` is always exact.
+    """
+    arrays = load_task_arrays(task) if not isinstance(task, dict) else _task_arrays(task)
+    record = {'splits': {}, 'correct': 0, 'total': 0, 'rate': 0.0, 'passed': False}
+    if not arrays:
+        return record
+    failed = False
+    for split in SPLITS:
+        if split not in arrays:
+            continue
+        expected = [out for _, out in arrays[split]]
+        if failed and fast:
+            s = {'total': len(expected), 'correct': 0, 'cells': 0, 'cells_correct': 0, 'first_mismatch': None}
+        else:
+            s = score_split(split_outputs(solution, split), expected, fast=fast)
+        failed = failed or s['correct'] < s['total']
+        s['rate'] = s['correct'] / s['total'] if s['total'] else 1.0
+        record['splits'][split] = s
+        record['correct'] += s['correct']
+        record['total'] += s['total']
+    record['rate'] = record['correct'] / record['total'] if record['total'] else 0.0
+    record['passed'] = record['total'] > 0 and not failed
+    return record
+
+
+def score_packed_solution(outputs: Dict[str, PackedSplit], task: Any) -> dict:
+    """`score_solution` for packed outputs (`{split: PackedSplit}`) of a task name or path."""
+    packed = load_task_packed(task) or {}
+    record = {'splits': {}, 'correct': 0, 'total': 0, 'rate': 0.0, 'passed': False}
+    for split, (_, expected) in packed.items():
+        s = score_packed(outputs.get(split), expected)
+        s['rate'] = s['correct'] / s['total'] if s['total'] else 1.0
+        record['splits'][split] = s
+        record['correct'] += s['correct']
+        record['total'] += s['total']
+    record['rate'] = record['correct'] / record['total'] if record['total'] else 0.0
+    record['passed'] = record['total'] > 0 and record['correct'] == record['total']
+    return record
+
+
+def _task_arrays(task: dict) -> Dict[str, list]:
+    arrays = {}
+    for split in SPLITS:
+        if isinstance(task.get(split), list):
+            arrays[split] = [(None, as_grid(ex['output'])) for ex in task[split]]
+    return arrays
+
+
+def score_solver(solver_path: Path, fast: bool = False, cache_dir: Optional[str] = None) -> dict:
+    """Run a solver in-process on its task and score the result.
+
+    Solvers with a `solve_grid` run on packed splits and are scored with
+    `score_packed`; `solve()`-only solvers go through `score_solution`. With
+    `cache_dir`, `solve_grid` results are memoized via `grid_cache`.
+    """
+    from run_and_visualize import run_solver_inprocess, run_solver_packed
+
+    try:
+        outputs = run_solver_packed(solver_path, solver_path.stem, cache=get_cache(cache_dir))
+    except Exception as e:
+        outputs = None
+        error = f'{type(e).__name__}: {e}'
+    else:
+        error = None
+    if outputs is not None or error is not None:
+        record = score_packed_solution(outputs or {}, solver_path.stem)
+        record['task'] = solver_path.stem
+        record['error'] = error
+        return record
+    task = load_task(solver_path.stem)
+    if task is None:
+        return {'task': solver_path.stem, 'error': 'task JSON not found', 'splits': {}, 'correct': 0, 'total': 0, 'rate': 0.0, 'passed': False}
+    result = run_solver_inprocess(solver_path, task, cache=get_cache(cache_dir))
+    solution = result.get('solution') if result else None
+    record = score_solution(solution, solver_path.stem, fast=fast)
+    record['task'] = solver_path.stem
+    record['error'] = solution.get('error') if isinstance(solution, dict) and set(solution) == {'error'} else None
+    return record
+
+
+def _score_worker(args: tuple) -> dict:
+    return score_solver(*args)
+
+
+def score_all(solvers: List[Path], fast: bool = False, jobs: int = 1, cache_dir: Optional[str] = None) -> List[dict]:
+    """Score many solvers, optionally across processes, sorted by task name."""
+    work = [(s, fast, cache_dir) for s in solvers]
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            records = list(pool.map(_score_worker, work, chunksize=8))
+    else:
+        records = [_score_worker(w) for w in work]
+    return sorted(records, key=lambda r: r['task'])
+
+
+def iter_examples(task: Any, splits: Sequence[str] = SPLITS) -> Iterator[Tuple[str, int, np.ndarray, np.ndarray]]:
+    """Yield `(split, index, input, expected)` one example at a time."""
+    arrays = load_task_arrays(task) or {}
+    for split in splits:
+        for i, (inp, out) in enumerate(arrays.get(split, [])):
+            yield split, i, inp, out
+
+
+def grid_function(module: Any) -> Optional[Callable[[np.ndarray], Any]]:
+    """Per-grid entry point of a solver: `solve_grid(array)`, a golfed `p(list)`,
+    or, failing both, `solve()` on a one-example task."""
+    solve_grid = getattr(module, 'solve_grid', None)
+    if callable(solve_grid):
+        return solve_grid
+    p = getattr(module, 'p', None)
+    if callable(p):
+        return lambda grid: p(grid.tolist())
+    solve = getattr(module, 'solve', None)
+    if callable(solve):
+        def one(grid):
+            outputs = split_outputs(solve({'test': [{'input': grid.tolist()}]}), 'test')
+            return outputs[0] if outputs else None
+        return one
+    return None
+
+
+def stream_verify(solver_path: Path, splits: Sequence[str] = SPLITS) -> dict:
+    """Check a solver example by example and stop at the first wrong output.
+
+    Nothing is accumulated: each input goes through the solver's per-grid
+    function, is compared and dropped, so an unsound solver fails after one
+    call instead of after building its whole solution.
+    """
+    from run_and_visualize import load_solver_module
+
+    record = {'task': solver_path.stem, 'passed': False, 'checked': 0, 'failure': None, 'error': None, 'ms': 0.0}
+    module = load_solver_module(solver_path)
+    fn = grid_function(module) if module is not None else None
+    if fn is None:
+        record['error'] = 'no solve_grid(), p() or solve()'
+        return record
+    start = time.perf_counter()
+    try:
+        for split, i, inp, want in iter_examples(solver_path.stem, splits):
+            try:
+                got = fn(inp.astype(np.int64))  # solvers expect what np.array(list) gives
+            except Exception as e:
+                record.update(failure=f'{split}[{i}]', error=f'{type(e).__name__}: {e}')
+                return record
+            record['checked'] += 1
+            if not grids_equal(got, want):
+                record['failure'] = f'{split}[{i}]'
+                return record
+        record['passed'] = record['checked'] > 0
+        if not record['checked']:
+            record['error'] = 'task JSON not found'
+        return record
+    finally:
+        record['ms'] = round((time.perf_counter() - start) * 1000, 3)
+
+
+def _stream_worker(args: tuple) -> dict:
+    return stream_verify(*args)
+
+
+def stream_all(solvers: List[Path], splits: Sequence[str] = SPLITS, jobs: int = 1) -> List[dict]:
+    """Stream-verify many solvers, one task per job across processes."""
+    work = [(s, tuple(splits)) for s in solvers]
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            records = list(pool.map(_stream_worker, work, chunksize=4))
+    else:
+        records = [_stream_worker(w) for w in work]
+    return sorted(records, key=lambda r: r['task'])
+
+
+def summarize(records: List[dict]) -> Dict[str, dict]:
+    """Aggregate exact-match counts per split across tasks."""
+    summary: Dict[str, dict] = {}
+    for rec in records:
+        for split, s in rec['splits'].items():
+            agg = summary.setdefault(split, {'correct': 0, 'total': 0})
+            agg['correct'] += s['correct']
+            agg['total'] += s['total']
+    for agg in summary.values():
+        agg['rate'] = agg['correct'] / agg['total'] if agg['total'] else 0.0
+    return summary
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description='Score ARC solver outputs against expected outputs')
+    p.add_argument('solver', nargs='?', help='Score a single solver file')
+    p.add_argument('--dir', default=str(Path(__file__).parent / 'generated_solver'), help='Directory with solver scripts')
+    p.add_argument('--pattern', default='task*.py', help='Glob pattern for solvers in --dir')
+    p.add_argument('--max', type=int, default=None, help='Limit number of solvers to score')
+    p.add_argument('--fast', action='store_true', help='Stop each task at its first mismatch (pass/fail only)')
+    p.add_argument('--jobs', type=int, default=1, help='Worker processes')
+    p.add_argument('--quiet', action='store_true', help='Only print the summary')
+    p.add_argument('--stream', action='store_true', help='Stress mode: feed examples one at a time to solve_grid()/p() and stop at the first mismatch')
+    p.add_argument('--splits', nargs='+', default=list(SPLITS), help='Splits checked by --stream, in order')
+    p.add_argument('--grid-cache', nargs='?', const=DEFAULT_CACHE_DIR, default=None, metavar='DIR', help='Memoize solve_grid results per (solver source, grid) in DIR')
+    args = p.parse_args(argv)
+
+    solvers = [Path(args.solver)] if args.solver else sorted(Path(args.dir).glob(args.pattern))
+    if args.max:
+        solvers = solvers[:args.max]
+    if not solvers:
+        print('No solver scripts found to score')
+        return 2
+    if args.stream:
+        start = time.perf_counter()
+        records = stream_all(solvers, splits=args.splits, jobs=args.jobs)
+        for rec in records:
+            if args.quiet and rec['passed']:
+                continue
+            line = f"{rec['task']:<10} {'PASS' if rec['passed'] else 'FAIL'}  {rec['checked']:4d} checked  {rec['ms']:9.1f} ms"
+            if rec['failure']:
+                line += f"  first failure {rec['failure']}"
+            if rec['error']:
+                line += f"  ({rec['error']})"
+            print(line)
+        passed = sum(1 for r in records if r['passed'])
+        print(f'{passed}/{len(records)} solvers sound on {", ".join(args.splits)}; {time.perf_counter() - start:.2f} s')
+        return 0 if passed == len(records) else 1
+    records = score_all(solvers, fast=args.fast, jobs=args.jobs, cache_dir=args.grid_cache)
+    if not args.quiet:
+        for rec in records:
+            parts = ' '.join(f"{k}={v['correct']}/{v['total']}" for k, v in rec['splits'].items())
+            status = 'PASS' if rec['passed'] else 'FAIL'
+            line = f"{rec['task']:<10} {status}  {parts}"
+            if rec.get('error'):
+                line += f"  ({rec['error']})"
+            print(line)
+    for split, agg in summarize(records).items():
+        print(f"{split:<8} {agg['correct']}/{agg['total']} examples exact ({agg['rate']:.1%})")
+    passed = sum(1 for r in records if r['passed'])
+    print(f'{passed}/{len(records)} tasks fully solved')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
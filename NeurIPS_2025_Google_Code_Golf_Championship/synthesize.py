@@ -0,0 +1,492 @@
+#!/usr/bin/env python3
+"""
+Bottom-up enumerative program synthesis for ARC tasks.
+
+A program is a chain of unary grid primitives (rotations, flips, crops,
+object crops, tilings, flood fills, ...) optionally followed by a colour
+lookup table that is fitted to the train pairs. Programs are enumerated by depth; after every
+step the outputs on all train inputs are hashed and a program whose outputs
+were already produced by a shorter one is dropped (observational
+equivalence), which keeps the frontier small.
+
+A program consistent with every train pair (and, by default, the test and
+arc-gen examples as well) is emitted as a standalone `solve_grid` solver in
+`generated_solver/taskNNN.py`. Only placeholders that are still untouched
+according to the generator manifest are replaced, and replaced files are
+marked `origin: synthesized` so `generate_all_solvers.py` leaves them alone.
+
+Usage examples (from repo root):
+  # Search every task with a 10 s budget each on 8 processes, write solvers
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/synthesize.py --jobs 8 --budget 10
+
+  # Only report what would be found for a few tasks
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/synthesize.py task001 task002 --dry-run
+"""
+from __future__ import annotations
+import argparse
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+import grid_ops
+from objects import extract_objects
+from task_loader import SPLITS, find_data_dir, load_task_arrays
+
+MAX_SIDE = 30
+
+
+class Primitive(NamedTuple):
+    name: str
+    fn: Callable[[np.ndarray], np.ndarray]
+    # Python expression over the variable `x`, used when emitting the solver.
+    code: str
+    # Name of a helper in HELPERS the emitted code depends on, if any.
+    helper: Optional[str] = None
+
+
+HELPERS = {
+    '_fill_enclosed': '''def _fill_enclosed(g: np.ndarray, fill: int) -> np.ndarray:
+    """Recolour 0-cells that cannot reach the border through 0-cells."""
+    free = g == 0
+    reach = np.zeros_like(free)
+    reach[[0, -1], :] = free[[0, -1], :]
+    reach[:, [0, -1]] = free[:, [0, -1]]
+    while True:
+        grown = reach.copy()
+        grown[1:] |= reach[:-1]
+        grown[:-1] |= reach[1:]
+        grown[:, 1:] |= reach[:, :-1]
+        grown[:, :-1] |= reach[:, 1:]
+        grown &= free
+        if (grown == reach).all():
+            break
+        reach = grown
+    out = g.copy()
+    out[free & ~reach] = fill
+    return out
+''',
+    '_crop': '''def _crop(g: np.ndarray) -> np.ndarray:
+    """Crop to the bounding box of the non-zero cells."""
+    rows = np.flatnonzero(g.any(axis=1))
+    cols = np.flatnonzero(g.any(axis=0))
+    if rows.size == 0:
+        return g
+    return g[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
+''',
+    '_object_crop': '''def _object_crop(g: np.ndarray, largest: bool) -> np.ndarray:
+    """Crop to the largest (or smallest) 8-connected same-colour non-zero object."""
+    h, w = g.shape
+    g = g.astype(int)
+    fg = g != 0
+    lab = np.where(fg, np.arange(h * w).reshape(h, w), h * w)
+    gp = np.pad(g, 1, constant_values=-1)
+    while True:
+        lp = np.pad(lab, 1, constant_values=h * w)
+        new = lab.copy()
+        for dr in range(3):
+            for dc in range(3):
+                same = fg & (gp[dr:dr + h, dc:dc + w] == g)
+                new = np.where(same, np.minimum(new, lp[dr:dr + h, dc:dc + w]), new)
+        if (new == lab).all():
+            break
+        lab = new
+    ids, counts = np.unique(lab[fg], return_counts=True)
+    if ids.size == 0:
+        return g
+    rows, cols = np.nonzero(lab == ids[np.argmax(counts) if largest else np.argmin(counts)])
+    return g[rows.min():rows.max() + 1, cols.min():cols.max() + 1]
+''',
+}
+
+
+def _object_crop(g: np.ndarray, largest: bool) -> np.ndarray:
+    objs = extract_objects(g, connectivity=8, background=0)
+    if not len(objs):
+        return g
+    return objs.crop(g, objs.largest() if largest else objs.smallest())
+
+
+def _primitives() -> List[Primitive]:
+    prims = [
+        Primitive('rot90', lambda g: np.rot90(g, 1), 'np.rot90(x, 1)'),
+        Primitive('rot180', lambda g: np.rot90(g, 2), 'np.rot90(x, 2)'),
+        Primitive('rot270', lambda g: np.rot90(g, 3), 'np.rot90(x, 3)'),
+        Primitive('flip_lr', np.fliplr, 'x[:, ::-1]'),
+        Primitive('flip_ud', np.flipud, 'x[::-1]'),
+        Primitive('transpose', lambda g: g.T, 'x.T'),
+        Primitive('crop', lambda g: grid_ops.crop(g) if g.any() else g, '_crop(x)', '_crop'),
+        Primitive('largest_object', lambda g: _object_crop(g, True), '_object_crop(x, True)', '_object_crop'),
+        Primitive('smallest_object', lambda g: _object_crop(g, False), '_object_crop(x, False)', '_object_crop'),
+        Primitive('kron_tile', grid_ops.kron_tile, 'np.kron(x != 0, x)'),
+        Primitive('mirror_lr', lambda g: np.hstack([g, g[:, ::-1]]), 'np.hstack([x, x[:, ::-1]])'),
+        Primitive('mirror_ud', lambda g: np.vstack([g, g[::-1]]), 'np.vstack([x, x[::-1]])'),
+        Primitive('top_half', lambda g: g[:g.shape[0] // 2], 'x[:len(x) // 2]'),
+        Primitive('bottom_half', lambda g: g[(g.shape[0] + 1) // 2:], 'x[(len(x) + 1) // 2:]'),
+        Primitive('left_half', lambda g: g[:, :g.shape[1] // 2], 'x[:, :x.shape[1] // 2]'),
+        Primitive('right_half', lambda g: g[:, (g.shape[1] + 1) // 2:], 'x[:, (x.shape[1] + 1) // 2:]'),
+    ]
+    for k in (2, 3):
+        prims.append(Primitive(f'upscale{k}', lambda g, k=k: np.repeat(np.repeat(g, k, 0), k, 1), f'x.repeat({k}, 0).repeat({k}, 1)'))
+    for reps in ((1, 2), (2, 1), (2, 2), (3, 3)):
+        prims.append(Primitive(f'tile{reps[0]}x{reps[1]}', lambda g, r=reps: np.tile(g, r), f'np.tile(x, {reps})'))
+    for c in range(1, 10):
+        prims.append(Primitive(f'fill_enclosed{c}', lambda g, c=c: grid_ops.fill_enclosed(g, 0, c), f'_fill_enclosed(x, {c})', '_fill_enclosed'))
+    return prims
+
+
+PRIMITIVES = _primitives()
+
+
+def outputs_key(outputs: Sequence[np.ndarray]) -> bytes:
+    """Hash of a program's outputs on all train inputs (shape and cells)."""
+    h = hashlib.blake2b(digest_size=16)
+    for o in outputs:
+        h.update(np.asarray(o.shape, dtype=np.int32).tobytes())
+        h.update(np.ascontiguousarray(o, dtype=np.uint8).tobytes())
+    return h.digest()
+
+
+def fit_color_table(outputs: Sequence[np.ndarray], targets: Sequence[np.ndarray]) -> Optional[np.ndarray]:
+    """Return a 10-entry table mapping `outputs` onto `targets` cell-wise, or None."""
+    if any(o.shape != t.shape for o, t in zip(outputs, targets)):
+        return None
+    src = np.concatenate([o.ravel() for o in outputs]).astype(np.int64)
+    dst = np.concatenate([t.ravel() for t in targets]).astype(np.int64)
+    if src.max() > 9 or dst.max() > 9:
+        return None
+    pairs = np.unique(src * 16 + dst)
+    if len(np.unique(pairs // 16)) != len(pairs):
+        return None  # some colour would need to map to two colours
+    table = np.arange(10)
+    table[pairs // 16] = pairs % 16
+    return table
+
+
+def _apply(prim: Primitive, grids: Sequence[np.ndarray]) -> Optional[List[np.ndarray]]:
+    out = []
+    for g in grids:
+        try:
+            r = np.ascontiguousarray(prim.fn(g))
+        except Exception:
+            return None
+        if r.ndim != 2 or r.size == 0 or max(r.shape) > MAX_SIDE:
+            return None
+        out.append(r)
+    return out
+
+
+def _matches(outputs: Sequence[np.ndarray], targets: Sequence[np.ndarray]) -> bool:
+    return all(o.shape == t.shape and np.array_equal(o, t) for o, t in zip(outputs, targets))
+
+
+def _d4_completion(program: List[str], outputs: Sequence[np.ndarray], targets: Sequence[np.ndarray]) -> Optional[Tuple[List[str], Optional[np.ndarray]]]:
+    """Finish a program with one D4 primitive (and a colour table if needed)."""
+    recoloured = None
+    for prim in PRIMITIVES:
+        if prim.name not in grid_ops.D4:
+            continue
+        out = _apply(prim, outputs)
+        if out is None:
+            continue
+        if _matches(out, targets):
+            return program + [prim.name], None
+        if recoloured is None:
+            table = fit_color_table(out, targets)
+            if table is not None:
+                recoloured = (program + [prim.name], table)
+    return recoloured
+
+
+def search(inputs: Sequence[np.ndarray], targets: Sequence[np.ndarray], max_depth: int = 3, budget: float = 10.0) -> Optional[Tuple[List[str], Optional[np.ndarray]]]:
+    """Find the shortest primitive chain (plus optional colour table) mapping inputs to targets.
+
+    Returns `(primitive_names, table_or_None)` or None when nothing is found
+    within `max_depth` steps and `budget` seconds.
+
+    Candidates whose outputs equal the targets up to rotation/flip and colour
+    permutation (same `grid_ops.canonical_hash`) are completed with one D4
+    step right away instead of waiting for the next depth to be enumerated.
+    """
+    deadline = time.monotonic() + budget
+    start = [np.ascontiguousarray(g) for g in inputs]
+    table = fit_color_table(start, targets)
+    if _matches(start, targets):
+        return [], None
+    if table is not None:
+        return [], table
+    seen = {outputs_key(start)}
+    target_invariants = [grid_ops.color_invariant(t) for t in targets]
+    target_forms = None
+    frontier: List[Tuple[List[str], List[np.ndarray]]] = [([], start)]
+    fallback = None
+    for _ in range(max_depth):
+        next_frontier = []
+        # an exact match at this depth beats one that needs a colour table,
+        # which beats a D4 completion (one step longer); a completion that
+        # still needs a table is held back as `fallback` until the next depth,
+        # whose exact programs have the same length
+        recoloured = None
+        completed = None
+        for names, grids in frontier:
+            for prim in PRIMITIVES:
+                if time.monotonic() > deadline:
+                    return recoloured or fallback or completed
+                out = _apply(prim, grids)
+                if out is None:
+                    continue
+                key = outputs_key(out)
+                if key in seen:
+                    continue
+                seen.add(key)
+                program = names + [prim.name]
+                if _matches(out, targets):
+                    return program, None
+                if recoloured is None:
+                    table = fit_color_table(out, targets)
+                    if table is not None:
+                        recoloured = (program, table)
+                if completed is None and len(program) < max_depth and \
+                        all(grid_ops.color_invariant(o) == t for o, t in zip(out, target_invariants)):
+                    if target_forms is None:
+                        target_forms = [grid_ops.canonical_hash(t, background=None) for t in targets]
+                    if all(grid_ops.canonical_hash(o, background=None) == t for o, t in zip(out, target_forms)):
+                        completed = _d4_completion(program, out, targets)
+                next_frontier.append((program, out))
+        if recoloured is not None:
+            return recoloured
+        if fallback is not None:
+            return fallback
+        if completed is not None and completed[1] is None:
+            return completed
+        fallback = completed
+        frontier = next_frontier
+    return fallback
+
+
+def run_program(names: Sequence[str], table: Optional[np.ndarray], grid: np.ndarray) -> np.ndarray:
+    by_name = {p.name: p for p in PRIMITIVES}
+    x = grid
+    for n in names:
+        x = by_name[n].fn(x)
+    if table is not None:
+        x = table[x]
+    return x
+
+
+def emit_solve_grid(names: Sequence[str], table: Optional[np.ndarray]) -> str:
+    """Source of the helpers and a `solve_grid` function implementing the program."""
+    by_name = {p.name: p for p in PRIMITIVES}
+    helpers = []
+    for n in names:
+        h = by_name[n].helper
+        if h and HELPERS[h] not in helpers:
+            helpers.append(HELPERS[h])
+    steps = ' -> '.join(names) or 'identity'
+    if table is not None:
+        steps += ' -> recolour'
+    lines = [
+        'def solve_grid(input_grid: np.ndarray) -> np.ndarray:',
+        f'    """Synthesized program: {steps}."""',
+        '    x = input_grid',
+    ]
+    lines += [f'    x = {by_name[n].code}' for n in names]
+    if table is not None:
+        lines.append(f'    x = np.array({table.tolist()})[x]')
+    lines.append('    return x')
+    return '\n\n\n'.join(helpers + ['\n'.join(lines) + '\n'])
+
+
+SOLVER_TEMPLATE = '''#!/usr/bin/env python3
+"""
+Synthesized solver for `data/{json_name}`.
+
+Program: {steps}
+"""
+from __future__ import annotations
+import json
+import sys
+from pathlib import Path
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+
+TASK_NAME = "{json_name}"
+
+
+def find_task_file() -> Optional[Path]:
+    """Looks for the task file in common data locations."""
+    script_dir = Path(__file__).parent
+    candidates = [
+        script_dir.parent.parent / "data" / TASK_NAME,
+        script_dir.parent / "data" / TASK_NAME,
+        Path.cwd() / "data" / TASK_NAME,
+        script_dir / TASK_NAME,
+        Path(TASK_NAME),
+    ]
+    for p in candidates:
+        if p.exists():
+            return p
+    return None
+
+
+{solve_grid}
+
+def solve_batch(inputs: Sequence[Any]) -> List[np.ndarray]:
+    """Solves many input grids; the outputs stay NumPy arrays."""
+    return [solve_grid(np.asarray(grid)) for grid in inputs]
+
+
+def solve(task_obj: Any) -> Any:
+    """Solves all examples in a task file."""
+    if not isinstance(task_obj, dict) or ('train' not in task_obj and 'test' not in task_obj):
+        return {{"error": "Input is not a valid task object"}}
+
+    solution_obj = {{}}
+    for key in ['train', 'test', 'arc-gen']:
+        if key in task_obj:
+            examples = task_obj[key]
+            outputs = solve_batch([np.array(example['input']) for example in examples])
+            # Lists only here, for the JSON printed by main().
+            solution_obj[key] = [{{'input': example['input'], 'output': output.tolist()}}
+                                 for example, output in zip(examples, outputs)]
+    return solution_obj
+
+
+def main() -> None:
+    p = find_task_file()
+    if not p:
+        print(json.dumps({{"task": TASK_NAME, "error": "file not found"}}, ensure_ascii=False))
+        sys.exit(2)
+
+    obj = json.loads(p.read_text(encoding="utf-8"))
+    solution = solve(obj)
+    print(json.dumps({{"task": p.name, "solution": solution}}, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
+'''
+
+
+def render_solver(json_name: str, names: Sequence[str], table: Optional[np.ndarray]) -> str:
+    steps = ' -> '.join(names) or 'identity'
+    if table is not None:
+        steps += ' -> recolour'
+    return SOLVER_TEMPLATE.format(json_name=json_name, steps=steps, solve_grid=emit_solve_grid(names, table))
+
+
+def synthesize_task(name: str, max_depth: int = 3, budget: float = 10.0, train_only: bool = False) -> dict:
+    """Search a program for one task and verify it on the other splits."""
+    record = {'task': name, 'program': None, 'table': None, 'verified': False, 'elapsed': 0.0, 'source': None}
+    arrays = load_task_arrays(name)
+    if not arrays or not arrays.get('train'):
+        record['error'] = 'task not found'
+        return record
+    start = time.perf_counter()
+    inputs = [i for i, _ in arrays['train']]
+    targets = [o for _, o in arrays['train']]
+    found = search(inputs, targets, max_depth=max_depth, budget=budget)
+    record['elapsed'] = time.perf_counter() - start
+    if found is None:
+        return record
+    names, table = found
+    record['program'] = names
+    record['table'] = table.tolist() if table is not None else None
+    verified = True
+    if not train_only:
+        for split in SPLITS[1:]:
+            for inp, out in arrays.get(split, []):
+                try:
+                    got = run_program(names, table, inp)
+                except Exception:
+                    got = None
+                if got is None or got.shape != out.shape or not np.array_equal(got, out):
+                    verified = False
+                    break
+            if not verified:
+                break
+    record['verified'] = verified
+    if verified:
+        record['source'] = render_solver(f'{name}.json', names, table)
+    return record
+
+
+def _synth_worker(args: tuple) -> dict:
+    return synthesize_task(*args)
+
+
+def write_solvers(records: Sequence[dict], out_dir: Path) -> List[str]:
+    """Write verified programs over untouched placeholders; returns the written names."""
+    import generate_all_solvers as gen
+
+    manifest = gen.load_manifest(out_dir)
+    written = []
+    for rec in records:
+        if not rec.get('source'):
+            continue
+        py_name = f"{rec['task']}.py"
+        json_name = f"{rec['task']}.json"
+        path = out_dir / py_name
+        entry = manifest.get(py_name)
+        if path.exists():
+            current = path.read_text(encoding='utf-8')
+            if not gen.is_untouched(current, json_name, entry):
+                print(f"Not overwriting hand-edited {py_name}")
+                continue
+            if current == rec['source']:
+                continue
+        path.write_text(rec['source'], encoding='utf-8')
+        os.chmod(path, 0o644)
+        manifest[py_name] = {'origin': 'synthesized', 'template_hash': None, 'source_hash': gen.sha256(rec['source'])}
+        written.append(py_name)
+    gen.save_manifest(out_dir, manifest)
+    return written
+
+
+def main(argv=None) -> None:
+    p = argparse.ArgumentParser(description='Enumerative program synthesis over grid primitives')
+    p.add_argument('tasks', nargs='*', help='Task names (default: every task in the data directory)')
+    p.add_argument('--out-dir', default=str(Path(__file__).parent / 'generated_solver'), help='Directory for solver files')
+    p.add_argument('--depth', type=int, default=3, help='Maximum number of chained primitives')
+    p.add_argument('--budget', type=float, default=10.0, help='Search time budget per task in seconds')
+    p.add_argument('--jobs', type=int, default=1, help='Worker processes')
+    p.add_argument('--train-only', action='store_true', help='Accept programs that fit train pairs without checking test/arc-gen')
+    p.add_argument('--dry-run', action='store_true', help="Report programs without writing solver files")
+    args = p.parse_args(argv)
+
+    names = args.tasks
+    if not names:
+        data_dir = find_data_dir()
+        if data_dir is None:
+            print('data directory not found')
+            return
+        names = [j.stem for j in sorted(data_dir.glob('task*.json'))]
+    work = [(n, args.depth, args.budget, args.train_only) for n in names]
+    if args.jobs > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            records = list(pool.map(_synth_worker, work))
+    else:
+        records = [_synth_worker(w) for w in work]
+
+    for rec in records:
+        if rec['program'] is None:
+            continue
+        steps = ' -> '.join(rec['program']) or 'identity'
+        if rec['table'] is not None:
+            steps += ' -> recolour'
+        status = 'verified' if rec['verified'] else 'train-only fit, fails other splits'
+        print(f"{rec['task']}: {steps} ({status}, {rec['elapsed']:.2f} s)")
+    found = sum(1 for r in records if r['verified'])
+    print(f'Found verified programs for {found}/{len(records)} tasks')
+    if not args.dry_run:
+        written = write_solvers(records, Path(args.out_dir))
+        print(f'Wrote {len(written)} solver file(s) to {args.out_dir}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Columnar feature index over all ARC tasks in `data/`.
+
+One parallel pass computes, for every task, fingerprints of its train pairs:
+  - input/output shape ratios and whether shapes are preserved,
+  - colour histograms of inputs and outputs (10 counts each),
+  - whether every output is a tiling, a crop or a recolouring of its input,
+  - D4 symmetry flags shared by all outputs,
+  - mean number of objects (8-connected non-zero components) in the inputs.
+
+The columns are stored as plain NumPy arrays in one `.npz` file (and as a
+parquet table when `pyarrow` is installed and `--parquet` is given), so
+solver search and triage can filter 400 tasks in milliseconds instead of
+re-parsing the JSON files.
+
+Usage examples (from repo root):
+  # Build (or refresh) the index using 8 processes
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/task_index.py build --jobs 8
+
+  # Tasks whose outputs are recolourings of same-shaped inputs
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/task_index.py query --where same_shape is_recolor
+"""
+from __future__ import annotations
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+import grid_ops
+from task_loader import CACHE_DIR_NAME, find_data_dir, load_task_arrays
+
+INDEX_NAME = 'task_index.npz'
+BOOL_COLUMNS = ('same_shape', 'is_tiling', 'is_crop', 'is_recolor',
+                'sym_flip_lr', 'sym_flip_ud', 'sym_transpose', 'sym_rot90', 'sym_rot180')
+
+
+def is_tiling(inp: np.ndarray, out: np.ndarray) -> bool:
+    (h, w), (oh, ow) = inp.shape, out.shape
+    if oh % h or ow % w or (oh, ow) == (h, w):
+        return False
+    return bool(np.array_equal(np.tile(inp, (oh // h, ow // w)), out))
+
+
+def is_crop(inp: np.ndarray, out: np.ndarray) -> bool:
+    """True if `out` appears as a contiguous sub-grid of a larger `inp`."""
+    if out.shape[0] > inp.shape[0] or out.shape[1] > inp.shape[1] or out.shape == inp.shape:
+        return False
+    windows = sliding_window_view(inp, out.shape)
+    return bool((windows == out).all(axis=(2, 3)).any())
+
+
+def is_recolor(inp: np.ndarray, out: np.ndarray) -> bool:
+    """Same shape and a consistent, non-identity cell-wise colour mapping."""
+    if inp.shape != out.shape or np.array_equal(inp, out):
+        return False
+    pairs = np.unique(inp.astype(np.int64) * 256 + out)
+    return len(np.unique(pairs // 256)) == len(pairs)
+
+
+def task_features(name: str) -> Optional[Dict[str, object]]:
+    """Fingerprint the train pairs of one task, or None if it cannot be loaded."""
+    try:
+        arrays = load_task_arrays(name)
+    except ValueError as e:  # malformed JSON; skip the task rather than the whole build
+        print(f'Skipping {name}: {e}')
+        return None
+    if not arrays or not arrays.get('train'):
+        return None
+    pairs = arrays['train']
+    ins = [i for i, _ in pairs]
+    outs = [o for _, o in pairs]
+    feats: Dict[str, object] = {
+        'task': name,
+        'n_train': len(pairs),
+        'n_arcgen': len(arrays.get('arc-gen', [])),
+        'h_ratio': float(np.mean([o.shape[0] / i.shape[0] for i, o in pairs])),
+        'w_ratio': float(np.mean([o.shape[1] / i.shape[1] for i, o in pairs])),
+        'max_side': int(max(max(g.shape) for g in ins + outs)),
+        'in_hist': np.sum([grid_ops.histogram(i) for i in ins], axis=0),
+        'out_hist': np.sum([grid_ops.histogram(o) for o in outs], axis=0),
+        'same_shape': all(i.shape == o.shape for i, o in pairs),
+        'is_tiling': all(is_tiling(i, o) for i, o in pairs),
+        'is_crop': all(is_crop(i, o) for i, o in pairs),
+        'is_recolor': all(is_recolor(i, o) for i, o in pairs),
+        'objects_in': float(np.mean([grid_ops.label_components(i, 8, background=0)[1] for i in ins])),
+    }
+    for sym in ('flip_lr', 'flip_ud', 'transpose', 'rot90', 'rot180'):
+        feats[f'sym_{sym}'] = all(grid_ops.is_symmetric(o, sym) for o in outs)
+    return feats
+
+
+def build_index(names: Sequence[str], jobs: int = 1) -> Dict[str, np.ndarray]:
+    """Compute features for `names` (in parallel) and return them as columns."""
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            rows = list(pool.map(task_features, names, chunksize=8))
+    else:
+        rows = [task_features(n) for n in names]
+    rows = [r for r in rows if r is not None]
+    if not rows:
+        return {}
+    columns: Dict[str, np.ndarray] = {}
+    for key in rows[0]:
+        values = [r[key] for r in rows]
+        if key == 'task':
+            columns[key] = np.array(values, dtype='U16')
+        elif key in BOOL_COLUMNS:
+            columns[key] = np.array(values, dtype=bool)
+        elif key.endswith('_hist'):
+            columns[key] = np.stack(values).astype(np.int32)
+        else:
+            columns[key] = np.array(values)
+    return columns
+
+
+def default_index_path() -> Optional[Path]:
+    data_dir = find_data_dir()
+    return data_dir / CACHE_DIR_NAME / INDEX_NAME if data_dir else None
+
+
+def save_index(columns: Dict[str, np.ndarray], path: Path, parquet: bool = False) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(path, built_at=np.float64(time.time()), **columns)
+    if parquet:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            print('pyarrow is not installed; skipping the parquet copy')
+            return
+        table = pa.table({k: (list(v) if v.ndim > 1 else v) for k, v in columns.items()})
+        pq.write_table(table, path.with_suffix('.parquet'))
+
+
+def load_index(path: Optional[Path] = None, rebuild_stale: bool = True, jobs: int = 1) -> Dict[str, np.ndarray]:
+    """Load the index, rebuilding it first if any task JSON is newer than it."""
+    path = path or default_index_path()
+    if path is None:
+        return {}
+    data_dir = find_data_dir()
+    stale = not path.exists()
+    if not stale and rebuild_stale and data_dir is not None:
+        built = path.stat().st_mtime
+        stale = any(j.stat().st_mtime > built for j in data_dir.glob('task*.json'))
+    if stale and data_dir is not None:
+        columns = build_index([j.stem for j in sorted(data_dir.glob('task*.json'))], jobs=jobs)
+        save_index(columns, path)
+        return columns
+    with np.load(path) as npz:
+        return {k: npz[k] for k in npz.files if k != 'built_at'}
+
+
+def select(index: Dict[str, np.ndarray], where: Sequence[str] = (), **equals) -> List[str]:
+    """Names of tasks where every boolean column in `where` is true and each
+    `column=value` in `equals` matches exactly."""
+    if not index:
+        return []
+    mask = np.ones(len(index['task']), dtype=bool)
+    for col in where:
+        mask &= index[col].astype(bool)
+    for col, value in equals.items():
+        mask &= index[col] == value
+    return index['task'][mask].tolist()
+
+
+def main(argv=None) -> None:
+    p = argparse.ArgumentParser(description='Build or query the ARC task feature index')
+    sub = p.add_subparsers(dest='cmd', required=True)
+    b = sub.add_parser('build', help='Rebuild the index from data/')
+    b.add_argument('--jobs', type=int, default=1, help='Worker processes')
+    b.add_argument('--out', default=None, help='Index path (default: data/.npz_cache/task_index.npz)')
+    b.add_argument('--parquet', action='store_true', help='Also write a parquet copy (needs pyarrow)')
+    q = sub.add_parser('query', help='List tasks matching boolean feature columns')
+    q.add_argument('--where', nargs='*', default=[], help=f"Boolean columns that must hold: {', '.join(BOOL_COLUMNS)}")
+    q.add_argument('--index', default=None, help='Index path')
+    args = p.parse_args(argv)
+
+    if args.cmd == 'build':
+        data_dir = find_data_dir()
+        if data_dir is None:
+            print('data directory not found')
+            return
+        start = time.perf_counter()
+        columns = build_index([j.stem for j in sorted(data_dir.glob('task*.json'))], jobs=args.jobs)
+        path = Path(args.out) if args.out else default_index_path()
+        save_index(columns, path, parquet=args.parquet)
+        n = len(columns.get('task', []))
+        print(f'Indexed {n} tasks in {time.perf_counter() - start:.2f} s -> {path}')
+        return
+
+    unknown = [c for c in args.where if c not in BOOL_COLUMNS]
+    if unknown:
+        print(f"Unknown column(s): {', '.join(unknown)}")
+        return
+    start = time.perf_counter()
+    index = load_index(Path(args.index) if args.index else None)
+    names = select(index, args.where)
+    elapsed = (time.perf_counter() - start) * 1000
+    if names:
+        print('\n'.join(names))
+    print(f'{len(names)} task(s) matched in {elapsed:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
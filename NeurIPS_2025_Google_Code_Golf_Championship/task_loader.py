@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Shared loader for ARC task files (`data/taskNNN.json`).
+
+The `data/` directory is resolved once per process and each task is parsed at
+most once. The grids of every task are also cached on disk as a compact
+uint8 `.npz` file (one flat buffer plus a shape table per split), keyed by the
+JSON file's mtime, so repeated sweeps can skip JSON decoding entirely.
+
+Typical use:
+  from task_loader import load_task, load_task_arrays, load_task_packed
+
+  task = load_task("task042")            # dict in ARC format (nested lists)
+  arrays = load_task_arrays("task042")   # {'train': [(in, out), ...], ...}
+  packed = load_task_packed("task042")   # {'train': (PackedSplit, PackedSplit), ...}
+
+Set `ARC_DATA_DIR` to point at a data directory outside the usual locations.
+"""
+from __future__ import annotations
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+SPLITS = ('train', 'test', 'arc-gen')
+CACHE_DIR_NAME = '.npz_cache'
+
+_DATA_DIR: Optional[Path] = None
+_TASKS: Dict[str, dict] = {}
+_ARRAYS: Dict[str, Dict[str, List[Tuple[np.ndarray, np.ndarray]]]] = {}
+_PACKED: Dict[str, Dict[str, Tuple['PackedSplit', 'PackedSplit']]] = {}
+
+
+class PackedSplit:
+    """Every grid of one side of a split in one flat uint8 buffer.
+
+    `data` holds the cells of all grids back to back, `shapes` is an (n, 2)
+    int32 table and `offsets` (n + 1 entries) marks where each grid starts,
+    so `packed[i]` is a zero-copy (h, w) view. Compared with a list of int64
+    arrays this is 8x smaller per cell and a single allocation per split.
+    """
+
+    __slots__ = ('data', 'shapes', 'offsets')
+
+    def __init__(self, data: np.ndarray, shapes: np.ndarray):
+        self.data = data
+        self.shapes = np.asarray(shapes, dtype=np.int32).reshape(-1, 2)
+        self.offsets = np.concatenate([[0], np.cumsum(self.shapes[:, 0].astype(np.int64) * self.shapes[:, 1])])
+
+    @classmethod
+    def from_grids(cls, grids) -> 'PackedSplit':
+        """Pack 2D grids (arrays or nested lists) with values 0-255."""
+        arrays = [np.asarray(g) for g in grids]
+        for a in arrays:
+            if a.ndim != 2 or (a.size and (a.min() < 0 or a.max() > 255)):
+                raise ValueError(f'not a 0-255 grid: shape {a.shape}')
+        shapes = np.array([a.shape for a in arrays], dtype=np.int32).reshape(-1, 2)
+        data = np.concatenate([a.ravel() for a in arrays]).astype(np.uint8) if arrays else np.zeros(0, dtype=np.uint8)
+        return cls(data, shapes)
+
+    def __len__(self) -> int:
+        return len(self.shapes)
+
+    def __getitem__(self, i: int) -> np.ndarray:
+        if i < 0:
+            i += len(self)
+        return self.data[self.offsets[i]:self.offsets[i + 1]].reshape(self.shapes[i])
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def copy(self) -> 'PackedSplit':
+        """A private copy of the buffer, e.g. before handing views to a solver."""
+        return PackedSplit(self.data.copy(), self.shapes)
+
+    def tolist(self) -> List[list]:
+        return [g.tolist() for g in self]
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes + self.shapes.nbytes + self.offsets.nbytes
+
+
+def find_data_dir() -> Optional[Path]:
+    """Return the ARC `data/` directory, probing the usual locations only once."""
+    global _DATA_DIR
+    if _DATA_DIR is not None:
+        return _DATA_DIR
+    here = Path(__file__).parent
+    candidates = []
+    if os.environ.get('ARC_DATA_DIR'):
+        candidates.append(Path(os.environ['ARC_DATA_DIR']))
+    candidates += [
+        Path.cwd() / 'data',
+        here / 'data',
+        here.parent / 'data',
+    ]
+    for p in candidates:
+        if p.is_dir():
+            _DATA_DIR = p
+            return p
+    return None
+
+
+def set_data_dir(path: Path) -> None:
+    """Override the data directory and drop everything cached in memory."""
+    global _DATA_DIR
+    _DATA_DIR = Path(path)
+    _TASKS.clear()
+    _ARRAYS.clear()
+    _PACKED.clear()
+
+
+def forget_task(name_or_path: Any) -> None:
+    """Drop one task from the in-process memo so the next load re-reads it."""
+    json_path = task_path(name_or_path)
+    if json_path is not None:
+        key = str(json_path.resolve())
+        _TASKS.pop(key, None)
+        _ARRAYS.pop(key, None)
+        _PACKED.pop(key, None)
+
+
+def task_name(name_or_path: Any) -> str:
+    """Normalise `task042`, `task042.json`, `task042.py` or a Path to `task042`."""
+    return Path(str(name_or_path)).stem
+
+
+def task_path(name_or_path: Any) -> Optional[Path]:
+    """Return the JSON path for a task, or None if the data directory is unknown."""
+    data_dir = find_data_dir()
+    if data_dir is None:
+        return None
+    return data_dir / f'{task_name(name_or_path)}.json'
+
+
+def _cache_path(json_path: Path) -> Path:
+    return json_path.parent / CACHE_DIR_NAME / f'{json_path.stem}.npz'
+
+
+def _pack_task(task: dict) -> Optional[Dict[str, np.ndarray]]:
+    """Pack every grid of a task into flat uint8 buffers, or None if not packable."""
+    if not isinstance(task, dict) or any(k not in SPLITS for k in task):
+        return None
+    packed: Dict[str, np.ndarray] = {}
+    for split in SPLITS:
+        examples = task.get(split)
+        if examples is None:
+            continue
+        for side in ('input', 'output'):
+            grids = []
+            for ex in examples:
+                if not isinstance(ex, dict) or side not in ex:
+                    return None
+                g = np.asarray(ex[side])
+                if g.ndim != 2 or g.size == 0 or g.min() < 0 or g.max() > 255:
+                    return None
+                grids.append(g.astype(np.uint8))
+            shapes = np.array([g.shape for g in grids], dtype=np.int32).reshape(-1, 2)
+            data = np.concatenate([g.ravel() for g in grids]) if grids else np.zeros(0, dtype=np.uint8)
+            packed[f'{split}.{side}.data'] = data
+            packed[f'{split}.{side}.shapes'] = shapes
+    return packed
+
+
+def _unpack(npz: Any) -> Dict[str, Tuple[PackedSplit, PackedSplit]]:
+    """Wrap the flat buffers of a packed task as (input, output) PackedSplits."""
+    return {
+        split: tuple(PackedSplit(npz[f'{split}.{side}.data'], npz[f'{split}.{side}.shapes']) for side in ('input', 'output'))
+        for split in SPLITS if f'{split}.input.data' in npz
+    }
+
+
+def _views(packed: Dict[str, Tuple[PackedSplit, PackedSplit]]) -> Dict[str, List[Tuple[np.ndarray, np.ndarray]]]:
+    return {split: list(zip(inputs, outputs)) for split, (inputs, outputs) in packed.items()}
+
+
+def _read_cache(json_path: Path) -> Optional[Dict[str, Tuple[PackedSplit, PackedSplit]]]:
+    cache = _cache_path(json_path)
+    try:
+        if not cache.exists():
+            return None
+        with np.load(cache) as npz:
+            if int(npz['mtime_ns']) != json_path.stat().st_mtime_ns:
+                return None
+            return _unpack(npz)
+    except Exception as e:
+        print(f"Warning: ignoring unreadable cache {cache}: {e}")
+        return None
+
+
+def _write_cache(json_path: Path, task: dict) -> None:
+    cache = _cache_path(json_path)
+    try:
+        packed = _pack_task(task)
+        if packed is None:
+            return
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache.with_suffix('.tmp.npz')
+        np.savez(tmp, mtime_ns=np.int64(json_path.stat().st_mtime_ns), **packed)
+        os.replace(tmp, cache)
+    except Exception as e:
+        print(f"Warning: failed to write cache {cache}: {e}")
+
+
+def _arrays_to_task(arrays: Dict[str, List[Tuple[np.ndarray, np.ndarray]]]) -> dict:
+    return {
+        split: [{'input': inp.tolist(), 'output': out.tolist()} for inp, out in examples]
+        for split, examples in arrays.items()
+    }
+
+
+def load_task(name_or_path: Any) -> Optional[dict]:
+    """Return the parsed ARC task dict (nested int lists), or None if unavailable.
+
+    `name_or_path` may be a task name or a path to a `.json` file. Tasks are
+    memoised in-process; on a fresh process the `.npz` cache is used when it
+    is newer than the JSON file, otherwise the JSON is parsed and cached.
+    """
+    p = Path(str(name_or_path))
+    json_path = p if p.suffix == '.json' and p.exists() else task_path(p)
+    if json_path is None or not json_path.exists():
+        return None
+    key = str(json_path.resolve())
+    if key in _TASKS:
+        return _TASKS[key]
+    packed = _read_cache(json_path)
+    if packed is not None:
+        _PACKED[key] = packed
+        task = _arrays_to_task(_views(packed))
+    else:
+        task = json.loads(json_path.read_text(encoding='utf-8'))
+        _write_cache(json_path, task)
+    _TASKS[key] = task
+    return task
+
+
+def load_task_arrays(name_or_path: Any) -> Optional[Dict[str, List[Tuple[np.ndarray, np.ndarray]]]]:
+    """Return `{split: [(input, output), ...]}` with uint8 grids, or None.
+
+    The arrays are views into the cached buffers; copy them before mutating.
+    """
+    p = Path(str(name_or_path))
+    json_path = p if p.suffix == '.json' and p.exists() else task_path(p)
+    if json_path is None or not json_path.exists():
+        return None
+    key = str(json_path.resolve())
+    if key in _ARRAYS:
+        return _ARRAYS[key]
+    packed = load_task_packed(json_path)
+    if packed is None:
+        return None
+    arrays = _views(packed)
+    _ARRAYS[key] = arrays
+    return arrays
+
+
+def load_task_packed(name_or_path: Any) -> Optional[Dict[str, Tuple[PackedSplit, PackedSplit]]]:
+    """Return `{split: (inputs, outputs)}` as PackedSplits, or None.
+
+    Straight from the `.npz` cache when it is fresh, without building any
+    nested lists; the buffers are shared, so `.copy()` before mutating.
+    """
+    p = Path(str(name_or_path))
+    json_path = p if p.suffix == '.json' and p.exists() else task_path(p)
+    if json_path is None or not json_path.exists():
+        return None
+    key = str(json_path.resolve())
+    if key in _PACKED:
+        return _PACKED[key]
+    packed = _read_cache(json_path)
+    if packed is None:
+        task = load_task(json_path)
+        if key in _PACKED:  # load_task found a fresh cache after all
+            return _PACKED[key]
+        try:
+            flat = _pack_task(task) if task is not None else None
+        except ValueError as e:  # e.g. ragged rows that np.asarray cannot stack
+            print(f"Warning: cannot pack {json_path}: {e}")
+            return None
+        if flat is None:
+            return None
+        packed = _unpack(flat)
+    _PACKED[key] = packed
+    return packed
@@ -0,0 +1,39 @@
+"""A task JSON with ragged rows must be skipped, never raise, on every loader path."""
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import task_loader  # noqa: E402
+from fuzz import InputModel  # noqa: E402
+from task_index import task_features  # noqa: E402
+
+RAGGED = {'train': [{'input': [[1, 2], [3]], 'output': [[1]]}], 'test': []}
+
+
+def _data_dir(tmp_path, monkeypatch, name, task):
+    (tmp_path / f'{name}.json').write_text(json.dumps(task))
+    monkeypatch.setattr(task_loader, '_DATA_DIR', tmp_path)
+    return tmp_path / f'{name}.json'
+
+
+def test_ragged_task_is_unloadable(tmp_path, monkeypatch):
+    path = _data_dir(tmp_path, monkeypatch, 'task901', RAGGED)
+    assert task_loader.load_task(path) == RAGGED
+    assert task_loader.load_task_packed(path) is None
+    assert task_loader.load_task_arrays(path) is None
+    assert not (tmp_path / task_loader.CACHE_DIR_NAME / 'task901.npz').exists()
+
+
+def test_ragged_task_is_skipped_by_consumers(tmp_path, monkeypatch):
+    _data_dir(tmp_path, monkeypatch, 'task902', RAGGED)
+    assert task_features('task902') is None
+    assert InputModel.from_task('task902') is None
+
+
+def test_malformed_json_is_skipped_by_consumers(tmp_path, monkeypatch):
+    (tmp_path / 'task903.json').write_text('{"train": [')
+    monkeypatch.setattr(task_loader, '_DATA_DIR', tmp_path)
+    assert task_features('task903') is None
+    assert InputModel.from_task('task903') is None
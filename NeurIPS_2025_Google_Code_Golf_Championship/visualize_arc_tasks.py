@@ -2,7 +2,6 @@ import os
 import json
 import argparse
 from pathlib import Path
-import matplotlib.pyplot as plt
 import numpy as np
 
 # Color palette for the grid cells, similar to the one in code_golf_utils.
@@ -56,6 +55,9 @@ def visualize_json_data(path_or_dir):
     directory, all .json files in it will be iterated, but each file's plots
     are displayed (and waited on) before moving to the next file.
     """
+    # imported here so the COLORS palette can be used without a GUI stack
+    import matplotlib.pyplot as plt
+
     p = Path(path_or_dir)
 
     if p.is_file():
@@ -137,6 +139,8 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Visualize ARC JSON task files. Pass a file or directory.")
     parser.add_argument("path", nargs="?", default=DATA_DIR, help="Path to a .json file or a directory containing .json files. Defaults to the project's data directory.")
     parser.add_argument("--list", action="store_true", help="List .json files in the given directory (or show the filename if a file) and exit.")
+    parser.add_argument("--headless", metavar="OUT_DIR", help="Write PNG contact sheets to OUT_DIR instead of opening plot windows.")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for --headless rendering.")
     args = parser.parse_args()
 
     target = Path(args.path)
@@ -152,5 +156,8 @@ if __name__ == "__main__":
             print(target.name)
         else:
             print(f"Path '{args.path}' does not exist.")
+    elif args.headless:
+        from render_sheets import main as render_main
+        render_main([args.path, "--out-dir", args.headless, "--jobs", str(args.jobs)])
     else:
         visualize_json_data(args.path)
\ No newline at end of file
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Watch the solver directory and re-verify only the solvers that changed.
+
+The watcher keeps a small persistent results database (a JSON file) with one
+entry per solver: its size, mtime, sha256, the mtime of its task JSON and the
+last verification result (pass/fail, correct/total, runtime, bytes). Every
+`--interval` seconds it stats the solvers:
+  - unchanged size and mtime (and task JSON mtime): nothing to do,
+  - changed stat but identical sha256 (e.g. `touch` or an editor re-save):
+    only the stored stat is refreshed,
+  - changed content, changed task JSON or no entry yet: the solver module is
+    re-imported, run in-process on its task and re-scored.
+So editing one file costs one solver run, not a full sweep, and restarting
+the watcher only re-runs what changed while it was not running.
+
+Usage examples (from repo root):
+  # Watch all solvers and print PASS/FAIL and byte deltas as files change
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/watch.py --dir NeurIPS_2025_Google_Code_Golf_Championship/generated_solver
+
+  # One incremental pass (e.g. from a git hook), also appending to a results log
+  python3 NeurIPS_2025_Google_Code_Golf_Championship/watch.py --once --log output/visualizations/results.jsonl
+"""
+from __future__ import annotations
+import argparse
+import hashlib
+import json
+import os
+import signal
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from result_log import ResultLog
+from run_and_visualize import SolverTimeout, forget_solver_module, run_solver_inprocess
+from scorer import score_solution
+from task_loader import forget_task, load_task, task_path
+
+DEFAULT_DB = 'output/watch_results.json'
+
+
+def _raise_timeout(signum, frame):
+    raise SolverTimeout()
+
+
+def load_db(path: Path) -> dict:
+    try:
+        db = json.loads(path.read_text(encoding='utf-8'))
+        if isinstance(db, dict) and isinstance(db.get('solvers'), dict):
+            return db
+    except (OSError, ValueError):
+        pass
+    return {'solvers': {}}
+
+
+def save_db(path: Path, db: dict) -> None:
+    """Write the database atomically so an interrupted watcher never corrupts it."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(db, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def _task_mtime(solver_path: Path) -> Optional[int]:
+    json_path = task_path(solver_path.stem)
+    return json_path.stat().st_mtime_ns if json_path is not None and json_path.exists() else None
+
+
+def needs_run(solver_path: Path, entry: Optional[dict]) -> Tuple[bool, Optional[str]]:
+    """Decide whether a solver must be re-verified; returns (run?, sha256 if computed).
+
+    Hashing only happens when the cheap stat comparison is inconclusive.
+    """
+    st = solver_path.stat()
+    task_mtime = _task_mtime(solver_path)
+    if entry is None:
+        return True, None
+    if entry.get('task_mtime_ns') != task_mtime:
+        return True, None
+    if entry.get('mtime_ns') == st.st_mtime_ns and entry.get('bytes') == st.st_size:
+        return False, None
+    digest = hashlib.sha256(solver_path.read_bytes()).hexdigest()
+    return digest != entry.get('sha256'), digest
+
+
+def verify(solver_path: Path, timeout: Optional[float] = 30.0) -> Tuple[dict, object]:
+    """Re-import and run one solver on its task; returns (db entry, solution)."""
+    source = solver_path.read_bytes()
+    st = solver_path.stat()
+    entry = {
+        'sha256': hashlib.sha256(source).hexdigest(),
+        'mtime_ns': st.st_mtime_ns,
+        'bytes': len(source),
+        'task_mtime_ns': _task_mtime(solver_path),
+        'checked_at': datetime.utcnow().isoformat() + 'Z',
+        'passed': False,
+        'correct': 0,
+        'total': 0,
+        'ms': None,
+        'error': None,
+    }
+    forget_solver_module(solver_path)
+    forget_task(solver_path.stem)
+    task = load_task(solver_path.stem)
+    if task is None:
+        entry['error'] = 'task JSON not found'
+        return entry, None
+
+    use_alarm = timeout is not None and hasattr(signal, 'SIGALRM')
+    if use_alarm:
+        previous = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    start = time.perf_counter()
+    try:
+        result = run_solver_inprocess(solver_path, task)
+    except SolverTimeout:
+        result = {'solution': {'error': f'exceeded {timeout:g} s'}}
+    finally:
+        entry['ms'] = round((time.perf_counter() - start) * 1000, 3)
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+
+    solution = result.get('solution') if result else {'error': 'solver could not be loaded'}
+    if isinstance(solution, dict) and set(solution) == {'error'}:
+        entry['error'] = str(solution['error'])
+        return entry, solution
+    score = score_solution(solution, task)
+    entry.update(passed=score['passed'], correct=score['correct'], total=score['total'])
+    return entry, solution
+
+
+def describe(name: str, old: Optional[dict], new: dict) -> str:
+    verdict = 'PASS' if new['passed'] else 'FAIL'
+    if old is not None and old.get('passed') != new['passed']:
+        verdict = f"{'PASS' if old.get('passed') else 'FAIL'}->{verdict}"
+    line = f"{name:<10} {verdict:<10} {new['correct']}/{new['total']}  {new['ms'] or 0:8.1f} ms  {new['bytes']:6d} B"
+    if old is not None and old.get('bytes') not in (None, new['bytes']):
+        line += f" ({new['bytes'] - old['bytes']:+d})"
+    if new['error']:
+        line += f"  ({new['error']})"
+    return line
+
+
+def scan(solvers: List[Path], db: dict, timeout: Optional[float] = 30.0, log: Optional[ResultLog] = None) -> List[str]:
+    """One incremental pass: re-verify changed solvers, update `db` in place.
+
+    Returns the names of the solvers that were re-run.
+    """
+    rerun = []
+    entries: Dict[str, dict] = db['solvers']
+    for solver in solvers:
+        old = entries.get(solver.name)
+        try:
+            run, digest = needs_run(solver, old)
+        except FileNotFoundError:
+            continue  # deleted between glob and stat
+        if not run:
+            if digest is not None:
+                # same content, new stat: remember it so it is not hashed again
+                st = solver.stat()
+                old.update(mtime_ns=st.st_mtime_ns, bytes=st.st_size)
+            continue
+        new, solution = verify(solver, timeout=timeout)
+        entries[solver.name] = new
+        rerun.append(solver.name)
+        print(describe(solver.stem, old, new), flush=True)
+        if log is not None and solution is not None:
+            log.log(solver.stem, solver.name, solution, new['ms'] / 1000)
+    for name in set(entries) - {s.name for s in solvers}:
+        del entries[name]
+    return rerun
+
+
+def summary(db: dict) -> str:
+    entries = db['solvers'].values()
+    passing = [e for e in entries if e['passed']]
+    return f"{len(passing)}/{len(entries)} solvers pass; {sum(e['bytes'] for e in passing)} bytes in passing solvers"
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description='Re-verify ARC solvers as they change')
+    p.add_argument('--dir', default=str(Path(__file__).parent / 'generated_solver'), help='Directory with solver scripts')
+    p.add_argument('--pattern', default='task*.py', help='Glob pattern for solvers in --dir')
+    p.add_argument('--db', default=DEFAULT_DB, help='Persistent results database (JSON)')
+    p.add_argument('--interval', type=float, default=0.5, help='Seconds between scans')
+    p.add_argument('--timeout', type=float, default=30.0, help='Per-solver time limit in seconds')
+    p.add_argument('--once', action='store_true', help='Run one incremental pass and exit')
+    p.add_argument('--log', default=None, help='Also append every re-run to this results.jsonl')
+    args = p.parse_args(argv)
+
+    db_path = Path(args.db)
+    db = load_db(db_path)
+    log = ResultLog(Path(args.log)) if args.log else None
+    solver_dir = Path(args.dir)
+    try:
+        while True:
+            start = time.perf_counter()
+            rerun = scan(sorted(solver_dir.glob(args.pattern)), db, timeout=args.timeout, log=log)
+            if rerun:
+                save_db(db_path, db)
+                print(f'Re-verified {len(rerun)} solver(s) in {time.perf_counter() - start:.2f} s; {summary(db)}', flush=True)
+            if args.once:
+                if not rerun:
+                    print(f'No changes; {summary(db)}')
+                save_db(db_path, db)
+                return 0
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        save_db(db_path, db)
+        return 0
+    finally:
+        if log is not None:
+            log.close()
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())